@@ -0,0 +1,68 @@
+"""Contains a random test SNN of which the synapses and neuron properties
+are stored in arrays."""
+import networkx as nx
+import numpy as np
+from snnbackends.networkx.LIF_neuron import LIF_neuron
+from typeguard import typechecked
+
+
+class Random_snn:
+    """Contains the synapses and neuron properties of a random test SNN, as
+    arrays.
+
+    The synapses are stored as an (nr_of_synapses, 2) array of (left,
+    right) neuron indices, with a weight per synapse. The neuron
+    properties are stored with a value per neuron.
+    """
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        *,
+        bias: np.ndarray,
+        du: np.ndarray,
+        dv: np.ndarray,
+        edges: np.ndarray,
+        vth: np.ndarray,
+        weights: np.ndarray,
+    ) -> None:
+        if not len(bias) == len(du) == len(dv) == len(vth):
+            raise ValueError(
+                "Error, expected a bias, du, dv and vth for each neuron."
+            )
+        if len(edges) != len(weights):
+            raise ValueError("Error, expected a weight for each synapse.")
+        self.bias: np.ndarray = bias
+        self.du: np.ndarray = du
+        self.dv: np.ndarray = dv
+        self.edges: np.ndarray = edges
+        self.vth: np.ndarray = vth
+        self.weights: np.ndarray = weights
+
+    @property
+    def nr_of_neurons(self) -> int:
+        """Returns the number of neurons in the SNN."""
+        return len(self.bias)
+
+    @typechecked
+    def to_networkx(self) -> nx.DiGraph:
+        """Returns the SNN as networkx graph, with a weight per edge and an
+        nx_lif neuron per node, like gnp_random_connected_graph."""
+        G = nx.DiGraph()
+        G.add_nodes_from(range(self.nr_of_neurons))
+        G.add_edges_from(
+            (int(left), int(right), {"weight": float(weight)})
+            for (left, right), weight in zip(self.edges, self.weights)
+        )
+        for node in G.nodes:
+            G.nodes[node]["nx_lif"] = [
+                LIF_neuron(
+                    name=node,
+                    bias=self.bias[node],
+                    du=self.du[node],
+                    dv=self.dv[node],
+                    vth=self.vth[node],
+                )
+            ]
+        return G
@@ -1,22 +1,35 @@
 """File used to generate graphs that are used for testing."""
 from __future__ import annotations
 
+import atexit
 import math
+import os
 import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import combinations, groupby
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import networkx as nx
 import numpy as np
 from networkx.classes.digraph import DiGraph
 from numpy import ndarray
 from snnbackends.networkx.LIF_neuron import LIF_neuron
-from snncompare.export_plots.plot_graphs import plot_circular_graph
 from typeguard import typechecked
 
+from snnalgorithms.Random_snn import Random_snn
+
 if TYPE_CHECKING:
     from snncompare.tests.test_scope import Long_scope_of_tests
 
+# Plots the generated graphs in the background, one at a time.
+PLOT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+# The plots that are submitted, but not yet waited for, oldest first.
+plot_futures: list[Future] = []
+PLOT_LOCK = threading.Lock()
+# The maximum number of plots that wait for the background thread.
+MAX_PENDING_PLOTS: int = 16
+
 
 @typechecked
 def get_networkx_graph_of_2_neurons() -> nx.DiGraph:
@@ -46,6 +59,7 @@ def get_networkx_graph_of_2_neurons() -> nx.DiGraph:
     return graph
 
 
+# pylint: disable=R0913
 @typechecked
 def gnp_random_connected_graph(
     *,
@@ -53,60 +67,400 @@ def gnp_random_connected_graph(
     recurrent_density: int | float,
     size: int,
     test_scope: Long_scope_of_tests,
+    skip_sampling: bool = False,
+    seed: Optional[int] = None,
+    plot: bool = True,
 ) -> DiGraph:
     """Generates a random undirected graph, similarly to an Erdős-Rényi graph,
     but enforcing that the resulting graph is connected.
 
+    If skip_sampling is True, the random edges are drawn with geometric
+    skips, such that the time is proportional to the number of edges,
+    instead of the number of node pairs. This yields a different graph than
+    the default sampling, for the same seed.
+
+    The graph is generated with local random number generators, seeded with
+    the seed, or with the seed of the test_scope if no seed is given. So
+    graphs can be generated concurrently.
+
+    If plot is True and the test_scope exports plots, a snapshot of the
+    graph is plotted to file by a background thread, such that this
+    function returns without waiting for the plot. Call wait_for_plots to
+    wait until all plots are created. If the test_scope shows plots, the
+    graph is plotted in the calling thread instead.
+
     :param size: Nr of nodes in the original graph on which test is ran.
     """
-    random.seed(test_scope.seed)
-    edges = combinations(range(size), 2)
+    if seed is None:
+        seed = test_scope.seed
+    rng = random.Random(seed)  # nosec - using a random seed.
     G = nx.DiGraph()
     G.add_nodes_from(range(size))
     if density <= 0:
         return G
     if density >= 1:
         return nx.complete_graph(size, create_using=G)
-    for _, node_edges in groupby(edges, key=lambda x: x[0]):
-        listed_node_edges = list(node_edges)
-
-        random_edge = random.choice(  # nosec - using a random seed.
-            listed_node_edges
-        )
-        G.add_edge(*random_edge)
-        for e in listed_node_edges:
-            if random.random() < density:  # nosec - no security application.
-                G.add_edge(*e)
+    add_random_connected_edges(
+        add_edge=G.add_edge,
+        density=density,
+        rng=rng,
+        size=size,
+        skip_sampling=skip_sampling,
+    )
 
     set_random_edge_weights(
         G=G,
         min_weight=test_scope.min_edge_weight,
         max_weight=test_scope.max_edge_weight,
-        seed=test_scope.seed,
+        seed=seed,
     )
 
     add_random_recurrent_edges(
-        G=G, recurrent_edge_density=recurrent_density, test_scope=test_scope
-    )
-
-    set_rand_neuron_properties(G=G, test_scope=test_scope)
-    plot_circular_graph(
-        density=density,
         G=G,
         recurrent_edge_density=recurrent_density,
+        seed=seed,
         test_scope=test_scope,
     )
+
+    set_rand_neuron_properties(G=G, seed=seed, test_scope=test_scope)
+    if plot and test_scope.show:
+        # Only import the plotting stack if a plot is requested.
+        # pylint: disable=C0415
+        from snncompare.export_plots.plot_graphs import plot_circular_graph
+
+        plot_circular_graph(
+            density=density,
+            G=G,
+            recurrent_edge_density=recurrent_density,
+            test_scope=test_scope,
+        )
+    elif plot and test_scope.export:
+        # Plot a snapshot of the nodes and edges, such that later changes
+        # to the graph, or its neurons, do not affect the plot.
+        snapshot = nx.DiGraph()
+        snapshot.add_nodes_from(G.nodes)
+        snapshot.add_edges_from(G.edges)
+        submit_plot(
+            filepath=f"Images/graphs/graph_{seed}_size{len(G)}_p{density}"
+            + f"_p_recur{recurrent_density}.png",
+            G=snapshot,
+        )
     return G
 
 
+@typechecked
+def submit_plot(*, filepath: str, G: nx.DiGraph) -> None:
+    """Submits a circular plot of a graph to the background thread.
+
+    First raises the error of a finished plot that failed, and waits for
+    the oldest plots if MAX_PENDING_PLOTS plots are pending, such that
+    errors are not lost, and the pending plots do not grow without bound.
+    """
+    with PLOT_LOCK:
+        finished_plots: list[Future] = [
+            plot_future for plot_future in plot_futures if plot_future.done()
+        ]
+        for finished_plot in finished_plots:
+            plot_futures.remove(finished_plot)
+        oldest_plots: list[Future] = plot_futures[
+            : max(len(plot_futures) - MAX_PENDING_PLOTS + 1, 0)
+        ]
+        del plot_futures[: len(oldest_plots)]
+        plot_futures.append(
+            PLOT_EXECUTOR.submit(
+                plot_circular_graph_to_file, filepath=filepath, G=G
+            )
+        )
+    for plot_future in finished_plots + oldest_plots:
+        plot_future.result()
+
+
+@typechecked
+def plot_circular_graph_to_file(*, filepath: str, G: nx.DiGraph) -> None:
+    """Plots a circular plot of a graph, with the node names as labels, to
+    an image file.
+
+    The plot is created in a figure of its own with the Agg canvas, instead
+    of with the global state of pyplot, so it can be created in a
+    background thread.
+    """
+    # Only import the plotting stack if a plot is requested.
+    # pylint: disable=C0415
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    nx.draw(
+        G,
+        nx.circular_layout(G, scale=1),
+        ax=figure.add_subplot(),
+        labels={node: f"{node}" for node in G.nodes},
+        with_labels=True,
+    )
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    figure.savefig(filepath, dpi=200)
+
+
+@typechecked
+def wait_for_plots() -> None:
+    """Waits until the background thread has created all plots of the
+    generated graphs, and raises the error of a plot that failed.
+
+    This is also called at exit, such that the plots are completed, and
+    their errors are reported.
+    """
+    with PLOT_LOCK:
+        pending_plots: list[Future] = list(plot_futures)
+        plot_futures.clear()
+    for pending_plot in pending_plots:
+        pending_plot.result()
+
+
+atexit.register(wait_for_plots)
+
+
+@typechecked
+def add_random_connected_edges(
+    *,
+    add_edge: Callable[[int, int], None],
+    density: float,
+    rng: random.Random,
+    size: int,
+    skip_sampling: bool,
+) -> None:
+    """Adds an edge from each node to a random node with a higher index, and
+    adds each other edge (u,v) with u<v with probability density."""
+    if skip_sampling:
+        add_skip_sampled_edges(
+            add_edge=add_edge, density=density, rng=rng, size=size
+        )
+    else:
+        edges = combinations(range(size), 2)
+        for _, node_edges in groupby(edges, key=lambda x: x[0]):
+            listed_node_edges = list(node_edges)
+
+            random_edge = rng.choice(  # nosec - using a random seed.
+                listed_node_edges
+            )
+            add_edge(*random_edge)
+            for e in listed_node_edges:
+                # No security application.
+                if rng.random() < density:  # nosec
+                    add_edge(*e)
+
+
+@typechecked
+def gnp_random_connected_snn(
+    *,
+    density: float,
+    recurrent_density: int | float,
+    size: int,
+    test_scope: Long_scope_of_tests,
+    seed: Optional[int] = None,
+) -> Random_snn:
+    """Generates a random connected graph and neuron properties, like
+    gnp_random_connected_graph, but stores them in arrays instead of in
+    networkx attributes and LIF_neuron objects.
+
+    The random edges are always drawn with geometric skips, and the
+    weights and neuron properties are drawn with a local numpy Generator,
+    such that large graphs are generated in time proportional to their
+    number of edges. So this yields a different graph than
+    gnp_random_connected_graph, for the same seed. Unlike
+    gnp_random_connected_graph, the weights and properties are also drawn
+    for a density of 0 or 1, and the graph is not plotted.
+    """
+    if seed is None:
+        seed = test_scope.seed
+    rng: np.random.Generator = np.random.default_rng(seed)
+    if density >= 1:
+        left, right = np.nonzero(~np.eye(size, dtype=bool))
+        edges: ndarray = np.stack([left, right], axis=1)
+    elif density > 0:
+        edges = get_digraph_edge_order(
+            edges=get_skip_sampled_edges(density=density, rng=rng, size=size),
+            size=size,
+        )
+    else:
+        edges = np.empty((0, 2), dtype=np.int64)
+
+    # Draw the integer weights in range [min, max), like
+    # get_list_with_rand_ints_in_range.
+    weights: ndarray = rng.integers(
+        test_scope.min_edge_weight, test_scope.max_edge_weight, size=len(edges)
+    ).astype(float)
+    recurrent_nodes: ndarray = np.sort(
+        rng.choice(
+            size,
+            size=math.ceil(size * recurrent_density),
+            replace=False,
+        )
+    )
+    recurrent_weights: ndarray = rng.integers(
+        test_scope.min_edge_weight,
+        test_scope.max_edge_weight,
+        size=len(recurrent_nodes),
+    ).astype(float)
+
+    return Random_snn(
+        bias=rng.uniform(test_scope.min_bias, test_scope.max_bias, size=size),
+        du=rng.uniform(0, 1, size=size),
+        dv=rng.uniform(0, 1, size=size),
+        edges=np.concatenate(
+            [edges, np.stack([recurrent_nodes, recurrent_nodes], axis=1)]
+        ),
+        vth=rng.uniform(test_scope.min_vth, test_scope.max_vth, size=size),
+        weights=np.concatenate([weights, recurrent_weights]),
+    )
+
+
+@typechecked
+def get_skip_sampled_edges(
+    *, density: float, rng: np.random.Generator, size: int
+) -> ndarray:
+    """Returns an edge from each node to a random node with a higher index,
+    such that the graph is connected, followed by each other edge (u,v)
+    with u<v, with probability density.
+
+    Like add_skip_sampled_edges, the other edges are found with geometric
+    skips over the node pairs, but the skips are drawn in chunks of numpy
+    arrays, so no Python loop runs per edge.
+    """
+    tree_nodes: ndarray = np.arange(size - 1)
+    tree_edges: ndarray = np.stack(
+        [tree_nodes, rng.integers(tree_nodes + 1, size)], axis=1
+    ).reshape(-1, 2)
+
+    # The node pairs (u,v) with u<v are numbered row by row, where row u
+    # starts at pair row_starts[u].
+    nr_of_pairs: int = size * (size - 1) // 2
+    row_starts: ndarray = (
+        np.arange(size, dtype=np.int64)
+        * (2 * size - np.arange(size, dtype=np.int64) - 1)
+        // 2
+    )
+    expected_nr_of_edges: float = nr_of_pairs * density
+    chunk_size: int = int(
+        expected_nr_of_edges + 4 * expected_nr_of_edges**0.5
+    )
+    pairs: list[ndarray] = []
+    last_pair: int = -1
+    while last_pair < nr_of_pairs:
+        chunk: ndarray = last_pair + np.cumsum(
+            rng.geometric(density, size=chunk_size + 1)
+        )
+        pairs.append(chunk[chunk < nr_of_pairs])
+        last_pair = int(chunk[-1])
+    sampled_pairs: ndarray = np.concatenate(pairs)
+    left: ndarray = (
+        np.searchsorted(row_starts, sampled_pairs, side="right") - 1
+    )
+    right: ndarray = sampled_pairs - row_starts[left] + left + 1
+    return np.concatenate([tree_edges, np.stack([left, right], axis=1)])
+
+
+@typechecked
+def get_digraph_edge_order(*, edges: ndarray, size: int) -> ndarray:
+    """Returns the unique edges, in the order in which a networkx DiGraph
+    iterates over them, if they are added in the given order.
+
+    That is, the edges are sorted on their left node, and then on the
+    first time they were added.
+    """
+    _, first_indices = np.unique(
+        edges[:, 0] * size + edges[:, 1], return_index=True
+    )
+    unique_edges: ndarray = edges[np.sort(first_indices)]
+    return unique_edges[np.argsort(unique_edges[:, 0], kind="stable")]
+
+
+@typechecked
+def gnp_random_connected_graphs(
+    *,
+    density: float,
+    max_workers: Optional[int] = None,
+    nr_of_graphs: int,
+    recurrent_density: int | float,
+    size: int,
+    test_scope: Long_scope_of_tests,
+) -> list[DiGraph]:
+    """Generates nr_of_graphs random connected graphs with a pool of
+    threads.
+
+    The seed of each graph is derived from the seed of the test_scope with
+    a numpy SeedSequence, so the graphs do not depend on the number of
+    workers. The graphs are not plotted.
+    """
+    graph_seeds: list[int] = [
+        int(child_seed.generate_state(1)[0])
+        for child_seed in np.random.SeedSequence(test_scope.seed).spawn(
+            nr_of_graphs
+        )
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda graph_seed: gnp_random_connected_graph(
+                    density=density,
+                    plot=False,
+                    recurrent_density=recurrent_density,
+                    seed=graph_seed,
+                    size=size,
+                    test_scope=test_scope,
+                ),
+                graph_seeds,
+            )
+        )
+
+
+@typechecked
+def add_skip_sampled_edges(
+    *,
+    add_edge: Callable[[int, int], None],
+    density: float,
+    rng: random.Random,
+    size: int,
+) -> None:
+    """Adds an edge from each node to a random node with a higher index, such
+    that the graph is connected. Then adds each other edge (u,v) with u<v,
+    with probability density.
+
+    The other edges are found with geometric skips over the node pairs
+    (Batagelj and Brandes, 2005), so only the added edges cost time.
+    """
+    for node in range(size - 1):
+        add_edge(node, rng.randrange(node + 1, size))  # nosec
+
+    log_no_edge: float = math.log(1 - density)
+    u: int = 0
+    v: int = 0
+    while u < size - 1:
+        # Skip the node pairs that do not get an edge. No security
+        # application.
+        v += 1 + int(math.log(1 - rng.random()) / log_no_edge)  # nosec
+        while v >= size and u < size - 1:
+            v = v - size + u + 2
+            u += 1
+        if u < size - 1:
+            add_edge(u, v)
+
+
 @typechecked
 def add_random_recurrent_edges(
-    *, G: nx.DiGraph, recurrent_edge_density: float, test_scope: Any
+    *,
+    G: nx.DiGraph,
+    recurrent_edge_density: float,
+    seed: Optional[int] = None,
+    test_scope: Any,
 ) -> None:
     """Adds random recurrent edges.
 
     :param G: The original graph on which the MDSA algorithm is ran.
+    :param seed: The random seed, defaults to the seed of the test_scope.
     """
+    if seed is None:
+        seed = test_scope.seed
 
     # Use the recurrent_edge_density to get amount of True values.
     # Use seed.
@@ -114,15 +468,17 @@ def add_random_recurrent_edges(
     rand_bools = get_list_with_rand_bools(
         length=len(G),
         recurrent_edge_density=recurrent_edge_density,
-        seed=test_scope.seed,
+        seed=seed,
     )
 
     # Get list of random edge values (un-used weights are ignored/skipped).
+    # The weights are indexed by node, so at least a weight per node is
+    # drawn. The first drawn weights do not depend on the length.
     rand_edge_weights = get_list_with_rand_ints_in_range(
         min_val=test_scope.min_edge_weight,
         max_val=test_scope.max_edge_weight,
-        length=G.number_of_edges(),
-        seed=test_scope.seed,
+        length=max(G.number_of_edges(), len(G)),
+        seed=seed,
     )
 
     for node in G.nodes:
@@ -170,30 +526,34 @@ def set_random_edge_weights(
 def set_rand_neuron_properties(
     *,
     G: DiGraph,
+    seed: Optional[int] = None,
     test_scope: Long_scope_of_tests,
 ) -> None:
     """Sets name: int, bias: float, du: float, dv: float, vth: float for each
     neuron with random value within predetermined ranges.
 
     :param G: The original graph on which the MDSA algorithm is ran.
+    :param seed: The random seed, defaults to the seed of the test_scope.
     """
+    if seed is None:
+        seed = test_scope.seed
     biases = get_list_with_rand_floats_in_range(
         min_val=test_scope.min_bias,
         max_val=test_scope.max_bias,
         length=len(G),
-        seed=test_scope.seed,
+        seed=seed,
     )
     dus = get_list_with_rand_floats_in_range(
-        min_val=0, max_val=1, length=len(G), seed=test_scope.seed
+        min_val=0, max_val=1, length=len(G), seed=seed
     )
     dvs = get_list_with_rand_floats_in_range(
-        min_val=0, max_val=1, length=len(G), seed=test_scope.seed
+        min_val=0, max_val=1, length=len(G), seed=seed
     )
     v_thresholds = get_list_with_rand_floats_in_range(
         min_val=test_scope.min_vth,
         max_val=test_scope.max_vth,
         length=len(G),
-        seed=test_scope.seed,
+        seed=seed,
     )
 
     # Create a LIF neuron object.
@@ -218,14 +578,14 @@ def get_list_with_rand_ints_in_range(
 
     :param seed: The value of the random seed used for this test.
     """
-    # Specify random seed.
-    random.seed(seed)
+    # Specify random seed, in a local random number generator.
+    rng = random.Random(seed)  # nosec - using a random seed.
 
     # Get list with random edge weights.
     # The randomness needs to be deterministic for testing purposes, so
     # it is ok if it is not a real random number, this is not a security
     # application, hence the # nosec.
-    rand_integers = random.choices(range(min_val, max_val), k=length)  # nosec
+    rand_integers = rng.choices(range(min_val, max_val), k=length)  # nosec
     return rand_integers
 
 
@@ -238,11 +598,15 @@ def get_list_with_rand_floats_in_range(
 
     :param seed: The value of the random seed used for this test.
     """
-    # Specify random seed.
-    np.random.seed(seed)
+    # Specify random seed, in a local random number generator. Unlike
+    # default_rng, RandomState yields the same numbers as the global
+    # np.random.seed, so the graphs of existing seeds are unchanged. Pylint
+    # does not find RandomState in the numpy stubs.
+    # pylint: disable=E1101
+    rng = np.random.RandomState(seed)
 
     # Get list with random edge weights.
-    rand_floats = np.random.uniform(low=min_val, high=max_val, size=length)
+    rand_floats = rng.uniform(low=min_val, high=max_val, size=length)
     return rand_floats
 
 
@@ -255,8 +619,8 @@ def get_list_with_rand_bools(
 
     :param seed: The value of the random seed used for this test.
     """
-    # Specify random seed.
-    random.seed(seed)
+    # Specify random seed, in a local random number generator.
+    rng = random.Random(seed)  # nosec - using a random seed.
 
     # Compute how many True and False values are expected.
     amount_of_true_vals = math.ceil(recurrent_edge_density * length)
@@ -275,6 +639,6 @@ def get_list_with_rand_bools(
     # it is ok if it is not a real random number, this is not a security
     # application, hence the # nosec.
 
-    random.shuffle(rand_bools)  # nosec # Note this shuffles in place.
+    rng.shuffle(rand_bools)  # nosec # Note this shuffles in place.
 
     return rand_bools
@@ -1,9 +1,20 @@
 """Contains the list of graphs that are used for radiation testing."""
-import json
 import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import combinations
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import customshowme
 import networkx as nx
@@ -16,6 +27,12 @@ from snncompare.graph_generation.export_input_graphs import (
 from snncompare.import_results.helper import get_isomorphic_graph_hash
 from typeguard import typechecked
 
+from snnalgorithms.input_graph_catalog import (
+    catalog_has_graph_size_and_nr,
+    get_catalogued_filepath,
+    load_stored_input_graph,
+    register_input_graph,
+)
 from snnalgorithms.sparse.MDSA.SNN_initialisation_properties import (
     SNN_initialisation_properties,
 )
@@ -24,25 +41,49 @@ from snnalgorithms.sparse.MDSA.SNN_initialisation_properties import (
 @customshowme.time
 def create_mdsa_input_graphs_from_exp_config(
     exp_config: Exp_config,
+    lazy: Optional[bool] = False,
 ) -> None:
     """Finds the maximum number of graphs per input size, for the MDSA
     algorithm and creates that many unique input graphs.
 
-    Then outputs these.
+    Then outputs these. If lazy is True, each input graph is outputted as
+    soon as it is found, instead of after all graphs of a size are found.
+    The lazily found graphs are isomorphic to, but can differ from, the
+    graphs that are found otherwise.
     """
 
     if "MDSA" in exp_config.algorithms.keys():
         for graph_size, nr_of_graphs in exp_config.size_and_max_graphs:
-            if not has_outputted_input_graph_for_graph_size_and_nr(
+            if not catalog_has_graph_size_and_nr(
+                graph_size=graph_size, graph_nr=nr_of_graphs - 1
+            ) and not has_outputted_input_graph_for_graph_size_and_nr(
                 graph_size=graph_size, graph_nr=nr_of_graphs - 1
             ):
-                input_graphs: Dict[str, nx.Graph] = generate_mdsa_input_graphs(
-                    graph_size=graph_size,
-                    max_nr_of_graphs=nr_of_graphs,
-                    seeds=exp_config.seeds,
-                )
-                for input_graph in input_graphs.values():
+                input_graphs: Iterable[Tuple[str, nx.Graph]]
+                if lazy:
+                    input_graphs = iter_mdsa_input_graphs(
+                        graph_size=graph_size,
+                        max_nr_of_graphs=nr_of_graphs,
+                        seeds=exp_config.seeds,
+                    )
+                else:
+                    input_graphs = generate_mdsa_input_graphs(
+                        graph_size=graph_size,
+                        max_nr_of_graphs=nr_of_graphs,
+                        seeds=exp_config.seeds,
+                    ).items()
+                for graph_nr, (isomorphic_hash, input_graph) in enumerate(
+                    input_graphs
+                ):
                     output_input_graph_if_not_exist(input_graph=input_graph)
+                    register_input_graph(
+                        filepath=get_input_graph_output_filepath(
+                            input_graph=input_graph
+                        ),
+                        graph_nr=graph_nr,
+                        graph_size=graph_size,
+                        isomorphic_hash=isomorphic_hash,
+                    )
     else:
         raise NotImplementedError("Error, algorithm not (yet) supported.")
 
@@ -95,6 +136,59 @@ def generate_mdsa_input_graphs(
     return input_graphs
 
 
+# pylint: disable=R0913
+def iter_mdsa_input_graphs(
+    *,
+    graph_size: int,
+    max_nr_of_graphs: int,
+    seeds: List[int],
+    density_cutoff: float = 0.01,
+    max_iterations: int = 10000,
+    generator: str = "exact",
+) -> Iterator[Tuple[str, nx.Graph]]:
+    """Yields the isomorphic hash and graph of unique, random, connected,
+    planar, triangle-free graphs, as soon as each graph is found.
+
+    The candidate seeds of each seed are tried in the same order as in
+    get_rand_planar_triangle_free_graph, so the graphs of a seed are
+    yielded in the order in which their hashes are first found. Unlike
+    get_rand_planar_triangle_free_graph, an isomorphic duplicate that is
+    found later does not replace the yielded graph. Only the hashes of the
+    yielded graphs are kept in memory.
+    """
+    found_hashes: Set[str] = set()
+    for seed in seeds:
+        for candidate_seed in range(seed, seed + max_iterations):
+            input_graph: Optional[nx.Graph] = get_valid_candidate_graph(
+                candidate_seed,
+                density_cutoff=density_cutoff,
+                size=graph_size,
+                generator=generator,
+            )
+            if input_graph is None:
+                continue
+            isomorphic_hash: str = get_cached_isomorphic_graph_hash(
+                input_graph=input_graph
+            )
+            if isomorphic_hash not in found_hashes:
+                found_hashes.add(isomorphic_hash)
+                # If the input graph is stored, yield the stored graph.
+                input_graphs: Dict[str, nx.Graph] = {
+                    isomorphic_hash: input_graph
+                }
+                load_stored_input_graphs(input_graphs=input_graphs)
+                yield isomorphic_hash, input_graphs[isomorphic_hash]
+                if len(found_hashes) >= max_nr_of_graphs:
+                    return
+
+    raise ValueError(
+        f"For input_graph of size:{graph_size}, I found:"
+        + f"{len(found_hashes)} graphs, yet expected graph_nr:"
+        + f"{max_nr_of_graphs}. Please lower the max_graphs setting in:"
+        + "size_and_max_graphs in the experiment configuration."
+    )
+
+
 def add_mdsa_initialisation_properties_to_input_graph(
     input_graph: nx.Graph, seed: int
 ) -> None:
@@ -116,81 +210,562 @@ def add_mdsa_initialisation_properties_to_input_graph(
 
 
 def triangle_free_graph(size: int, seed: int) -> nx.Graph:
-    """Construct a triangle free graph."""
+    """Construct a triangle free graph.
+
+    Tries the edges between all node pairs in a random order, and adds an
+    edge if it does not create a triangle, and the graph stays planar.
+
+    An edge creates no triangle if its nodes have no common neighbour, so
+    the triangles are not recounted. An edge between two disconnected
+    components can not break planarity, so it is added without a test.
+    The other edges are tested for planarity in batches. If a batch breaks
+    planarity, the first edge that breaks it is found by bisection. The
+    rejected edge is removed, and the candidates after it are tried again.
+    This yields the same graph as testing each edge separately.
+    """
     nodes = range(size)
     g = nx.Graph()
     g.add_nodes_from(nodes)
     edge_candidates = list(combinations(nodes, 2))
-    random.seed(seed)
-    random.shuffle(edge_candidates)
-    for u, v in edge_candidates:
+    random.Random(seed).shuffle(edge_candidates)  # nosec - using a seed.
+
+    # A planar, triangle free graph has at most 2n-4 edges (for n>=3).
+    max_nr_of_edges: int = max(size - 1, 2 * size - 4)
+    component_roots: List[int] = list(nodes)
+    # The candidate index and nodes of the edges that are not yet tested
+    # for planarity.
+    untested_edges: List[Tuple[int, int, int]] = []
+    batch_size: int = 1
+
+    candidate_index: int = 0
+    while True:
+        if (
+            candidate_index >= len(edge_candidates)
+            or g.number_of_edges() >= max_nr_of_edges
+        ):
+            if untested_edges:
+                rejected_index = get_index_of_non_planar_edge(
+                    g=g, untested_edges=untested_edges
+                )
+                untested_edges.clear()
+                if rejected_index is not None:
+                    candidate_index = rejected_index + 1
+                    batch_size = 1
+                    continue
+            break
+
+        u, v = edge_candidates[candidate_index]
         # Add all triangle free edges.
-        if not set(g.neighbors(u)) & set(g.neighbors(v)):
+        if set(g.neighbors(u)).isdisjoint(g.neighbors(v)):
+            root_u = get_component_root(component_roots, u)
+            root_v = get_component_root(component_roots, v)
+            if root_u != root_v:
+                # Resolve the untested edges before the components change.
+                if untested_edges:
+                    rejected_index = get_index_of_non_planar_edge(
+                        g=g, untested_edges=untested_edges
+                    )
+                    untested_edges.clear()
+                    if rejected_index is not None:
+                        candidate_index = rejected_index + 1
+                        batch_size = 1
+                        continue
+                    batch_size = min(2 * batch_size, 64)
+                g.add_edge(u, v)
+                component_roots[root_u] = root_v
+            else:
+                g.add_edge(u, v)
+                untested_edges.append((candidate_index, u, v))
+                if len(untested_edges) >= batch_size:
+                    rejected_index = get_index_of_non_planar_edge(
+                        g=g, untested_edges=untested_edges
+                    )
+                    untested_edges.clear()
+                    if rejected_index is not None:
+                        candidate_index = rejected_index + 1
+                        batch_size = 1
+                        continue
+                    batch_size = min(2 * batch_size, 64)
+        candidate_index += 1
+    return g
+
+
+def get_component_root(component_roots: List[int], node: int) -> int:
+    """Returns the root node of the component that contains the node, and
+    shortens the path to that root on the way."""
+    while component_roots[node] != node:
+        component_roots[node] = component_roots[component_roots[node]]
+        node = component_roots[node]
+    return node
+
+
+# pylint: disable=R0914
+@typechecked
+def incremental_triangle_free_graph(*, seed: int, size: int) -> nx.Graph:
+    """Construct a connected, planar, triangle free graph, without
+    planarity tests.
+
+    First, a random spanning tree is built from the randomly ordered node
+    pairs. A tree has a single face. Then the node pairs are tried again in
+    the same order, and an edge is added if its nodes have no common
+    neighbour, and lie on the boundary of the same face. Such an edge
+    splits that face into two faces, so the graph stays planar. Unlike
+    triangle_free_graph, an edge that would only fit in another embedding
+    of the graph is rejected, so the graphs differ from those of
+    triangle_free_graph.
+    """
+    nodes = range(size)
+    g = nx.Graph()
+    g.add_nodes_from(nodes)
+    edge_candidates = list(combinations(nodes, 2))
+    random.Random(seed).shuffle(edge_candidates)  # nosec - using a seed.
+
+    # Build a random spanning tree (Kruskal on the random edge order).
+    component_roots: List[int] = list(nodes)
+    for u, v in edge_candidates:
+        if g.number_of_edges() >= size - 1:
+            break
+        root_u = get_component_root(component_roots, u)
+        root_v = get_component_root(component_roots, v)
+        if root_u != root_v:
+            component_roots[root_u] = root_v
             g.add_edge(u, v)
-            if sum(nx.triangles(g).values()) > 0:
-                raise ValueError("Got triangular graph.")
+    # With less than 4 nodes, each other edge creates a triangle.
+    if size < 4:
+        return g
+
+    # The nodes on the boundary of each face, in the order of its walk.
+    faces: Dict[int, List[int]] = {0: get_tree_boundary_walk(tree=g)}
+    face_ids_per_node: List[Set[int]] = [{0} for _ in nodes]
+    next_face_id: int = 1
+    for u, v in edge_candidates:
+        shared_face_ids: Set[int] = face_ids_per_node[u] & face_ids_per_node[v]
+        if (
+            shared_face_ids
+            and not g.has_edge(u, v)
+            and set(g.neighbors(u)).isdisjoint(g.neighbors(v))
+        ):
+            face_id: int = min(shared_face_ids)
+            face: List[int] = faces.pop(face_id)
+            for node in face:
+                face_ids_per_node[node].discard(face_id)
+
+            # Split the face walk at (an occurrence of) u and v. Both new
+            # faces are bounded by the new edge.
+            start, end = sorted([face.index(u), face.index(v)])
+            for new_face in [
+                face[start:end] + [face[end]],
+                face[end:] + face[:start] + [face[start]],
+            ]:
+                faces[next_face_id] = new_face
+                for node in new_face:
+                    face_ids_per_node[node].add(next_face_id)
+                next_face_id += 1
+            g.add_edge(u, v)
+    return g
+
+
+@typechecked
+def get_tree_boundary_walk(*, tree: nx.Graph) -> List[int]:
+    """Returns the nodes in the order in which they are visited by a walk
+    along the boundary of the single face of a tree.
+
+    The walk is a depth first Euler tour that starts at node 0, without the
+    final return to node 0.
+    """
+    walk: List[int] = [0]
+    parents: Dict[int, Optional[int]] = {0: None}
+    stack: List[Tuple[int, Iterator[int]]] = [(0, iter(tree.neighbors(0)))]
+    while stack:
+        node, neighbours = stack[-1]
+        child: Optional[int] = next(neighbours, None)
+        if child is None:
+            stack.pop()
+            if stack:
+                walk.append(stack[-1][0])
+        elif child != parents[node]:
+            parents[child] = node
+            walk.append(child)
+            stack.append((child, iter(tree.neighbors(child))))
+    walk.pop()
+    return walk
+
+
+@typechecked
+def quadrangulation_subgraph(
+    *, density: float, seed: int, size: int
+) -> nx.Graph:
+    """Constructs a random, connected, planar, triangle free graph with size
+    nodes, in near linear time.
+
+    First, a random quadrangulation is grown from a 4-cycle, by inserting
+    each new node into a random (quadrilateral) face, and connecting it to
+    two opposite corners of that face. This splits the face into two new
+    faces. A quadrangulation is planar and bipartite, so it has no
+    triangles. Then a random spanning tree of the quadrangulation is
+    kept, and random other edges of it are added until the density is
+    reached. The density is limited to the range of a tree up to the
+    2n-4 edges of the quadrangulation. Finally, the nodes are relabelled
+    randomly.
+    """
+    rng = random.Random(seed)  # nosec - using a random seed.
+    edges: List[Tuple[int, int]] = [
+        (node, node + 1) for node in range(min(size, 4) - 1)
+    ]
+    if size >= 4:
+        edges.append((3, 0))
+        # The faces of the quadrangulation, with their corners in cyclic
+        # order.
+        faces: List[Tuple[int, int, int, int]] = [(0, 1, 2, 3), (0, 3, 2, 1)]
+        for node in range(4, size):
+            face_index: int = rng.randrange(len(faces))
+            a, b, c, d = faces[face_index]
+            if rng.random() < 0.5:
+                a, b, c, d = b, c, d, a
+            edges.append((node, a))
+            edges.append((node, c))
+            faces[face_index] = (a, b, c, node)
+            faces.append((a, node, c, d))
 
-            # If adding the edge removes planarity property, remove the edge.
-            if not nx.is_planar(g):
-                g.remove_edge(u, v)
+    # Keep a random spanning tree (Kruskal on random edge weights).
+    rng.shuffle(edges)
+    component_roots: List[int] = list(range(size))
+    tree_edges: List[Tuple[int, int]] = []
+    other_edges: List[Tuple[int, int]] = []
+    for u, v in edges:
+        root_u = get_component_root(component_roots, u)
+        root_v = get_component_root(component_roots, v)
+        if root_u != root_v:
+            component_roots[root_u] = root_v
+            tree_edges.append((u, v))
+        else:
+            other_edges.append((u, v))
+
+    # Add random other edges until the density is reached.
+    nr_of_edges: int = round(density * size * (size - 1) / 2)
+    nr_of_other_edges: int = min(
+        max(nr_of_edges - len(tree_edges), 0), len(other_edges)
+    )
+
+    # Relabel the nodes randomly.
+    new_labels: List[int] = list(range(size))
+    rng.shuffle(new_labels)
+    g = nx.Graph()
+    g.add_nodes_from(range(size))
+    g.add_edges_from(
+        (new_labels[u], new_labels[v])
+        for u, v in tree_edges + other_edges[:nr_of_other_edges]
+    )
     return g
 
 
+def get_index_of_non_planar_edge(
+    *, g: nx.Graph, untested_edges: List[Tuple[int, int, int]]
+) -> Optional[int]:
+    """Returns None if the graph, including the untested edges, is planar.
+
+    Otherwise, returns the candidate index of the first untested edge that
+    makes the graph non-planar. That edge and the untested edges after it
+    are removed from the graph.
+    """
+    if nx.is_planar(g):
+        return None
+
+    # Bisect on the untested edges. The graph with the first nr_planar
+    # untested edges is planar, the graph with the first nr_non_planar
+    # untested edges is not.
+    g.remove_edges_from((u, v) for _, u, v in untested_edges)
+    nr_planar: int = 0
+    nr_non_planar: int = len(untested_edges)
+    while nr_non_planar - nr_planar > 1:
+        middle: int = (nr_planar + nr_non_planar) // 2
+        middle_edges = [(u, v) for _, u, v in untested_edges[nr_planar:middle]]
+        g.add_edges_from(middle_edges)
+        if nx.is_planar(g):
+            nr_planar = middle
+        else:
+            g.remove_edges_from(middle_edges)
+            nr_non_planar = middle
+    return untested_edges[nr_planar][0]
+
+
 def get_rand_planar_triangle_free_graph(
     density_cutoff: float,
     max_nr_of_graphs: int,
     seed: int,
     size: int,
     max_iterations: Optional[int] = 10000,
+    nr_of_processes: Optional[int] = None,
+    generator: str = "exact",
 ) -> Dict[str, nx.Graph]:
     """Generates unique, random, undirected, connected, planar, triangle-free
-    graphs, and returns them in a list."""
-    input_graphs: Dict[str, nx.Graph] = {}
-    input_graph: nx.Graph = triangle_free_graph(seed=seed, size=size)
+    graphs, and returns them in a list.
 
-    # Limit the maximum number of times a new graph is tried/created.
-    for iteration in range(max_iterations):  # type:ignore[arg-type]
-        # If enough graphs are found, do not continue.
-        if len(input_graphs) < max_nr_of_graphs:
-            # Get a new planar, triangle free graph.
-            # iteration+seed because a new graph needs to be tried each call.
-            input_graph = triangle_free_graph(seed=iteration + seed, size=size)
-            # Verify the density, connectedness and planarity.
-            if (
-                nx.density(input_graph) > density_cutoff
-                and nx.is_connected(input_graph)
-                and nx.is_planar(input_graph)
-                and sum(nx.triangles(input_graph).values()) == 0
-            ):
-                isomorphic_hash: str = get_isomorphic_graph_hash(
-                    some_graph=input_graph
-                )
+    If nr_of_processes is larger than 1, the candidate seeds are evaluated
+    in parallel by a pool of processes. The candidates are still consumed
+    in the order of their seeds, so the same graphs are returned as in the
+    serial mode.
+
+    The generator of the candidate graphs is passed to
+    get_valid_candidate_graph.
+    """
+    unique_input_graphs = Unique_input_graphs()
+    candidates: Iterator[Optional[nx.Graph]]
 
-                # If input graph exists, load it from file.
-                output_filepath: str = get_input_graph_output_filepath(
-                    input_graph=input_graph
+    # Limit the maximum number of times a new graph is tried/created.
+    # iteration+seed because a new graph needs to be tried each call.
+    candidate_seeds = range(
+        seed, seed + max_iterations  # type:ignore[operator]
+    )
+    if nr_of_processes is None or nr_of_processes <= 1:
+        candidates = map(
+            partial(
+                get_valid_candidate_graph,
+                density_cutoff=density_cutoff,
+                size=size,
+                generator=generator,
+            ),
+            candidate_seeds,
+        )
+        add_unique_candidate_graphs(
+            candidates=candidates,
+            unique_input_graphs=unique_input_graphs,
+            max_nr_of_graphs=max_nr_of_graphs,
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=nr_of_processes) as executor:
+            # Submit the seeds in batches, such that no (many) more seeds
+            # are evaluated than needed once enough graphs are found.
+            batch_size: int = 4 * nr_of_processes
+            for batch_start in range(0, len(candidate_seeds), batch_size):
+                batch_end: int = batch_start + batch_size
+                candidates = executor.map(
+                    partial(
+                        get_valid_candidate_graph,
+                        density_cutoff=density_cutoff,
+                        size=size,
+                        generator=generator,
+                    ),
+                    candidate_seeds[batch_start:batch_end],
                 )
-                if Path(output_filepath).is_file():
-                    # Load graph from file and verify it results in the same
-                    # graph.
-                    with open(output_filepath, encoding="utf-8") as json_file:
-                        some_json_graph = json.load(json_file)
-                        json_file.close()
-                        if (
-                            "completed_stages"
-                            in some_json_graph["graph"].keys()
-                        ):
-                            some_json_graph["graph"].pop("completed_stages")
-                    input_graph = nx.node_link_graph(some_json_graph)
-
-                # Only store unique graphs (overwrite the duplicate) with
-                # identical ismorphic hash at the key.
-                input_graphs[isomorphic_hash] = input_graph
+                if add_unique_candidate_graphs(
+                    candidates=candidates,
+                    unique_input_graphs=unique_input_graphs,
+                    max_nr_of_graphs=max_nr_of_graphs,
+                ):
+                    break
+    input_graphs: Dict[str, nx.Graph] = unique_input_graphs.get_input_graphs()
     print(f"Found:{len(input_graphs.items())} unique input graphs.")
 
+    # If an input graph is stored, load it from file.
+    load_stored_input_graphs(input_graphs=input_graphs)
+
     # Sort the graphs to ensure it always returns the same order of input
     # graphs.
     # sorted_input_graphs: List[nx.Graph] = []
     # for some_hash in sorted(list(input_graphs.keys())):
     # sorted_input_graphs.append(input_graphs[some_hash])
     return input_graphs
+
+
+def get_valid_candidate_graph(
+    candidate_seed: int,
+    density_cutoff: float,
+    size: int,
+    generator: str = "exact",
+) -> Optional[nx.Graph]:
+    """Returns the planar, triangle free graph of a candidate seed, or None
+    if the graph is not dense enough, connected, planar and triangle free.
+
+    The generator is either "exact", which tests the planarity of each
+    edge with triangle_free_graph, "incremental", which keeps track of
+    the faces of the graph with incremental_triangle_free_graph, or
+    "quadrangulation", which returns a random quadrangulation with its
+    2n-4 edges with quadrangulation_subgraph. The latter two are much
+    faster for large graphs, but yield different graphs.
+
+    This is a module level function, such that it can be evaluated by a
+    pool of processes.
+    """
+    # Get a new planar, triangle free graph.
+    input_graph: nx.Graph
+    if generator == "exact":
+        input_graph = triangle_free_graph(seed=candidate_seed, size=size)
+    elif generator == "incremental":
+        input_graph = incremental_triangle_free_graph(
+            seed=candidate_seed, size=size
+        )
+    elif generator == "quadrangulation":
+        input_graph = quadrangulation_subgraph(
+            density=1.0, seed=candidate_seed, size=size
+        )
+    else:
+        raise NotImplementedError(
+            f"Error, generator:{generator} not (yet) supported."
+        )
+    # Verify the density, connectedness and planarity.
+    if (
+        nx.density(input_graph) > density_cutoff
+        and nx.is_connected(input_graph)
+        and nx.is_planar(input_graph)
+        and sum(nx.triangles(input_graph).values()) == 0
+    ):
+        return input_graph
+    return None
+
+
+# The isomorphic hashes of the most recently hashed graphs of this process,
+# from least to most recently used. Stores: {(nr_of_nodes, edges): hash}.
+ISOMORPHIC_HASH_CACHE_SIZE: int = 10000
+isomorphic_hash_cache: OrderedDict[Tuple[int, FrozenSet], str] = OrderedDict()
+
+
+@typechecked
+def get_graph_invariants(*, input_graph: nx.Graph) -> Tuple:
+    """Returns the number of nodes, the number of edges and the sorted
+    degree sequence of a graph.
+
+    Isomorphic graphs have the same invariants.
+    """
+    return (
+        len(input_graph),
+        input_graph.number_of_edges(),
+        tuple(sorted(degree for _, degree in input_graph.degree())),
+    )
+
+
+@typechecked
+def get_cached_isomorphic_graph_hash(*, input_graph: nx.Graph) -> str:
+    """Returns the isomorphic hash of a graph, and only computes it if the
+    same (labelled) graph was not hashed recently.
+
+    The hashes of the ISOMORPHIC_HASH_CACHE_SIZE most recently used graphs
+    are kept.
+    """
+    cache_key: Tuple[int, FrozenSet] = (
+        len(input_graph),
+        frozenset((min(u, v), max(u, v)) for u, v in input_graph.edges),
+    )
+    if cache_key in isomorphic_hash_cache:
+        isomorphic_hash_cache.move_to_end(cache_key)
+    else:
+        isomorphic_hash_cache[cache_key] = get_isomorphic_graph_hash(
+            some_graph=input_graph
+        )
+        if len(isomorphic_hash_cache) > ISOMORPHIC_HASH_CACHE_SIZE:
+            isomorphic_hash_cache.popitem(last=False)
+    return isomorphic_hash_cache[cache_key]
+
+
+class Unique_input_graphs:
+    """Keeps the unique input graphs, in the order in which they are found.
+
+    A graph of which the invariants differ from those of all found graphs,
+    is not isomorphic to any of them. So the isomorphic hashes are only
+    computed for graphs with the same invariants as a found graph, and for
+    the returned input graphs.
+    """
+
+    @typechecked
+    def __init__(self) -> None:
+        # The last found graph of each unique graph.
+        self.input_graphs: List[nx.Graph] = []
+        # The isomorphic hash of each unique graph, if it is computed.
+        self.isomorphic_hashes: List[Optional[str]] = []
+        # The indices of the unique graphs per graph invariants.
+        self.indices_per_invariants: Dict[Tuple, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.input_graphs)
+
+    @typechecked
+    def get_isomorphic_hash(self, *, index: int) -> str:
+        """Returns the isomorphic hash of a unique graph."""
+        isomorphic_hash: Optional[str] = self.isomorphic_hashes[index]
+        if isomorphic_hash is None:
+            isomorphic_hash = get_cached_isomorphic_graph_hash(
+                input_graph=self.input_graphs[index]
+            )
+            self.isomorphic_hashes[index] = isomorphic_hash
+        return isomorphic_hash
+
+    @typechecked
+    def add(self, *, input_graph: nx.Graph) -> None:
+        """Adds a graph, or overwrites its isomorphic duplicate."""
+        indices: List[int] = self.indices_per_invariants.setdefault(
+            get_graph_invariants(input_graph=input_graph), []
+        )
+        isomorphic_hash: Optional[str] = None
+        if indices:
+            isomorphic_hash = get_cached_isomorphic_graph_hash(
+                input_graph=input_graph
+            )
+            for index in indices:
+                if self.get_isomorphic_hash(index=index) == isomorphic_hash:
+                    self.input_graphs[index] = input_graph
+                    return
+        indices.append(len(self.input_graphs))
+        self.input_graphs.append(input_graph)
+        self.isomorphic_hashes.append(isomorphic_hash)
+
+    @typechecked
+    def get_input_graphs(self) -> Dict[str, nx.Graph]:
+        """Returns the unique graphs per isomorphic hash."""
+        return {
+            self.get_isomorphic_hash(index=index): input_graph
+            for index, input_graph in enumerate(self.input_graphs)
+        }
+
+
+def add_unique_candidate_graphs(
+    candidates: Iterable[Optional[nx.Graph]],
+    unique_input_graphs: Unique_input_graphs,
+    max_nr_of_graphs: int,
+) -> bool:
+    """Adds the valid candidate graphs to the unique input graphs, in the
+    order of the candidates, until max_nr_of_graphs unique graphs are found.
+
+    Returns True if enough graphs are found.
+    """
+    for candidate in candidates:
+        # If enough graphs are found, do not continue.
+        if len(unique_input_graphs) >= max_nr_of_graphs:
+            return True
+        if candidate is not None:
+            # Only store unique graphs (overwrite the duplicate) with
+            # identical ismorphic hash.
+            unique_input_graphs.add(input_graph=candidate)
+    return len(unique_input_graphs) >= max_nr_of_graphs
+
+
+@typechecked
+def load_stored_input_graphs(*, input_graphs: Dict[str, nx.Graph]) -> None:
+    """Replaces the found input graphs that are already stored, with the
+    stored input graph.
+
+    The catalog is used to find the stored input graphs. If an input graph
+    is not in the catalog, its (legacy) output filepath is probed, and the
+    graph is added to the catalog if it is stored there.
+    """
+    for isomorphic_hash, input_graph in input_graphs.items():
+        filepath: Optional[str] = get_catalogued_filepath(
+            isomorphic_hash=isomorphic_hash
+        )
+        if filepath is None:
+            legacy_filepath: str = get_input_graph_output_filepath(
+                input_graph=input_graph
+            )
+            if Path(legacy_filepath).is_file():
+                filepath = legacy_filepath
+                register_input_graph(
+                    filepath=filepath,
+                    graph_nr=None,
+                    graph_size=len(input_graph),
+                    isomorphic_hash=isomorphic_hash,
+                )
+        if filepath is not None:
+            # Load graph from file and verify it results in the same
+            # graph.
+            input_graphs[isomorphic_hash] = load_stored_input_graph(
+                filepath=filepath
+            )
@@ -1,5 +1,7 @@
 """Contains functions that the algorithm specification files use."""
-from typing import List
+import hashlib
+import json
+from typing import Any, List
 
 from typeguard import typechecked
 
@@ -16,3 +18,15 @@ def assert_parameter_is_list(*, parameter: List) -> None:
             "some_vals is not of type:List[int]. Instead it is of "
             + f"type:{type(parameter)}"
         )
+
+
+@typechecked
+def get_run_config_hash(*, run_config: Any) -> str:
+    """Returns a hash of the settings in a run configuration, which is
+    identical for identical run configurations across processes."""
+    run_config_json: str = json.dumps(
+        run_config.__dict__,
+        sort_keys=True,
+        default=lambda some_obj: getattr(some_obj, "__dict__", str(some_obj)),
+    )
+    return hashlib.sha256(run_config_json.encode("utf-8")).hexdigest()
@@ -0,0 +1,306 @@
+"""Stores input graphs in a compact binary format, next to (or instead of)
+the node-link json files.
+
+A binary input graph file consists of a fixed size header, followed by
+the payload. The header contains: the magic bytes, the format version,
+the flags, the number of nodes, the number of edges, the number of random
+numbers and the length of the json blob. The payload contains:
+    - the nodes, in their original order, as int32 array,
+    - the edge list, in its original order, as int32 array of shape
+      (nr_of_edges, 2),
+    - the rand_nrs of the alg_props, as int32 array,
+    - the rand_edge_weights of the alg_props, as int64 array, as these
+      weights are of the order of -n^2,
+    - a utf-8 json blob with the remaining graph attributes.
+If the compression flag is set, the payload is compressed with zlib.
+Otherwise, the arrays can be read from a memory map of the file.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import networkx as nx
+import numpy as np
+from typeguard import typechecked
+
+INPUT_GRAPH_BINARY_EXTENSION: str = ".snng"
+INPUT_GRAPH_BINARY_MAGIC: bytes = b"SNNG"
+INPUT_GRAPH_BINARY_VERSION: int = 2
+COMPRESSED_FLAG: int = 1
+
+# Magic, version, flags, nr_of_nodes, nr_of_edges, nr_of_rand_nrs and
+# json_length, in little endian.
+HEADER_STRUCT = struct.Struct("<4sHHIIII")
+ARRAY_DTYPE = np.dtype("<i4")
+EDGE_WEIGHT_DTYPE = np.dtype("<i8")
+
+
+class Input_graph_arrays:
+    """Contains the arrays of a binary input graph file.
+
+    The arrays may be views on a memory map of the file. The memory map is
+    closed on close(), or at the end of a with statement, after which the
+    arrays can no longer be used.
+    """
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        *,
+        attributes: Dict[str, Any],
+        buffer: Any = None,
+        edges: np.ndarray,
+        nodes: np.ndarray,
+        rand_edge_weights: Optional[np.ndarray],
+        rand_nrs: Optional[np.ndarray],
+    ) -> None:
+        self.attributes: Dict[str, Any] = attributes
+        self.buffer: Any = buffer
+        self.edges: np.ndarray = edges
+        self.nodes: np.ndarray = nodes
+        self.rand_edge_weights: Optional[np.ndarray] = rand_edge_weights
+        self.rand_nrs: Optional[np.ndarray] = rand_nrs
+
+    def __enter__(self) -> "Input_graph_arrays":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @typechecked
+    def close(self) -> None:
+        """Releases the arrays, and closes the memory map of the file, if
+        any."""
+        self.edges = np.zeros((0, 2), dtype=ARRAY_DTYPE)
+        self.nodes = np.zeros(0, dtype=ARRAY_DTYPE)
+        self.rand_edge_weights = None
+        self.rand_nrs = None
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.buffer = None
+
+    @typechecked
+    def to_networkx(self) -> nx.Graph:
+        """Returns the input graph as networkx graph, with its nodes and edges
+        in their original order, and the alg_props as lists of Python
+        ints."""
+        input_graph = nx.Graph()
+        input_graph.add_nodes_from(self.nodes.tolist())
+        input_graph.add_edges_from(self.edges.tolist())
+        input_graph.graph.update(self.attributes.get("graph", {}))
+        for node, node_attributes in self.attributes.get("nodes", []):
+            input_graph.nodes[node].update(node_attributes)
+        if self.rand_nrs is not None and self.rand_edge_weights is not None:
+            input_graph.graph["alg_props"] = {
+                **self.attributes.get("alg_props", {}),
+                "rand_nrs": self.rand_nrs.tolist(),
+                "rand_edge_weights": self.rand_edge_weights.tolist(),
+            }
+        return input_graph
+
+
+@typechecked
+def get_binary_filepath(*, json_filepath: str) -> str:
+    """Returns the filepath of the binary file of a json input graph
+    file."""
+    return str(Path(json_filepath).with_suffix(INPUT_GRAPH_BINARY_EXTENSION))
+
+
+@typechecked
+def can_store_as_binary(*, input_graph: nx.Graph) -> bool:
+    """Returns True if the nodes of the input graph are the integers 0 to
+    n-1, and its edges have no attributes."""
+    return sorted(input_graph.nodes) == list(range(len(input_graph))) and all(
+        not edge_attributes
+        for _, _, edge_attributes in input_graph.edges(data=True)
+    )
+
+
+# pylint: disable=R0914
+@typechecked
+def write_input_graph_binary(
+    *, compress: bool = False, filepath: str, input_graph: nx.Graph
+) -> None:
+    """Writes an input graph to a binary input graph file.
+
+    The nodes of the input graph must be the integers 0 to n-1, and its
+    edges can not have attributes.
+    """
+    if not can_store_as_binary(input_graph=input_graph):
+        raise ValueError(
+            "Error, the nodes of the input graph should be 0 to n-1, and "
+            + "its edges can not have attributes."
+        )
+    nodes: np.ndarray = np.array(list(input_graph.nodes), dtype=ARRAY_DTYPE)
+    edges: np.ndarray = np.array(
+        list(input_graph.edges), dtype=ARRAY_DTYPE
+    ).reshape(-1, 2)
+
+    graph_attributes: Dict[str, Any] = dict(input_graph.graph)
+    attributes: Dict[str, Any] = {}
+    rand_nrs: np.ndarray = np.zeros(0, dtype=ARRAY_DTYPE)
+    rand_edge_weights: np.ndarray = np.zeros(0, dtype=EDGE_WEIGHT_DTYPE)
+    alg_props: Optional[Dict] = graph_attributes.pop("alg_props", None)
+    if alg_props is not None:
+        rand_nrs = np.array(alg_props["rand_nrs"], dtype=ARRAY_DTYPE)
+        rand_edge_weights = np.array(
+            alg_props["rand_edge_weights"], dtype=EDGE_WEIGHT_DTYPE
+        )
+        attributes["alg_props"] = {
+            key: value
+            for key, value in alg_props.items()
+            if key not in ["rand_nrs", "rand_edge_weights"]
+        }
+    if graph_attributes:
+        attributes["graph"] = graph_attributes
+    node_attributes = [
+        [node, node_attrs]
+        for node, node_attrs in input_graph.nodes(data=True)
+        if node_attrs
+    ]
+    if node_attributes:
+        attributes["nodes"] = node_attributes
+    json_blob: bytes = json.dumps(attributes).encode("utf-8")
+
+    payload: bytes = (
+        nodes.tobytes()
+        + edges.tobytes()
+        + rand_nrs.tobytes()
+        + rand_edge_weights.tobytes()
+        + json_blob
+    )
+    flags: int = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= COMPRESSED_FLAG
+    header: bytes = HEADER_STRUCT.pack(
+        INPUT_GRAPH_BINARY_MAGIC,
+        INPUT_GRAPH_BINARY_VERSION,
+        flags,
+        len(input_graph),
+        len(edges),
+        len(rand_nrs) if alg_props is not None else 0,
+        len(json_blob),
+    )
+
+    # Write to a temporary file first, such that an interrupted write does
+    # not leave a corrupt binary file.
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    temp_filepath: str = f"{filepath}.tmp"
+    with open(temp_filepath, "wb") as temp_file:
+        temp_file.write(header + payload)
+    os.replace(temp_filepath, filepath)
+
+
+@typechecked
+def read_input_graph_arrays(
+    *, filepath: str, memory_map: bool = True
+) -> Input_graph_arrays:
+    """Reads the arrays of a binary input graph file.
+
+    If the file is not compressed and memory_map is True, the arrays are
+    read-only views on a memory map of the file. Use the returned object in
+    a with statement, or call its close(), to close the memory map.
+    """
+    with open(filepath, "rb") as binary_file:
+        if memory_map:
+            buffer: Any = mmap.mmap(
+                binary_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        else:
+            buffer = binary_file.read()
+    (
+        magic,
+        version,
+        flags,
+        nr_of_nodes,
+        nr_of_edges,
+        nr_of_rand_nrs,
+        json_length,
+    ) = HEADER_STRUCT.unpack_from(buffer, 0)
+    if isinstance(buffer, mmap.mmap) and (
+        magic != INPUT_GRAPH_BINARY_MAGIC
+        or version != INPUT_GRAPH_BINARY_VERSION
+    ):
+        buffer.close()
+    if magic != INPUT_GRAPH_BINARY_MAGIC:
+        raise ValueError(f"Error, {filepath} is not a binary input graph.")
+    if version != INPUT_GRAPH_BINARY_VERSION:
+        raise ValueError(
+            f"Error, binary input graph version:{version} of {filepath} is "
+            + "not supported."
+        )
+
+    offset: int = HEADER_STRUCT.size
+    if flags & COMPRESSED_FLAG:
+        compressed_buffer: Any = buffer
+        buffer = zlib.decompress(compressed_buffer[offset:])
+        if isinstance(compressed_buffer, mmap.mmap):
+            compressed_buffer.close()
+        offset = 0
+    nodes: np.ndarray = np.frombuffer(
+        buffer, dtype=ARRAY_DTYPE, count=nr_of_nodes, offset=offset
+    )
+    offset += nodes.nbytes
+    edges: np.ndarray = np.frombuffer(
+        buffer, dtype=ARRAY_DTYPE, count=2 * nr_of_edges, offset=offset
+    ).reshape(nr_of_edges, 2)
+    offset += edges.nbytes
+    rand_nrs: np.ndarray = np.frombuffer(
+        buffer, dtype=ARRAY_DTYPE, count=nr_of_rand_nrs, offset=offset
+    )
+    offset += rand_nrs.nbytes
+    rand_edge_weights: np.ndarray = np.frombuffer(
+        buffer, dtype=EDGE_WEIGHT_DTYPE, count=nr_of_rand_nrs, offset=offset
+    )
+    offset += rand_edge_weights.nbytes
+    json_end: int = offset + json_length
+    attributes: Dict[str, Any] = json.loads(
+        bytes(buffer[offset:json_end]).decode("utf-8")
+    )
+
+    has_alg_props: bool = "alg_props" in attributes
+    return Input_graph_arrays(
+        attributes=attributes,
+        buffer=buffer,
+        edges=edges,
+        nodes=nodes,
+        rand_edge_weights=rand_edge_weights if has_alg_props else None,
+        rand_nrs=rand_nrs if has_alg_props else None,
+    )
+
+
+@typechecked
+def load_input_graph(
+    *, json_filepath: str, compress: bool = False
+) -> nx.Graph:
+    """Loads an input graph from its binary file, if it exists.
+
+    Otherwise, the input graph is loaded from its node-link json file, and
+    migrated to a binary file, such that it is loaded from the binary file
+    next time.
+    """
+    binary_filepath: str = get_binary_filepath(json_filepath=json_filepath)
+    if Path(binary_filepath).is_file() and (
+        not Path(json_filepath).is_file()
+        or os.path.getmtime(binary_filepath) >= os.path.getmtime(json_filepath)
+    ):
+        with read_input_graph_arrays(
+            filepath=binary_filepath
+        ) as input_graph_arrays:
+            return input_graph_arrays.to_networkx()
+
+    with open(json_filepath, encoding="utf-8") as json_file:
+        input_graph: nx.Graph = nx.node_link_graph(json.load(json_file))
+    if can_store_as_binary(input_graph=input_graph):
+        write_input_graph_binary(
+            compress=compress,
+            filepath=binary_filepath,
+            input_graph=input_graph,
+        )
+    return input_graph
@@ -0,0 +1,135 @@
+"""Stores a catalog that maps the isomorphic hash of each stored input graph
+to its graph size, graph number and filepath.
+
+Each catalog entry is stored in its own file in the catalog directory,
+such that processes that register input graphs concurrently do not
+overwrite each others entries. The catalog is loaded once per process,
+such that checking whether an input graph is stored is an in-memory
+lookup, instead of a file probe per candidate graph. The stored graphs
+themselves are only loaded when they are actually used.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.input_graph_binary import (
+    get_binary_filepath,
+    load_input_graph,
+)
+
+INPUT_GRAPH_CATALOG_DIR: str = "results/input_graph_catalog"
+
+# The catalog of this process, loaded from file on first use. Stores:
+# {isomorphic_hash: {"graph_size": int, "graph_nr": int, "filepath": str}}.
+# The graph_nr is None for graphs that were stored before the catalog.
+input_graph_catalog: Optional[Dict[str, Dict]] = None
+
+# Guards the loading and updating of the catalog.
+CATALOG_LOCK = threading.Lock()
+
+
+@typechecked
+def get_input_graph_catalog() -> Dict[str, Dict]:
+    """Returns the catalog of stored input graphs, and loads it from the
+    catalog directory if it is not yet loaded in this process.
+
+    Returns an empty catalog if no catalog directory exists.
+    """
+    global input_graph_catalog  # pylint: disable=W0603
+    with CATALOG_LOCK:
+        if input_graph_catalog is None:
+            input_graph_catalog = {}
+            for entry_filepath in sorted(
+                Path(INPUT_GRAPH_CATALOG_DIR).glob("*.json")
+            ):
+                with open(entry_filepath, encoding="utf-8") as entry_file:
+                    input_graph_catalog[entry_filepath.stem] = json.load(
+                        entry_file
+                    )
+        return input_graph_catalog
+
+
+@typechecked
+def get_catalogued_filepath(*, isomorphic_hash: str) -> Optional[str]:
+    """Returns the filepath of the stored input graph with the isomorphic
+    hash, or None if it is not in the catalog, or its file is deleted."""
+    catalog_entry: Optional[Dict] = get_input_graph_catalog().get(
+        isomorphic_hash
+    )
+    if catalog_entry is None or not is_stored_input_graph(
+        filepath=catalog_entry["filepath"]
+    ):
+        return None
+    return catalog_entry["filepath"]
+
+
+@typechecked
+def is_stored_input_graph(*, filepath: str) -> bool:
+    """Returns True if the json file, or the binary file, of an input graph
+    exists."""
+    return (
+        Path(filepath).is_file()
+        or Path(get_binary_filepath(json_filepath=filepath)).is_file()
+    )
+
+
+@typechecked
+def catalog_has_graph_size_and_nr(*, graph_size: int, graph_nr: int) -> bool:
+    """Returns True if the catalog contains a stored input graph of the graph
+    size with the graph number."""
+    return any(
+        catalog_entry["graph_size"] == graph_size
+        and catalog_entry["graph_nr"] == graph_nr
+        and is_stored_input_graph(filepath=catalog_entry["filepath"])
+        for catalog_entry in get_input_graph_catalog().values()
+    )
+
+
+@typechecked
+def register_input_graph(
+    *,
+    filepath: str,
+    graph_nr: Optional[int],
+    graph_size: int,
+    isomorphic_hash: str,
+) -> None:
+    """Adds a stored input graph to the catalog, and writes its catalog entry
+    to file if it changed."""
+    catalog_entry: Dict = {
+        "graph_size": graph_size,
+        "graph_nr": graph_nr,
+        "filepath": filepath,
+    }
+    catalog: Dict[str, Dict] = get_input_graph_catalog()
+    with CATALOG_LOCK:
+        if catalog.get(isomorphic_hash) == catalog_entry:
+            return
+        catalog[isomorphic_hash] = catalog_entry
+
+        # Write to a temporary file of this process first, such that an
+        # interrupted or concurrent write does not leave a corrupt entry.
+        Path(INPUT_GRAPH_CATALOG_DIR).mkdir(parents=True, exist_ok=True)
+        entry_filepath: str = (
+            f"{INPUT_GRAPH_CATALOG_DIR}/{isomorphic_hash}.json"
+        )
+        temp_filepath: str = f"{entry_filepath}.{os.getpid()}.tmp"
+        with open(temp_filepath, "w", encoding="utf-8") as temp_file:
+            json.dump(catalog_entry, temp_file, indent=2, sort_keys=True)
+        os.replace(temp_filepath, entry_filepath)
+
+
+@typechecked
+def load_stored_input_graph(*, filepath: str) -> nx.Graph:
+    """Loads a stored input graph, without its completed stages.
+
+    The input graph is read from its binary file, which is created from
+    the json file on the first load.
+    """
+    input_graph: nx.Graph = load_input_graph(json_filepath=filepath)
+    input_graph.graph.pop("completed_stages", None)
+    return input_graph
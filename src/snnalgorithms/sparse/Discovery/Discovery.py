@@ -1,9 +1,11 @@
 """Contains the specification of and maximum values of the algorithm
 settings."""
 import sys
-from typing import List, Optional, Tuple, Union
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import networkx as nx
+import numpy as np
 from snnbackends.networkx.LIF_neuron import (
     LIF_neuron,
     Synapse,
@@ -16,6 +18,19 @@ from snnbackends.networkx.run_on_networkx import (
 from snnbackends.verify_graph_is_snn import verify_networkx_snn_spec
 from typeguard import typechecked
 
+from snnalgorithms.sparse.Discovery.adaptive_discovery import (
+    CONTINUOUS_PARAMETER_NAMES,
+    get_feasible_boxes,
+)
+from snnalgorithms.sparse.Discovery.batched_discovery import (
+    DISCOVERY_PARAMETER_NAMES,
+    get_discovery_ranges,
+    get_matching_candidates,
+    get_matching_candidates_sharded,
+    get_nr_of_candidates,
+    sweep_matching_candidates,
+)
+
 
 # pylint: disable=R0902
 # pylint: disable=R0903
@@ -179,9 +194,61 @@ class Specific_range(Discovery):
 class Discovery_algo:
     """Create a particular configuration for the neuron Discovery algorithm."""
 
+    # pylint: disable=R0913
+    # pylint: disable=R0914
     @typechecked
-    def __init__(self, disco: Discovery) -> None:
+    def __init__(
+        self,
+        disco: Discovery,
+        adaptive_max_depth: Optional[int] = None,
+        batched: Optional[bool] = False,
+        fast: Optional[bool] = False,
+        matches_filepath: Optional[str] = None,
+        nr_of_processes: Optional[int] = None,
+    ) -> None:
+        """Searches for the first neuron of type I in the Discovery ranges.
+
+        If batched is True, the candidates are simulated in batches with
+        numpy arrays, and only the first found neuron is simulated with
+        networkx, to print its behaviour. If nr_of_processes is larger
+        than 1, the batches are divided over a pool of processes. If fast
+        is True, the networkx simulations of the nested loop search only
+        store the last timesteps of the neurons.
+
+        If matches_filepath is given, all neurons of type I are written to
+        that json lines file with the batched simulation. An interrupted
+        search resumes from its last checkpoint.
+
+        If adaptive_max_depth is given, the boxes of du, dv, bias and vth
+        values of neurons of type I are searched with a grid that is
+        refined adaptive_max_depth times around the feasible regions,
+        within the bounds of the Discovery ranges.
+        """
         max_time: int = 10000
+        if adaptive_max_depth is not None:
+            self.print_feasible_boxes(
+                disco=disco, max_depth=adaptive_max_depth, max_time=max_time
+            )
+            return
+        if matches_filepath is not None:
+            nr_of_matches: int = sweep_matching_candidates(
+                a_in_time=disco.a_in_time,
+                matches_filepath=matches_filepath,
+                max_time=max_time,
+                progress_callback=lambda done, total: self.drawProgressBar(
+                    percent=done / total, barLen=100
+                ),
+                ranges=get_discovery_ranges(disco=disco),
+            )
+            print(f"\nFOUND {nr_of_matches} neurons, see: {matches_filepath}")
+            return
+        if batched:
+            self.find_first_neuron_batched(
+                disco=disco,
+                max_time=max_time,
+                nr_of_processes=nr_of_processes,
+            )
+            return
         count = 0
         total = (
             len(disco.du_range)
@@ -226,8 +293,26 @@ class Discovery_algo:
                                     weight=weight,
                                     a_in=a_in,
                                     a_in_time=disco.a_in_time,
+                                    detect_cycles=True,
+                                    fast=fast,
                                 )
                                 if is_expected:
+                                    # The search stopped once the state
+                                    # repeated, so simulate the found neuron
+                                    # for the printed timesteps.
+                                    _, snn_graph = self.is_expected_neuron_I(
+                                        lif_neuron=LIF_neuron(
+                                            name="",
+                                            bias=float(bias),
+                                            du=float(du),
+                                            dv=float(dv),
+                                            vth=float(vth),
+                                        ),
+                                        max_time=50,
+                                        weight=weight,
+                                        a_in=a_in,
+                                        a_in_time=disco.a_in_time,
+                                    )
                                     self.print_found_neuron_behaviour(
                                         snn_graph=snn_graph, t_max=50
                                     )
@@ -241,6 +326,134 @@ class Discovery_algo:
                                     print("FOUND")
                                     sys.exit()
 
+    @typechecked
+    def print_feasible_boxes(
+        self, disco: Discovery, max_depth: int, max_time: int
+    ) -> None:
+        """Prints the number of feasible and boundary boxes per weight and
+        a_in value, found with the adaptive grid."""
+        ranges: Dict[str, List[Union[float, int]]] = get_discovery_ranges(
+            disco=disco
+        )
+        boxes_per_combination, nr_of_simulated_neurons = get_feasible_boxes(
+            a_in_time=disco.a_in_time,
+            a_in_range=ranges["a_in"],
+            bounds={
+                name: (float(min(ranges[name])), float(max(ranges[name])))
+                for name in CONTINUOUS_PARAMETER_NAMES
+            },
+            max_depth=max_depth,
+            max_time=max_time,
+            weight_range=ranges["weight"],
+        )
+        for boxes in boxes_per_combination:
+            if len(boxes):
+                nr_of_boundary_boxes: int = int(boxes.is_boundary.sum())
+                print(
+                    f"weight={boxes.weight}, a_in={boxes.a_in}: "
+                    + f"{len(boxes) - nr_of_boundary_boxes} feasible boxes, "
+                    + f"{nr_of_boundary_boxes} boundary boxes"
+                )
+        print(f"Simulated {nr_of_simulated_neurons} neurons.")
+
+    # pylint: disable=R0913
+    @typechecked
+    def find_first_neuron_batched(
+        self,
+        disco: Discovery,
+        max_time: int,
+        chunk_size: int = 100000,
+        nr_of_processes: Optional[int] = None,
+    ) -> None:
+        """Simulates the candidates in chunks, in the order of the nested
+        loops, and prints the first neuron of type I like the nested loops
+        do.
+
+        If nr_of_processes is larger than 1, all candidates are simulated
+        by a pool of processes, before the first match is printed.
+        """
+        ranges: Dict[str, List[Union[float, int]]] = get_discovery_ranges(
+            disco=disco
+        )
+        for matching_indices in self.get_matching_chunks(
+            a_in_time=disco.a_in_time,
+            chunk_size=chunk_size,
+            max_time=max_time,
+            nr_of_processes=nr_of_processes,
+            ranges=ranges,
+        ):
+            if len(matching_indices):
+                # Get the (original) range values of the first match.
+                parameters: Dict[str, Union[float, int]] = {
+                    name: ranges[name][int(range_index)]
+                    for name, range_index in zip(
+                        DISCOVERY_PARAMETER_NAMES,
+                        np.unravel_index(
+                            matching_indices[0],
+                            tuple(
+                                len(ranges[name])
+                                for name in DISCOVERY_PARAMETER_NAMES
+                            ),
+                        ),
+                    )
+                }
+                _, snn_graph = self.is_expected_neuron_I(
+                    lif_neuron=LIF_neuron(
+                        name="",
+                        bias=float(parameters["bias"]),
+                        du=float(parameters["du"]),
+                        dv=float(parameters["dv"]),
+                        vth=float(parameters["vth"]),
+                    ),
+                    max_time=50,
+                    weight=parameters["weight"],
+                    a_in=parameters["a_in"],
+                    a_in_time=disco.a_in_time,
+                )
+                self.print_found_neuron_behaviour(
+                    snn_graph=snn_graph, t_max=50
+                )
+                for name in ["du", "dv", "vth", "bias", "weight", "a_in"]:
+                    print(f"{name}={' ' * (9 - len(name))}{parameters[name]}")
+                print(f"a_in_time={disco.a_in_time}")
+                print("FOUND")
+                sys.exit()
+
+    # pylint: disable=R0913
+    @typechecked
+    def get_matching_chunks(
+        self,
+        a_in_time: int,
+        chunk_size: int,
+        max_time: int,
+        nr_of_processes: Optional[int],
+        ranges: Dict[str, List[Union[float, int]]],
+    ) -> Iterator[np.ndarray]:
+        """Yields the matching candidates per chunk of candidates, in the
+        order of the nested loops, and draws the progress bar."""
+        total: int = get_nr_of_candidates(ranges=ranges)
+        if nr_of_processes is not None and nr_of_processes > 1:
+            yield get_matching_candidates_sharded(
+                a_in_time=a_in_time,
+                max_time=max_time,
+                nr_of_processes=nr_of_processes,
+                progress_callback=lambda done, _: self.drawProgressBar(
+                    percent=done / total, barLen=100
+                ),
+                ranges=ranges,
+            )
+            return
+        for chunk_start in range(0, total, chunk_size):
+            chunk_stop: int = min(chunk_start + chunk_size, total)
+            self.drawProgressBar(percent=chunk_stop / total, barLen=100)
+            yield get_matching_candidates(
+                a_in_time=a_in_time,
+                max_time=max_time,
+                ranges=ranges,
+                start=chunk_start,
+                stop=chunk_stop,
+            )
+
     # pylint: disable=R0913
     @typechecked
     def print_found_neuron_behaviour(
@@ -252,6 +465,7 @@ class Discovery_algo:
             print(f"{t},{neuron.spikes},u={neuron.u.get()},v={neuron.v.get()}")
 
     # pylint: disable=R0913
+    # pylint: disable=R0914
     @typechecked
     def is_expected_neuron_I(
         self,
@@ -259,15 +473,28 @@ class Discovery_algo:
         max_time: int,
         weight: Union[float, int],
         a_in: float,
-        a_in_time: Optional[int] = None,
+        a_in_time: int,
+        detect_cycles: Optional[bool] = False,
+        fast: Optional[bool] = False,
+        nr_of_stored_timesteps: int = 50,
     ) -> Tuple[bool, nx.DiGraph]:
         """Determines whether a neuron is of type I.
 
         Type I is arbitrarily defined as: 'does not spike for 2
         timesteps, and then spikes indefinitely.'. (Because I would like
         to use such a neuron.).
-        """
 
+        If detect_cycles is True, the neuron is accepted once its (u, v,
+        spikes) state repeats after the input spike has arrived. From
+        then on the neuron repeats states that all behaved, so the
+        remaining timesteps are not simulated.
+
+        If fast is True, the snn spec is only verified in the first
+        timestep, and the nx_lif lists only keep the neurons of the
+        previous and current timestep. The last nr_of_stored_timesteps
+        neurons of the tested neuron are stored as (t, neuron) in its
+        nx_lif_history, for print_found_neuron_behaviour.
+        """
         snn_graph = nx.DiGraph()
         node_name: str = "0"
         input_node_name: str = "input_spike"
@@ -293,41 +520,71 @@ class Discovery_algo:
             node_name=node_name,
             snn_graph=snn_graph,
         )
+        if fast:
+            snn_graph.nodes[node_name]["nx_lif_history"] = deque(
+                maxlen=nr_of_stored_timesteps
+            )
+
+        # The states of the tested neuron after the input spike arrived.
+        visited_states: Set[Tuple[float, float, bool]] = set()
 
         # Simulate neuron for at most max_time timesteps, as long as it behaves
         # as desired.
         for t in range(0, max_time):
+            # In fast mode, the neurons of timestep t are at index 0.
+            index: int = 0 if fast else t
+
             # Copy the neurons into the new timestep.
-            verify_networkx_snn_spec(snn_graph=snn_graph, t=t, backend="nx")
-            create_neuron_for_next_timestep(snn_graph=snn_graph, t=t)
+            if not fast or t == 0:
+                verify_networkx_snn_spec(
+                    snn_graph=snn_graph, t=index, backend="nx"
+                )
+            create_neuron_for_next_timestep(snn_graph=snn_graph, t=index)
 
-            verify_networkx_snn_spec(
-                snn_graph=snn_graph, t=t + 1, backend="nx"
-            )
+            if not fast or t == 0:
+                verify_networkx_snn_spec(
+                    snn_graph=snn_graph, t=index + 1, backend="nx"
+                )
             # Simulate neuron.
             run_simulation_with_networkx_for_1_timestep(
-                snn_graph=snn_graph, t=t + 1
+                snn_graph=snn_graph, t=index + 1
             )
             self.verify_input_spike(
                 a_in_time=a_in_time,
+                index=index,
                 input_node_name=input_node_name,
                 snn_graph=snn_graph,
                 t=t,
             )
 
+            neuron: LIF_neuron = snn_graph.nodes[node_name]["nx_lif"][index]
+            if fast:
+                snn_graph.nodes[node_name]["nx_lif_history"].append(
+                    (t, neuron)
+                )
+                # Drop the neurons of timestep t, such that the neurons of
+                # timestep t+1 are at index 0.
+                for node in snn_graph.nodes:
+                    snn_graph.nodes[node]["nx_lif"].pop(0)
+
             # If neuron behaves, continue, otherwise move on to next neuron.
-            if snn_graph.nodes[node_name]["nx_lif"][
-                t
-            ].spikes != self.expected_spike_pattern_I(
+            if neuron.spikes != self.expected_spike_pattern_I(
                 a_in_time=a_in_time, t=t
             ):
                 return False, snn_graph
-            if not self.within_neuron_property_bounds(
-                lif_neuron=snn_graph.nodes[node_name]["nx_lif"][t]
-            ):
+            if not self.within_neuron_property_bounds(lif_neuron=neuron):
                 return False, snn_graph
+            if detect_cycles and t >= 2 + a_in_time:
+                state: Tuple[float, float, bool] = (
+                    neuron.u.get(),
+                    neuron.v.get(),
+                    neuron.spikes,
+                )
+                if state in visited_states:
+                    return True, snn_graph
+                visited_states.add(state)
 
-            if 100 < t < 150:
+            if 100 < t < 150 and not fast:
                 print_neuron_properties_per_graph(
                     G=snn_graph, static=False, t=t, neuron_type="nx_lif"
                 )
@@ -390,17 +647,26 @@ class Discovery_algo:
         input_node_name: str,
         snn_graph: nx.DiGraph,
         t: int,
+        index: Optional[int] = None,
     ) -> None:
         """Raises exception if input neuron does not spike once at
-        a_in_time."""
+        a_in_time.
+
+        The index is the position of the neuron of timestep t in the
+        nx_lif list, which defaults to t.
+        """
+        if index is None:
+            index = t
         if a_in_time > 0:
             if t == a_in_time:
-                if not snn_graph.nodes[input_node_name]["nx_lif"][t].spikes:
+                if not snn_graph.nodes[input_node_name]["nx_lif"][
+                    index
+                ].spikes:
                     raise SyntaxError(
                         "Error, the input neuron did not spike, at the "
                         f"a_in_time={a_in_time}. t={t}"
                     )
-            elif snn_graph.nodes[input_node_name]["nx_lif"][t].spikes:
+            elif snn_graph.nodes[input_node_name]["nx_lif"][index].spikes:
                 raise SyntaxError(
                     "Error, the input neuron spiked, at the "
                     f"a_in_time={a_in_time}. t={t}"
@@ -0,0 +1,409 @@
+"""Searches the feasible regions of the continuous Discovery parameters with
+an adaptive grid, instead of a uniform grid.
+
+For each combination of the discrete weight and a_in values, the box of
+the continuous du, dv, bias and vth values is split into a coarse grid of
+cells. A cell of which the corners and centre are all feasible is
+reported as feasible box, a cell without feasible points is dropped, and
+a cell with both feasible and infeasible points contains the boundary of
+a feasible region. Those boundary cells are split into 16 cells of half
+the size, up to max_depth times. A cell without feasible points that
+neighbours a feasible or boundary cell is split as well, because a
+feasible region can lie between its sampled points. The boundary cells
+of the finest level are reported as boundary boxes.
+
+All points lie on the lattice of the finest level, so they are stored
+with their integer lattice coordinates, and the corners that neighbouring
+cells share are simulated once, with the batched Discovery simulation.
+"""
+import itertools
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from typeguard import typechecked
+
+from snnalgorithms.sparse.Discovery.batched_discovery import (
+    is_expected_neuron_I_batch,
+)
+
+# The continuous Discovery parameters that are refined adaptively.
+CONTINUOUS_PARAMETER_NAMES: Tuple[str, ...] = ("du", "dv", "bias", "vth")
+
+# The corner offsets of a cell with size 1, shape (16, 4).
+CELL_CORNER_OFFSETS: np.ndarray = np.array(
+    list(itertools.product([0, 1], repeat=len(CONTINUOUS_PARAMETER_NAMES))),
+    dtype=np.int64,
+)
+
+# The offsets of the lower corners of a cell with size 1 and of its
+# neighbouring cells, including the cell itself, shape (81, 4).
+CELL_NEIGHBOUR_OFFSETS: np.ndarray = np.array(
+    list(
+        itertools.product([-1, 0, 1], repeat=len(CONTINUOUS_PARAMETER_NAMES))
+    ),
+    dtype=np.int64,
+)
+
+
+class Discovery_boxes:
+    """Contains the boxes of continuous Discovery parameter values of a
+    weight and a_in value, as arrays with one row per box.
+
+    The lower and upper arrays contain the du, dv, bias and vth bounds of
+    each box, in the order of CONTINUOUS_PARAMETER_NAMES. A boundary box
+    contains both neurons of type I and other neurons, otherwise all
+    sampled neurons of the box are of type I.
+    """
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        *,
+        a_in: Union[float, int],
+        is_boundary: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        weight: Union[float, int],
+    ) -> None:
+        self.a_in: Union[float, int] = a_in
+        self.is_boundary: np.ndarray = is_boundary
+        self.lower: np.ndarray = lower
+        self.upper: np.ndarray = upper
+        self.weight: Union[float, int] = weight
+
+    def __len__(self) -> int:
+        return len(self.is_boundary)
+
+    @typechecked
+    def to_dicts(self) -> List[Dict]:
+        """Returns each box as dict with the weight, a_in, whether it is a
+        boundary box, and the (lower, upper) bounds per parameter."""
+        return [
+            {
+                "weight": self.weight,
+                "a_in": self.a_in,
+                "is_boundary": is_boundary,
+                **{
+                    name: (lower[dimension], upper[dimension])
+                    for dimension, name in enumerate(
+                        CONTINUOUS_PARAMETER_NAMES
+                    )
+                },
+            }
+            for is_boundary, lower, upper in zip(
+                self.is_boundary.tolist(),
+                self.lower.tolist(),
+                self.upper.tolist(),
+            )
+        ]
+
+
+class Lattice_cache:
+    """Stores whether the neuron of each evaluated lattice point is of type
+    I, in sorted arrays of lattice point keys."""
+
+    # pylint: disable=R0903
+    @typechecked
+    def __init__(self, *, nr_of_lattice_steps: int) -> None:
+        self.nr_of_lattice_steps: int = nr_of_lattice_steps
+        self.keys: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.is_expected: np.ndarray = np.zeros(0, dtype=bool)
+        self.nr_of_evaluated_points: int = 0
+
+    @typechecked
+    def get_keys(self, *, lattice_points: np.ndarray) -> np.ndarray:
+        """Returns a single integer key per lattice point."""
+        keys: np.ndarray = np.zeros(lattice_points.shape[:-1], dtype=np.int64)
+        for dimension in range(lattice_points.shape[-1]):
+            keys = (
+                keys * (self.nr_of_lattice_steps + 1)
+                + lattice_points[..., dimension]
+            )
+        return keys
+
+    @typechecked
+    def get_lattice_points(self, *, keys: np.ndarray) -> np.ndarray:
+        """Returns the lattice points of the keys, shape (len(keys), 4)."""
+        lattice_points: np.ndarray = np.zeros(
+            (len(keys), len(CONTINUOUS_PARAMETER_NAMES)), dtype=np.int64
+        )
+        for dimension in reversed(range(len(CONTINUOUS_PARAMETER_NAMES))):
+            lattice_points[:, dimension] = keys % (
+                self.nr_of_lattice_steps + 1
+            )
+            keys = keys // (self.nr_of_lattice_steps + 1)
+        return lattice_points
+
+    @typechecked
+    def lookup(self, *, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns for each key whether it is cached, and whether its neuron
+        is of type I, if it is cached."""
+        if not self.keys.size:
+            return np.zeros(keys.shape, dtype=bool), np.zeros(
+                keys.shape, dtype=bool
+            )
+        positions: np.ndarray = np.minimum(
+            np.searchsorted(self.keys, keys), len(self.keys) - 1
+        )
+        is_cached: np.ndarray = self.keys[positions] == keys
+        return is_cached, self.is_expected[positions] & is_cached
+
+    @typechecked
+    def add(self, *, keys: np.ndarray, is_expected: np.ndarray) -> None:
+        """Adds the evaluated, uncached, sorted keys to the cache."""
+        self.nr_of_evaluated_points += len(keys)
+        positions: np.ndarray = np.searchsorted(self.keys, keys)
+        self.keys = np.insert(self.keys, positions, keys)
+        self.is_expected = np.insert(self.is_expected, positions, is_expected)
+
+
+# pylint: disable=R0913
+# pylint: disable=R0914
+@typechecked
+def get_feasible_boxes(
+    *,
+    a_in_time: int,
+    a_in_range: List[Union[float, int]],
+    bounds: Dict[str, Tuple[float, float]],
+    chunk_size: int = 100000,
+    max_depth: int = 3,
+    max_time: int,
+    nr_of_coarse_steps: int = 10,
+    weight_range: List[Union[float, int]],
+) -> Tuple[List[Discovery_boxes], int]:
+    """Returns the feasible and boundary boxes of the continuous Discovery
+    parameters within their (lower, upper) bounds, for each weight and a_in
+    value, and the number of simulated neurons.
+
+    The coarse grid has nr_of_coarse_steps cells per dimension, so the
+    boundary boxes have the size of a cell of a uniform grid with
+    nr_of_coarse_steps * 2**max_depth cells per dimension. The cells of
+    each depth are classified, and their new points are simulated, in
+    chunks of chunk_size.
+    """
+    for name in CONTINUOUS_PARAMETER_NAMES:
+        if not bounds[name][0] < bounds[name][1]:
+            raise ValueError(
+                f"Error, the lower bound of {name} should be smaller than "
+                + f"its upper bound. Found:{bounds[name]}"
+            )
+    nr_of_lattice_steps: int = nr_of_coarse_steps * 2**max_depth
+    boxes: List[Discovery_boxes] = []
+    nr_of_simulated_neurons: int = 0
+    for weight in weight_range:
+        for a_in in a_in_range:
+            lattice_cache: Lattice_cache = Lattice_cache(
+                nr_of_lattice_steps=nr_of_lattice_steps
+            )
+            # The lower corners of the cells of the coarse grid.
+            cells: np.ndarray = np.array(
+                list(
+                    itertools.product(
+                        range(0, nr_of_lattice_steps, 2**max_depth),
+                        repeat=len(CONTINUOUS_PARAMETER_NAMES),
+                    )
+                ),
+                dtype=np.int64,
+            )
+            # The lower corners and sizes of the feasible and boundary boxes.
+            box_cells: List[np.ndarray] = []
+            box_sizes: List[np.ndarray] = []
+            box_is_boundary: List[np.ndarray] = []
+            for depth in range(0, max_depth + 1):
+                cell_size: int = 2 ** (max_depth - depth)
+                is_feasible: np.ndarray = np.zeros(len(cells), dtype=bool)
+                is_boundary: np.ndarray = np.zeros(len(cells), dtype=bool)
+                for chunk_start in range(0, len(cells), chunk_size):
+                    chunk_end: int = chunk_start + chunk_size
+                    (
+                        is_feasible[chunk_start:chunk_end],
+                        is_boundary[chunk_start:chunk_end],
+                    ) = classify_cells(
+                        a_in=a_in,
+                        a_in_time=a_in_time,
+                        bounds=bounds,
+                        cell_size=cell_size,
+                        cells=cells[chunk_start:chunk_end],
+                        chunk_size=chunk_size,
+                        lattice_cache=lattice_cache,
+                        max_time=max_time,
+                        weight=weight,
+                    )
+
+                # Report the feasible cells, and the boundary cells of the
+                # finest level.
+                is_box: np.ndarray = is_feasible
+                if depth == max_depth:
+                    is_box = is_feasible | is_boundary
+                box_cells.append(cells[is_box])
+                box_sizes.append(np.full(is_box.sum(), cell_size))
+                box_is_boundary.append(is_boundary[is_box])
+
+                # Split the other boundary cells, and the cells without
+                # feasible points next to a feasible or boundary cell, into
+                # the cells of the next depth.
+                if depth < max_depth:
+                    is_split: np.ndarray = is_boundary | (
+                        ~is_feasible
+                        & is_neighbour_cell(
+                            cell_size=cell_size,
+                            cells=cells,
+                            lattice_cache=lattice_cache,
+                            source_cells=cells[is_feasible | is_boundary],
+                        )
+                    )
+                    cells = (
+                        cells[is_split][:, np.newaxis, :]
+                        + CELL_CORNER_OFFSETS[np.newaxis, :, :]
+                        * (cell_size // 2)
+                    ).reshape(-1, len(CONTINUOUS_PARAMETER_NAMES))
+
+            nr_of_simulated_neurons += lattice_cache.nr_of_evaluated_points
+            lower_corners: np.ndarray = np.concatenate(box_cells)
+            upper_corners: np.ndarray = (
+                lower_corners + np.concatenate(box_sizes)[:, np.newaxis]
+            )
+            boxes.append(
+                Discovery_boxes(
+                    a_in=a_in,
+                    is_boundary=np.concatenate(box_is_boundary),
+                    lower=get_lattice_values(
+                        bounds=bounds,
+                        lattice_points=lower_corners,
+                        nr_of_lattice_steps=nr_of_lattice_steps,
+                    ),
+                    upper=get_lattice_values(
+                        bounds=bounds,
+                        lattice_points=upper_corners,
+                        nr_of_lattice_steps=nr_of_lattice_steps,
+                    ),
+                    weight=weight,
+                )
+            )
+    return boxes, nr_of_simulated_neurons
+
+
+@typechecked
+def get_cell_points(*, cell_size: int, cells: np.ndarray) -> np.ndarray:
+    """Returns the corners of the cells, and their centres if those are
+    lattice points, shape (len(cells), 16 or 17, 4)."""
+    cell_points: np.ndarray = (
+        cells[:, np.newaxis, :]
+        + CELL_CORNER_OFFSETS[np.newaxis, :, :] * cell_size
+    )
+    if cell_size > 1:
+        cell_points = np.concatenate(
+            [cell_points, cells[:, np.newaxis, :] + cell_size // 2], axis=1
+        )
+    return cell_points
+
+
+@typechecked
+def is_neighbour_cell(
+    *,
+    cell_size: int,
+    cells: np.ndarray,
+    lattice_cache: Lattice_cache,
+    source_cells: np.ndarray,
+) -> np.ndarray:
+    """Returns for each cell whether it is one of the source cells, or
+    shares a corner with one of them. All cells have size cell_size."""
+    neighbour_cells: np.ndarray = (
+        source_cells[:, np.newaxis, :]
+        + CELL_NEIGHBOUR_OFFSETS[np.newaxis, :, :] * cell_size
+    ).reshape(-1, len(CONTINUOUS_PARAMETER_NAMES))
+    # The key of a cell outside the lattice can equal the key of another
+    # cell, so those cells are dropped first.
+    neighbour_cells = neighbour_cells[
+        (
+            (neighbour_cells >= 0)
+            & (
+                neighbour_cells
+                <= lattice_cache.nr_of_lattice_steps - cell_size
+            )
+        ).all(axis=1)
+    ]
+    return np.isin(
+        lattice_cache.get_keys(lattice_points=cells),
+        lattice_cache.get_keys(lattice_points=neighbour_cells),
+    )
+
+
+# pylint: disable=R0913
+@typechecked
+def classify_cells(
+    *,
+    a_in: Union[float, int],
+    a_in_time: int,
+    bounds: Dict[str, Tuple[float, float]],
+    cell_size: int,
+    cells: np.ndarray,
+    chunk_size: int,
+    lattice_cache: Lattice_cache,
+    max_time: int,
+    weight: Union[float, int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns for each cell whether all its points are feasible, and
+    whether it has both feasible and infeasible points.
+
+    The points that are not cached are simulated first.
+    """
+    cell_keys: np.ndarray = lattice_cache.get_keys(
+        lattice_points=get_cell_points(cell_size=cell_size, cells=cells)
+    )
+    new_keys: np.ndarray = np.unique(cell_keys)
+    is_cached, _ = lattice_cache.lookup(keys=new_keys)
+    new_keys = new_keys[~is_cached]
+    if len(new_keys):
+        values: np.ndarray = get_lattice_values(
+            bounds=bounds,
+            lattice_points=lattice_cache.get_lattice_points(keys=new_keys),
+            nr_of_lattice_steps=lattice_cache.nr_of_lattice_steps,
+        )
+        lattice_cache.add(
+            keys=new_keys,
+            is_expected=np.concatenate(
+                [
+                    is_expected_neuron_I_batch(
+                        a_in=np.full(len(chunk_values), float(a_in)),
+                        a_in_time=a_in_time,
+                        max_time=max_time,
+                        weight=np.full(len(chunk_values), float(weight)),
+                        **{
+                            name: chunk_values[:, dimension]
+                            for dimension, name in enumerate(
+                                CONTINUOUS_PARAMETER_NAMES
+                            )
+                        },
+                    )
+                    for chunk_values in np.array_split(
+                        values, -(-len(values) // chunk_size)
+                    )
+                ]
+            ),
+        )
+    _, is_expected = lattice_cache.lookup(keys=cell_keys)
+    is_feasible: np.ndarray = np.asarray(is_expected.all(axis=1))
+    return is_feasible, is_expected.any(axis=1) & ~is_feasible
+
+
+@typechecked
+def get_lattice_values(
+    *,
+    bounds: Dict[str, Tuple[float, float]],
+    lattice_points: np.ndarray,
+    nr_of_lattice_steps: int,
+) -> np.ndarray:
+    """Returns the continuous parameter values of the lattice points, shape
+    (len(lattice_points), 4)."""
+    lower_bounds: np.ndarray = np.array(
+        [bounds[name][0] for name in CONTINUOUS_PARAMETER_NAMES]
+    )
+    upper_bounds: np.ndarray = np.array(
+        [bounds[name][1] for name in CONTINUOUS_PARAMETER_NAMES]
+    )
+    return (
+        lower_bounds
+        + lattice_points * (upper_bounds - lower_bounds) / nr_of_lattice_steps
+    )
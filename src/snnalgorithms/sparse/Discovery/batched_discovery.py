@@ -0,0 +1,499 @@
+"""Simulates the Discovery candidates in batches, with the LIF neuron state
+of all candidates of a batch stored in numpy arrays.
+
+A candidate is a combination of the du, dv, bias, vth, weight and a_in
+values of the Discovery ranges. Each candidate is identified by its flat
+index in the Cartesian product of these ranges, in the order of the
+nested loops of Discovery_algo. The batched simulation follows the
+networkx simulation of Discovery_algo.is_expected_neuron_I: the tested
+neuron has a recurrent synapse with the weight, and receives a_in one
+timestep after the input neuron spikes at a_in_time. A candidate is
+retired as soon as its spikes differ from expected_spike_pattern_I, or
+its u or v leaves the neuron property bounds.
+"""
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from typeguard import typechecked
+
+# The Discovery parameters, in the order of the nested loops of
+# Discovery_algo, so the last parameter changes fastest.
+DISCOVERY_PARAMETER_NAMES: Tuple[str, ...] = (
+    "du",
+    "dv",
+    "bias",
+    "vth",
+    "weight",
+    "a_in",
+)
+# The maximum absolute value of u and v of a valid neuron.
+NEURON_PROPERTY_BOUND: float = 100
+
+# The number of simulated candidates of all workers of a sharded search,
+# shared with each worker process by init_shard_worker.
+shared_progress_counter: Any = None
+
+
+@typechecked
+def get_discovery_ranges(*, disco: Any) -> Dict[str, List[Union[float, int]]]:
+    """Returns the range of each Discovery parameter of a Discovery
+    object."""
+    return {
+        parameter_name: list(getattr(disco, f"{parameter_name}_range"))
+        for parameter_name in DISCOVERY_PARAMETER_NAMES
+    }
+
+
+@typechecked
+def get_nr_of_candidates(*, ranges: Dict[str, List[Union[float, int]]]) -> int:
+    """Returns the number of combinations of the Discovery parameters."""
+    return int(
+        np.prod([len(ranges[name]) for name in DISCOVERY_PARAMETER_NAMES])
+    )
+
+
+@typechecked
+def get_candidate_parameters(
+    *,
+    flat_indices: np.ndarray,
+    ranges: Dict[str, List[Union[float, int]]],
+) -> Dict[str, np.ndarray]:
+    """Returns the parameter values of the candidates with the flat
+    indices."""
+    range_indices = np.unravel_index(
+        flat_indices,
+        tuple(len(ranges[name]) for name in DISCOVERY_PARAMETER_NAMES),
+    )
+    return {
+        name: np.asarray(ranges[name], dtype=np.float64)[range_index]
+        for name, range_index in zip(DISCOVERY_PARAMETER_NAMES, range_indices)
+    }
+
+
+# pylint: disable=R0913
+# pylint: disable=R0914
+@typechecked
+def is_expected_neuron_I_batch(
+    *,
+    a_in: np.ndarray,
+    a_in_time: int,
+    bias: np.ndarray,
+    du: np.ndarray,
+    dv: np.ndarray,
+    max_cycle_length: int = 8,
+    max_time: int,
+    vth: np.ndarray,
+    weight: np.ndarray,
+) -> np.ndarray:
+    """Returns for each candidate whether its neuron is of type I during
+    max_time timesteps.
+
+    Type I is arbitrarily defined as: 'does not spike for 2 timesteps, and
+    then spikes indefinitely.'
+
+    After the input spike has arrived and the expected spike pattern has
+    switched to spiking, the neuron state (u, v, spikes) determines all
+    later states. So if a candidate returns to one of its last
+    max_cycle_length states, it repeats a cycle of states that all
+    behaved, and it is accepted without simulating the remaining
+    timesteps. A candidate in a cycle that does not behave is retired
+    by the regular checks before the cycle closes.
+    """
+    is_expected: np.ndarray = np.zeros(len(a_in), dtype=bool)
+    # The indices of the candidates that are still simulated.
+    active: np.ndarray = np.arange(len(a_in))
+    u: np.ndarray = np.zeros(len(a_in))
+    v: np.ndarray = np.zeros(len(a_in))
+    spikes: np.ndarray = np.zeros(len(a_in), dtype=bool)
+    # The last max_cycle_length states of each candidate, after the input
+    # window. Unused entries are nan, which never equal a state.
+    u_history: np.ndarray = np.full((max_cycle_length, len(a_in)), np.nan)
+    v_history: np.ndarray = np.full((max_cycle_length, len(a_in)), np.nan)
+    spikes_history: np.ndarray = np.zeros(
+        (max_cycle_length, len(a_in)), dtype=bool
+    )
+    autonomous_from: int = a_in_time + 2 if a_in_time > 0 else 2
+
+    for t in range(0, max_time):
+        # Retire the candidates of which the neuron at t does not behave.
+        keep: np.ndarray = (
+            (spikes == (t >= 2 + a_in_time))
+            & (np.abs(u) <= NEURON_PROPERTY_BOUND)
+            & (np.abs(v) <= NEURON_PROPERTY_BOUND)
+        )
+        if max_cycle_length and t >= autonomous_from:
+            # Accept the candidates that return to a previous state.
+            in_cycle: np.ndarray = keep & (
+                (u_history == u)
+                & (v_history == v)
+                & (spikes_history == spikes)
+            ).any(axis=0)
+            is_expected[active[in_cycle]] = True
+            keep &= ~in_cycle
+            history_index: int = (t - autonomous_from) % max_cycle_length
+            u_history[history_index] = u
+            v_history[history_index] = v
+            spikes_history[history_index] = spikes
+        if not keep.all():
+            active, u, v, spikes = (
+                active[keep],
+                u[keep],
+                v[keep],
+                spikes[keep],
+            )
+            a_in, bias, du, dv, vth, weight = (
+                a_in[keep],
+                bias[keep],
+                du[keep],
+                dv[keep],
+                vth[keep],
+                weight[keep],
+            )
+            u_history, v_history, spikes_history = (
+                u_history[:, keep],
+                v_history[:, keep],
+                spikes_history[:, keep],
+            )
+            if not active.size:
+                return is_expected
+
+        # Simulate the neurons of timestep t+1. The recurrent synapse
+        # passes the spikes of timestep t, and the input neuron spikes at
+        # a_in_time, which arrives one timestep later.
+        a_in_next: np.ndarray = weight * spikes
+        if a_in_time > 0 and t + 1 == a_in_time + 1:
+            a_in_next = a_in_next + a_in
+        u = u * (1 - du) + a_in_next
+        v = v * (1 - dv) + u + bias
+        spikes = v > vth
+        v[spikes] = 0.0
+
+    is_expected[active] = True
+    return is_expected
+
+
+@typechecked
+def get_matching_candidates(
+    *,
+    a_in_time: int,
+    chunk_size: int = 100000,
+    max_cycle_length: int = 8,
+    max_time: int,
+    ranges: Dict[str, List[Union[float, int]]],
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> np.ndarray:
+    """Returns the flat indices of the candidates in range [start, stop)
+    of which the neuron is of type I.
+
+    The candidates are simulated in chunks of chunk_size candidates, to
+    limit the memory usage. A candidate that returns to one of its last
+    max_cycle_length states is accepted early, a max_cycle_length of 0
+    disables the cycle detection.
+    """
+    if stop is None:
+        stop = get_nr_of_candidates(ranges=ranges)
+    matching_indices: List[np.ndarray] = []
+    for chunk_start in range(start, stop, chunk_size):
+        flat_indices: np.ndarray = np.arange(
+            chunk_start, min(chunk_start + chunk_size, stop)
+        )
+        is_expected: np.ndarray = is_expected_neuron_I_batch(
+            a_in_time=a_in_time,
+            max_cycle_length=max_cycle_length,
+            max_time=max_time,
+            **get_candidate_parameters(
+                flat_indices=flat_indices, ranges=ranges
+            ),
+        )
+        matching_indices.append(flat_indices[is_expected])
+    return np.concatenate(matching_indices or [np.zeros(0, dtype=np.int64)])
+
+
+@typechecked
+def get_matching_candidates_sharded(
+    *,
+    a_in_time: int,
+    chunk_size: int = 50000,
+    max_cycle_length: int = 8,
+    max_time: int,
+    nr_of_processes: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    ranges: Dict[str, List[Union[float, int]]],
+    report_interval: float = 1.0,
+    shard_size: int = 100000,
+) -> np.ndarray:
+    """Returns the flat indices of all candidates of which the neuron is of
+    type I, using a pool of nr_of_processes worker processes.
+
+    The flat index range is split into shards of shard_size candidates,
+    which are divided over the workers. The workers add the number of
+    simulated candidates to a shared counter after each chunk, and the
+    progress is reported at most once per report_interval seconds.
+    """
+    total: int = get_nr_of_candidates(ranges=ranges)
+    if progress_callback is None:
+        progress_callback = print_progress
+    shards: List[Tuple[int, int]] = [
+        (shard_start, min(shard_start + shard_size, total))
+        for shard_start in range(0, total, shard_size)
+    ]
+    progress_counter = mp.Value("q", 0)
+    with mp.Pool(
+        processes=nr_of_processes,
+        initializer=init_shard_worker,
+        initargs=(progress_counter,),
+    ) as pool:
+        shard_results = pool.starmap_async(
+            get_matching_candidates_of_shard,
+            [
+                (
+                    a_in_time,
+                    chunk_size,
+                    max_cycle_length,
+                    max_time,
+                    ranges,
+                    start,
+                    stop,
+                )
+                for start, stop in shards
+            ],
+        )
+        while not shard_results.ready():
+            shard_results.wait(report_interval)
+            progress_callback(progress_counter.value, total)
+        matching_indices: List[np.ndarray] = shard_results.get()
+    progress_callback(progress_counter.value, total)
+    return np.concatenate(matching_indices or [np.zeros(0, dtype=np.int64)])
+
+
+def init_shard_worker(progress_counter: Any) -> None:
+    """Stores the shared progress counter in a worker process."""
+    global shared_progress_counter  # pylint: disable=W0603
+    shared_progress_counter = progress_counter
+
+
+# pylint: disable=R0913
+def get_matching_candidates_of_shard(
+    a_in_time: int,
+    chunk_size: int,
+    max_cycle_length: int,
+    max_time: int,
+    ranges: Dict[str, List[Union[float, int]]],
+    start: int,
+    stop: int,
+) -> np.ndarray:
+    """Returns the matching candidates of a shard, and adds the number of
+    simulated candidates to the shared progress counter after each chunk.
+
+    This is a module level function, such that it can be evaluated by a
+    pool of processes.
+    """
+    matching_indices: List[np.ndarray] = []
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop: int = min(chunk_start + chunk_size, stop)
+        matching_indices.append(
+            get_matching_candidates(
+                a_in_time=a_in_time,
+                chunk_size=chunk_size,
+                max_cycle_length=max_cycle_length,
+                max_time=max_time,
+                ranges=ranges,
+                start=chunk_start,
+                stop=chunk_stop,
+            )
+        )
+        if shared_progress_counter is not None:
+            with shared_progress_counter.get_lock():
+                shared_progress_counter.value += chunk_stop - chunk_start
+    return np.concatenate(matching_indices or [np.zeros(0, dtype=np.int64)])
+
+
+# pylint: disable=R0913
+# pylint: disable=R0914
+@typechecked
+def sweep_matching_candidates(
+    *,
+    a_in_time: int,
+    checkpoint_filepath: Optional[str] = None,
+    checkpoint_interval: float = 10.0,
+    chunk_size: int = 100000,
+    matches_filepath: str,
+    max_cycle_length: int = 8,
+    max_time: int,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    ranges: Dict[str, List[Union[float, int]]],
+) -> int:
+    """Writes all candidates of which the neuron is of type I to a json
+    lines file, and returns the number of written candidates.
+
+    Each line contains the flat index and the (original) range values of
+    a matching candidate. After the matches of a chunk are written, the
+    flat index of the next chunk and the size of the matches file are
+    written to the checkpoint file, at most once per checkpoint_interval
+    seconds. If the checkpoint file of the same sweep exists, the sweep
+    resumes from it, and the matches that were written after the
+    checkpoint are removed from the matches file.
+    """
+    if checkpoint_filepath is None:
+        checkpoint_filepath = f"{matches_filepath}.checkpoint.json"
+    if progress_callback is None:
+        progress_callback = print_progress
+    total: int = get_nr_of_candidates(ranges=ranges)
+    sweep_settings: Dict[str, Any] = {
+        "a_in_time": a_in_time,
+        "max_time": max_time,
+        "ranges": ranges,
+    }
+    next_index, matches_offset = load_sweep_checkpoint(
+        checkpoint_filepath=checkpoint_filepath,
+        sweep_settings=sweep_settings,
+    )
+
+    if matches_offset and (
+        not Path(matches_filepath).is_file()
+        or os.path.getsize(matches_filepath) < matches_offset
+    ):
+        raise ValueError(
+            f"Error, the matches file:{matches_filepath} is shorter than its "
+            + f"checkpoint:{checkpoint_filepath}."
+        )
+
+    Path(matches_filepath).parent.mkdir(parents=True, exist_ok=True)
+    with open(
+        matches_filepath, "r+b" if matches_offset else "wb"
+    ) as matches_file:
+        # Remove the matches that were written after the checkpoint.
+        matches_file.truncate(matches_offset)
+        matches_file.seek(matches_offset)
+        last_checkpoint_time: float = time.time()
+        for chunk_start in range(next_index, total, chunk_size):
+            chunk_stop: int = min(chunk_start + chunk_size, total)
+            matching_indices: np.ndarray = get_matching_candidates(
+                a_in_time=a_in_time,
+                max_cycle_length=max_cycle_length,
+                max_time=max_time,
+                ranges=ranges,
+                start=chunk_start,
+                stop=chunk_stop,
+            )
+            write_matches(
+                flat_indices=matching_indices,
+                matches_file=matches_file,
+                ranges=ranges,
+            )
+            progress_callback(chunk_stop, total)
+
+            if (
+                chunk_stop == total
+                or time.time() - last_checkpoint_time >= checkpoint_interval
+            ):
+                # The matches are on disk before the checkpoint that
+                # refers to them.
+                matches_file.flush()
+                os.fsync(matches_file.fileno())
+                write_sweep_checkpoint(
+                    checkpoint_filepath=checkpoint_filepath,
+                    matches_offset=matches_file.tell(),
+                    next_index=chunk_stop,
+                    sweep_settings=sweep_settings,
+                )
+                last_checkpoint_time = time.time()
+
+    with open(matches_filepath, encoding="utf-8") as matches_file:
+        return sum(1 for _ in matches_file)
+
+
+@typechecked
+def write_matches(
+    *,
+    flat_indices: np.ndarray,
+    matches_file: Any,
+    ranges: Dict[str, List[Union[float, int]]],
+) -> None:
+    """Writes the flat index and the (original) range values of each
+    candidate as json line to the binary matches file."""
+    # The range values of each parameter, for all candidates.
+    columns: List[List[Union[float, int]]] = [
+        [ranges[name][range_index] for range_index in range_indices.tolist()]
+        for name, range_indices in zip(
+            DISCOVERY_PARAMETER_NAMES,
+            np.unravel_index(
+                flat_indices,
+                tuple(len(ranges[name]) for name in DISCOVERY_PARAMETER_NAMES),
+            ),
+        )
+    ]
+    matches_file.write(
+        "".join(
+            json.dumps(
+                {
+                    "flat_index": flat_index,
+                    **dict(zip(DISCOVERY_PARAMETER_NAMES, values)),
+                }
+            )
+            + "\n"
+            for flat_index, *values in zip(flat_indices.tolist(), *columns)
+        ).encode("utf-8")
+    )
+
+
+@typechecked
+def load_sweep_checkpoint(
+    *, checkpoint_filepath: str, sweep_settings: Dict[str, Any]
+) -> Tuple[int, int]:
+    """Returns the flat index of the next chunk and the size of the matches
+    file of the checkpoint, or (0, 0) if there is no checkpoint.
+
+    Raises a ValueError if the checkpoint belongs to a sweep with other
+    settings.
+    """
+    if not Path(checkpoint_filepath).is_file():
+        return 0, 0
+    with open(checkpoint_filepath, encoding="utf-8") as checkpoint_file:
+        checkpoint: Dict[str, Any] = json.load(checkpoint_file)
+    # Compare the settings as they are stored in json.
+    if checkpoint["sweep_settings"] != json.loads(json.dumps(sweep_settings)):
+        raise ValueError(
+            f"Error, the checkpoint:{checkpoint_filepath} belongs to a sweep "
+            + "with other settings."
+        )
+    return checkpoint["next_index"], checkpoint["matches_offset"]
+
+
+@typechecked
+def write_sweep_checkpoint(
+    *,
+    checkpoint_filepath: str,
+    matches_offset: int,
+    next_index: int,
+    sweep_settings: Dict[str, Any],
+) -> None:
+    """Writes the flat index of the next chunk and the size of the matches
+    file to the checkpoint file."""
+    # Write to a temporary file first, such that an interrupted write does
+    # not leave a corrupt checkpoint file.
+    temp_filepath: str = f"{checkpoint_filepath}.tmp"
+    with open(temp_filepath, "w", encoding="utf-8") as temp_file:
+        json.dump(
+            {
+                "next_index": next_index,
+                "matches_offset": matches_offset,
+                "sweep_settings": sweep_settings,
+            },
+            temp_file,
+        )
+    os.replace(temp_filepath, checkpoint_filepath)
+
+
+@typechecked
+def print_progress(done: int, total: int) -> None:
+    """Prints the percentage of simulated candidates on a single line."""
+    sys.stdout.write(f"\r{done}/{total} candidates, {100 * done / total:.2f}%")
+    sys.stdout.flush()
@@ -0,0 +1,84 @@
+"""Takes an input graph and generates the properties that are required to
+compute the Alipour algorithm results, as int64 arrays."""
+from typing import Any, Dict
+
+import networkx as nx
+import numpy as np
+from snncompare.helper import generate_list_of_n_random_nrs
+from typeguard import typechecked
+
+from snnalgorithms.input_graph_binary import (
+    read_input_graph_arrays,
+    write_input_graph_binary,
+)
+from snnalgorithms.sparse.MDSA.SNN_initialisation_properties import (
+    SNN_initialisation_properties,
+)
+
+
+# pylint: disable=R0903
+class SNN_initialisation_arrays(SNN_initialisation_properties):
+    """Contains the properties required to compute Alipour algorithm
+    results, with the rand_nrs and rand_edge_weights as int64 arrays.
+
+    The values are equal to those of SNN_initialisation_properties. The
+    rand_edge_weights are of the order of -n^2, so they do not fit in int32
+    arrays for n >= 46342.
+    """
+
+    # The list based properties are not computed, so the initialiser of
+    # SNN_initialisation_properties is not called.
+    # pylint: disable=W0231
+    @typechecked
+    def __init__(self, G: nx.Graph, seed: int) -> None:
+        rand_ceil = self.get_random_ceiling(G)
+        # The random numbers are drawn by snncompare, such that they equal
+        # those of SNN_initialisation_properties.
+        self.rand_ceil = rand_ceil
+        self.rand_nrs: np.ndarray = np.array(
+            generate_list_of_n_random_nrs(G=G, max_val=rand_ceil, seed=seed),
+            dtype=np.int64,
+        )
+        self.rand_edge_weights: np.ndarray = (
+            np.int64(self.get_degree_receiver_offset(G, rand_ceil))
+            - self.rand_nrs
+        )
+
+    @typechecked
+    def write_to_binary(
+        self, *, compress: bool = False, filepath: str, input_graph: nx.Graph
+    ) -> None:
+        """Writes a copy of the input graph, with these properties as
+        alg_props, to a binary input graph file.
+
+        The input graph itself is not changed.
+        """
+        binary_input_graph: nx.Graph = input_graph.copy()
+        binary_input_graph.graph["alg_props"] = self.__dict__
+        write_input_graph_binary(
+            compress=compress,
+            filepath=filepath,
+            input_graph=binary_input_graph,
+        )
+
+
+@typechecked
+def load_alg_props_arrays(*, filepath: str) -> Dict[str, Any]:
+    """Returns the alg_props of a binary input graph file, with the rand_nrs
+    and rand_edge_weights as arrays.
+
+    The arrays are copied, such that the memory map of the file is closed.
+    """
+    with read_input_graph_arrays(filepath=filepath) as input_graph_arrays:
+        if (
+            input_graph_arrays.rand_nrs is None
+            or input_graph_arrays.rand_edge_weights is None
+        ):
+            raise KeyError(f"Error, {filepath} does not contain alg_props.")
+        return {
+            **input_graph_arrays.attributes["alg_props"],
+            "rand_nrs": np.array(input_graph_arrays.rand_nrs),
+            "rand_edge_weights": np.array(
+                input_graph_arrays.rand_edge_weights
+            ),
+        }
@@ -10,17 +10,14 @@ These results are returned in the form of a dict.
 """
 import copy
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pprint import pprint
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import networkx as nx
 from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
 from snncompare.exp_config.Exp_config import Exp_config
-from snncompare.export_plots.create_dash_plot import create_svg_plot
-from snncompare.export_plots.temp_default_output_creation import (
-    create_default_output_config,
-)
 from snncompare.helper import (
     get_some_duration,
     get_with_adaptation_bool,
@@ -33,8 +30,33 @@ from snncompare.simulation.stage2_sim import stage_2_or_4_graph_exists_already
 from typeguard import typechecked
 
 from snnalgorithms.sparse.MDSA.get_results import get_neumann_results
+from snnalgorithms.sparse.MDSA.mismatch_report import (
+    export_mismatch_records,
+    get_mismatch_records,
+    get_mismatching_node_names,
+    plot_mismatching_snn_behaviour,
+    verify_passed_bool,
+)
+from snnalgorithms.sparse.MDSA.results_sidecar import (
+    load_results_from_sidecar,
+    store_results_in_sidecar,
+)
+
+# The graphs of which the results are computed, and whether they contain
+# redundant neurons.
+REDUNDANT_PER_SNN_GRAPH_NAME: Dict[str, bool] = {
+    "snn_algo_graph": False,
+    "adapted_snn_graph": True,
+    "rad_snn_algo_graph": False,
+    "rad_adapted_snn_graph": True,
+}
+
+# The arguments of get_snn_results_of_graph that are shared by the graphs of
+# a run, stored in each worker process by init_results_worker.
+shared_results_kwargs: Dict[str, Any] = {}
 
 
+# pylint: disable=R0913
 # @typechecked # TODO: restore.
 def set_mdsa_snn_results(
     *,
@@ -43,10 +65,26 @@ def set_mdsa_snn_results(
     output_config: Output_config,
     run_config: Run_config,
     stage_2_graphs: Dict,
+    max_workers: Optional[int] = None,
+    mismatch_report_filepath: Optional[str] = None,
+    results_sidecar_dir: Optional[str] = None,
 ) -> None:
     """Returns the nodes and counts per node that were computed by the SNN
     algorithm.
 
+    If max_workers is larger than 1, the results of the snn graphs are
+    computed concurrently by a pool of max_workers processes. The results
+    are written into the graph attributes, stored and verified in the
+    order of REDUNDANT_PER_SNN_GRAPH_NAME, like the serial computation.
+
+    If a mismatch_report_filepath is given, the results are verified
+    without raising an error or plotting. Instead, the mismatching node
+    counts are appended to that report file.
+
+    If a results_sidecar_dir is given, the results of each graph are
+    stored in a json sidecar file in that directory, and the stage 4
+    results are read from it if they are stored.
+
     TODO: rewrite to store results in graphs directly.
     """
 
@@ -61,94 +99,152 @@ def set_mdsa_snn_results(
         size=run_config.graph_size,
     )
 
+    for graph_name in stage_2_graphs.keys():
+        if (
+            graph_name != "input_graph"
+            and graph_name not in REDUNDANT_PER_SNN_GRAPH_NAME
+        ):
+            raise ValueError(f"Invalid graph name:{graph_name}")
+    snn_graph_names: List[str] = [
+        graph_name
+        for graph_name in REDUNDANT_PER_SNN_GRAPH_NAME
+        if graph_name in stage_2_graphs
+    ]
+    results_kwargs: Dict[str, Any] = {
+        "alipour_counter_marks": alipour_counter_marks,
+        "results_sidecar_dir": results_sidecar_dir,
+        "run_config": run_config,
+        "stage_2_graphs": stage_2_graphs,
+    }
+
     # Compute SNN results
-    for graph_name, snn in stage_2_graphs.items():
+    if max_workers is None or max_workers <= 1:
+        set_and_verify_snn_results(
+            alipour_counter_marks=alipour_counter_marks,
+            exp_config=exp_config,
+            mismatch_report_filepath=mismatch_report_filepath,
+            output_config=output_config,
+            results_per_graph=(
+                get_snn_results_of_graph(
+                    graph_name=graph_name, **results_kwargs
+                )
+                for graph_name in snn_graph_names
+            ),
+            results_sidecar_dir=results_sidecar_dir,
+            run_config=run_config,
+            snn_graph_names=snn_graph_names,
+            stage_2_graphs=stage_2_graphs,
+        )
+    else:
+        # The readout is CPU-bound Python, so the graphs are divided over
+        # processes instead of threads. The shared arguments are passed
+        # once per worker, instead of once per graph.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_results_worker,
+            initargs=(results_kwargs,),
+        ) as executor:
+            set_and_verify_snn_results(
+                alipour_counter_marks=alipour_counter_marks,
+                exp_config=exp_config,
+                mismatch_report_filepath=mismatch_report_filepath,
+                output_config=output_config,
+                results_per_graph=executor.map(
+                    get_snn_results_of_worker_graph, snn_graph_names
+                ),
+                results_sidecar_dir=results_sidecar_dir,
+                run_config=run_config,
+                snn_graph_names=snn_graph_names,
+                stage_2_graphs=stage_2_graphs,
+            )
+
+    # TODO: verify the results are set correctly.
+
+
+# pylint: disable=R0913
+# @typechecked # TODO: restore.
+def set_and_verify_snn_results(
+    *,
+    alipour_counter_marks: Dict[str, int],
+    exp_config: Exp_config,
+    mismatch_report_filepath: Optional[str],
+    output_config: Output_config,
+    results_per_graph: Iterator[Dict],
+    results_sidecar_dir: Optional[str],
+    run_config: Run_config,
+    snn_graph_names: List[str],
+    stage_2_graphs: Dict,
+) -> None:
+    """Stores the results of each snn graph in its graph attributes and in
+    the results sidecar, and verifies the results of the graphs without
+    radiation, in the order of the snn_graph_names."""
+    for graph_name, results in zip(snn_graph_names, results_per_graph):
+        snn = stage_2_graphs[graph_name]
         if isinstance(snn, Simulator):
-            # graph =
             graph_attributes = snn.network.graph.graph
-
         else:
-            # graph = snn
             graph_attributes = snn.graph
-        graph = snn
+        graph_attributes["results"] = results
+        store_results_in_sidecar(
+            results=results,
+            results_sidecar_dir=results_sidecar_dir,
+            run_config=run_config,
+            with_adaptation=get_with_adaptation_bool(graph_name=graph_name),
+            with_radiation=get_with_radiation_bool(graph_name=graph_name),
+        )
 
-        # Verify the SNN graphs have completed simulation stage 2.
-        if graph_name != "input_graph":
-            with_adaptation: bool = get_with_adaptation_bool(
-                graph_name=graph_name
-            )
-            with_radiation: bool = get_with_radiation_bool(
-                graph_name=graph_name
+        if graph_name in ["snn_algo_graph", "adapted_snn_graph"]:
+            verify_snn_results(
+                actual_node_names=graph_attributes["results"],
+                exp_config=exp_config,
+                expected_node_names=alipour_counter_marks,
+                graphs_dict=stage_2_graphs,
+                mismatch_report_filepath=mismatch_report_filepath,
+                output_config=output_config,
+                run_config=run_config,
+                graph_name=graph_name,
             )
 
-            if graph_name == "snn_algo_graph":
-                graph_attributes["results"] = get_snn_results(
-                    alipour_counter_marks=alipour_counter_marks,
-                    input_graph=stage_2_graphs["input_graph"],
-                    redundant=False,
-                    run_config=run_config,
-                    snn_graph=graph,
-                    stage_2_graphs=stage_2_graphs,
-                    with_adaptation=with_adaptation,
-                    with_radiation=with_radiation,
-                )
-                assert_valid_results(
-                    actual_node_names=graph_attributes["results"],
-                    exp_config=exp_config,
-                    expected_node_names=alipour_counter_marks,
-                    graphs_dict=stage_2_graphs,
-                    output_config=output_config,
-                    run_config=run_config,
-                    graph_name=graph_name,
-                )
 
-            elif graph_name == "adapted_snn_graph":
-                graph_attributes["results"] = get_snn_results(
-                    alipour_counter_marks=alipour_counter_marks,
-                    input_graph=stage_2_graphs["input_graph"],
-                    redundant=True,
-                    run_config=run_config,
-                    stage_2_graphs=stage_2_graphs,
-                    snn_graph=graph,
-                    with_adaptation=with_adaptation,
-                    with_radiation=with_radiation,
-                )
-                assert_valid_results(
-                    actual_node_names=graph_attributes["results"],
-                    exp_config=exp_config,
-                    expected_node_names=alipour_counter_marks,
-                    graphs_dict=stage_2_graphs,
-                    output_config=output_config,
-                    run_config=run_config,
-                    graph_name=graph_name,
-                )
+def init_results_worker(results_kwargs: Dict[str, Any]) -> None:
+    """Stores the arguments that are shared by the graphs of a run in a
+    worker process."""
+    shared_results_kwargs.update(results_kwargs)
 
-            elif graph_name == "rad_snn_algo_graph":
-                graph_attributes["results"] = get_snn_results(
-                    alipour_counter_marks=alipour_counter_marks,
-                    input_graph=stage_2_graphs["input_graph"],
-                    redundant=False,
-                    run_config=run_config,
-                    stage_2_graphs=stage_2_graphs,
-                    snn_graph=graph,
-                    with_adaptation=with_adaptation,
-                    with_radiation=with_radiation,
-                )
-            elif graph_name == "rad_adapted_snn_graph":
-                graph_attributes["results"] = get_snn_results(
-                    alipour_counter_marks=alipour_counter_marks,
-                    input_graph=stage_2_graphs["input_graph"],
-                    redundant=True,
-                    run_config=run_config,
-                    stage_2_graphs=stage_2_graphs,
-                    snn_graph=graph,
-                    with_adaptation=with_adaptation,
-                    with_radiation=with_radiation,
-                )
-            else:
-                raise ValueError(f"Invalid graph name:{graph_name}")
 
-    # TODO: verify the results are set correctly.
+def get_snn_results_of_worker_graph(graph_name: str) -> Dict:
+    """Returns the results of a single snn graph, with the shared arguments
+    of the worker process.
+
+    This is a module level function, such that it can be evaluated by a
+    pool of processes.
+    """
+    return get_snn_results_of_graph(
+        graph_name=graph_name, **shared_results_kwargs
+    )
+
+
+# @typechecked # TODO: restore.
+def get_snn_results_of_graph(
+    *,
+    alipour_counter_marks: Dict[str, int],
+    graph_name: str,
+    results_sidecar_dir: Optional[str],
+    run_config: Run_config,
+    stage_2_graphs: Dict,
+) -> Dict:
+    """Returns the results of a single snn graph in the stage 2 graphs."""
+    return get_snn_results(
+        alipour_counter_marks=alipour_counter_marks,
+        input_graph=stage_2_graphs["input_graph"],
+        redundant=REDUNDANT_PER_SNN_GRAPH_NAME[graph_name],
+        results_sidecar_dir=results_sidecar_dir,
+        run_config=run_config,
+        stage_2_graphs=stage_2_graphs,
+        snn_graph=stage_2_graphs[graph_name],
+        with_adaptation=get_with_adaptation_bool(graph_name=graph_name),
+        with_radiation=get_with_radiation_bool(graph_name=graph_name),
+    )
 
 
 # @typechecked # TODO: restore.
@@ -170,6 +266,43 @@ def print_mdsa_snn_results(
                 pprint(graph_attributes["results"])
 
 
+# @typechecked # TODO: restore.
+def verify_snn_results(
+    *,
+    actual_node_names: Dict,
+    exp_config: Exp_config,
+    expected_node_names: Dict[str, int],
+    graph_name: str,
+    graphs_dict: Dict,
+    mismatch_report_filepath: Optional[str],
+    output_config: Output_config,
+    run_config: Run_config,
+) -> None:
+    """Asserts the results are equal to the Alipour default algorithm, or
+    appends the mismatches to the report file if a mismatch_report_filepath
+    is given."""
+    if mismatch_report_filepath is None:
+        assert_valid_results(
+            actual_node_names=actual_node_names,
+            exp_config=exp_config,
+            expected_node_names=expected_node_names,
+            graphs_dict=graphs_dict,
+            output_config=output_config,
+            run_config=run_config,
+            graph_name=graph_name,
+        )
+    else:
+        export_mismatch_records(
+            mismatch_records=get_mismatch_records(
+                actual_node_names=actual_node_names,
+                expected_node_names=expected_node_names,
+                graph_name=graph_name,
+                run_config=run_config,
+            ),
+            report_filepath=mismatch_report_filepath,
+        )
+
+
 # @typechecked # TODO: restore.
 def assert_valid_results(
     *,
@@ -199,54 +332,37 @@ def assert_valid_results(
         )
 
     # Verify the expected nodes are the same as the actual nodes.
-
-    for key in expected_node_names.keys():
-        if expected_node_names[key] != copy_actual_node_names[key]:
-            print(f"\nfor:{graph_name}, in:\n")
-            run_config.print_run_config_dict()
-            print(f"expected_node_names={expected_node_names}")
-            print(f"  actual_node_names={copy_actual_node_names}")
-            print("So printing the behaviour.\n\n")
-
-            # Visualise the snn behaviour
-
-            if "hover_info" not in output_config.__dict__.keys():
-                output_config = create_default_output_config(
-                    exp_config=exp_config,
-                )
-            # Override output config from exp_config.
-            output_config.extra_storing_config.show_images = True
-            output_config.hover_info.neuron_properties = [
-                "spikes",
-                "a_in_next",
-                "bias",
-                "du",
-                "u",
-                "dv",
-                "v",
-                "vth",
-            ]
-
-            create_svg_plot(
-                graph_names=[graph_name],
-                graphs=graphs_dict,
-                output_config=output_config,
-                run_config=run_config,
-            )
-            raise ValueError(
-                f"SNN count per node for: {graph_name}, are not equal to "
-                " the default/Neumann node counts:\n"
-                f"SNN nodes:    {actual_node_names}\n"
-                "!=\n"
-                f"Neumann nodes:{expected_node_names}\n"
-                f"Node:{key} has different counts."
-            )
-    if not actual_node_names["passed"]:
+    mismatching_node_names: List[str] = get_mismatching_node_names(
+        actual_node_names=actual_node_names,
+        expected_node_names=expected_node_names,
+    )
+    if mismatching_node_names:
+        key: str = mismatching_node_names[0]
+        print(f"\nfor:{graph_name}, in:\n")
+        run_config.print_run_config_dict()
+        print(f"expected_node_names={expected_node_names}")
+        print(f"  actual_node_names={copy_actual_node_names}")
+        print("So printing the behaviour.\n\n")
+
+        # Visualise the snn behaviour
+        plot_mismatching_snn_behaviour(
+            exp_config=exp_config,
+            graph_names=[graph_name],
+            graphs_dict=graphs_dict,
+            output_config=output_config,
+            run_config=run_config,
+        )
         raise ValueError(
-            "Error, did not detect a difference between SNN "
-            "and Neumann mark count in the nodes. Yet "
-            "the results computation says there should be a difference."
+            f"SNN count per node for: {graph_name}, are not equal to "
+            " the default/Neumann node counts:\n"
+            f"SNN nodes:    {actual_node_names}\n"
+            "!=\n"
+            f"Neumann nodes:{expected_node_names}\n"
+            f"Node:{key} has different counts."
         )
+    verify_passed_bool(
+        actual_node_names=actual_node_names, has_mismatches=False
+    )
 
     if verbose:
         for node_index, expected_count in expected_node_names.items():
@@ -257,6 +373,7 @@ def assert_valid_results(
 
 
 # pylint: disable=R0913
+# pylint: disable=R0914
 @typechecked
 def get_snn_results(
     *,
@@ -268,12 +385,16 @@ def get_snn_results(
     snn_graph: Union[nx.DiGraph, Simulator],
     with_adaptation: bool,
     with_radiation: bool,
+    results_sidecar_dir: Optional[str] = None,
 ) -> Dict:
     """Returns the marks per node that are selected by the snn simulation.
 
     If the simulation is ran with adaptation in the form of redundancy,
     the code automatically selects the working node, and returns its
-    count in the list.
+    count in the list. If a results_sidecar_dir is given, the stage 4
+    results are read from the json sidecar file in that directory. The
+    results are stored in it by set_and_verify_snn_results, such that
+    the sidecar is only written by the main process.
     """
     if stage_2_or_4_graph_exists_already(
         input_graph=input_graph,
@@ -283,7 +404,17 @@ def get_snn_results(
         with_radiation=with_radiation,
         stage_index=4,
     ):
-        # Load stage 4 results from file.
+        # Load stage 4 results from the results sidecar (if used), and only
+        # load the full stage 4 graph if the sidecar does not contain them.
+        stored_results: Optional[Dict] = load_results_from_sidecar(
+            results_sidecar_dir=results_sidecar_dir,
+            run_config=run_config,
+            with_adaptation=with_adaptation,
+            with_radiation=with_radiation,
+        )
+        if stored_results is not None:
+            return stored_results
+
         stage_4_graph = load_simsnn_graphs(
             run_config=run_config,
             input_graph=input_graph,
@@ -389,6 +520,62 @@ def get_nx_LIF_count_without_redundancy(
     return node_counts
 
 
+@typechecked
+def get_nx_LIF_count_per_round(
+    *,
+    input_graph: nx.Graph,
+    m_val: int,
+    snn: Union[nx.DiGraph, Simulator],
+    simulator: str,
+    t: int,
+) -> Dict[int, Dict[str, int]]:
+    """Returns the node counts of every round 0..m_val, read out from the
+    round_counter neurons of an snn that was created with
+    per_round_counters=True.
+
+    The counts per round are stored as: {m: {"counter_<node_index>":
+    count}}, such that each round can be compared directly to the
+    get_neumann_results output for that m_val. Redundant (adapted) snns
+    are not supported, because their round counts are not majority-voted.
+    """
+    if simulator == "simsnn":
+        node_names: List[str] = [
+            simsnn_node.name for simsnn_node in snn.network.nodes
+        ]
+    else:
+        node_names = list(snn.nodes)
+    if any(node_name[:2] == "r_" for node_name in node_names):
+        raise NotImplementedError(
+            "Error, per round counts of redundant snns are not supported."
+        )
+
+    round_counts: Dict[int, Dict[str, int]] = {
+        round_index: {} for round_index in range(0, m_val + 1)
+    }
+
+    if simulator == "simsnn":
+        for node_index, simsnn_node in enumerate(snn.network.nodes):
+            if isinstance(simsnn_node, LIF):
+                if simsnn_node.name[:14] == "round_counter_":
+                    counter_index, round_index = simsnn_node.name[14:].split(
+                        "_"
+                    )
+                    round_counts[int(round_index)][
+                        f"counter_{counter_index}"
+                    ] = int(snn.multimeter.I[t][node_index])
+    elif simulator == "nx":
+        for round_index in range(0, m_val + 1):
+            for node_index in range(0, len(input_graph)):
+                round_counts[round_index][f"counter_{node_index}"] = int(
+                    snn.nodes[f"round_counter_{node_index}_{round_index}"][
+                        "nx_lif"
+                    ][t].u.get()
+                )
+    else:
+        raise NotImplementedError(f"Error, {simulator} not supported.")
+    return round_counts
+
+
 @typechecked
 def get_nx_LIF_count_with_redundancy(
     *,
@@ -419,6 +606,25 @@ def get_nx_LIF_count_with_redundancy(
             + f"{red_level}."
         )
 
+    if majority_vote:
+        # Read out all (redundant) counter neurons once, instead of once per
+        # node.
+        counter_counts: Dict = get_nx_LIF_count_without_redundancy(
+            input_graph=input_graph,
+            snn=adapted_nx_snn_graph,
+            simulator=simulator,
+            t=t,
+        )
+        counter_counts.update(
+            get_redundant_counter_node_counts(
+                adapted_snn=adapted_nx_snn_graph,
+                nr_of_nodes=len(input_graph),
+                red_level=red_level,
+                simulator=simulator,
+                t=t,
+            )
+        )
+
     # TODO: verify nx simulator is used, throw error otherwise.
     for node_index in range(0, len(input_graph)):
         if not majority_vote:
@@ -432,12 +638,9 @@ def get_nx_LIF_count_with_redundancy(
             )
         else:
             node_counts[f"counter_{node_index}"] = get_majority_node_count(
-                input_graph=input_graph,
-                adapted_snn=adapted_nx_snn_graph,
+                counter_counts=counter_counts,
                 node_index=node_index,
                 red_level=red_level,
-                simulator=simulator,
-                t=t,
             )
     return node_counts
 
@@ -521,58 +724,70 @@ def add_redundant_counter_node_counts(
 
 
 @typechecked
-def get_majority_node_count(
+def get_redundant_counter_node_counts(
     *,
-    input_graph: nx.Graph,
     adapted_snn: Union[nx.DiGraph, Simulator],
-    node_index: int,
+    nr_of_nodes: int,
     red_level: int,
     simulator: str,
     t: int,
+) -> Dict:
+    """Returns the counts stored in all redundant counter neurons, read out in
+    a single pass over the snn."""
+    red_node_names: List[str] = [
+        f"r_{redundancy}_counter_{node_index}"
+        for node_index in range(0, nr_of_nodes)
+        for redundancy in range(1, red_level + 1)
+    ]
+    red_counts: Dict = {}
+    if simulator == "nx":
+        for red_node_name in red_node_names:
+            red_counts[red_node_name] = adapted_snn.nodes[red_node_name][
+                "nx_lif"
+            ][t].u.get()
+    elif simulator == "simsnn":
+        red_node_name_set = set(red_node_names)
+        for simsnn_index, simsnn_node in enumerate(adapted_snn.network.nodes):
+            if isinstance(simsnn_node, LIF):
+                if simsnn_node.name in red_node_name_set:
+                    red_counts[simsnn_node.name] = adapted_snn.multimeter.I[t][
+                        simsnn_index
+                    ]
+    else:
+        raise NotImplementedError(f"Error, {simulator} not implemented.")
+    return red_counts
+
+
+@typechecked
+def get_majority_node_count(
+    *,
+    counter_counts: Dict,
+    node_index: int,
+    red_level: int,
     remove_negatives: Optional[bool] = True,
 ) -> float:
     """Returns the node count according to a majority vote between the original
-    and redundant nodes of a count node in the MDSA neuron."""
-
-    snn_counter_marks: Dict[
-        str, Union[int, float]
-    ] = get_nx_LIF_count_without_redundancy(
-        input_graph=input_graph,
-        snn=adapted_snn,
-        simulator=simulator,
-        t=t,
-    )
-
-    # Filter only counter_<node_index> neurons.
-    remove_node_names: List[str] = []
-    # pylint:disable=C0201
-    for node_name in snn_counter_marks.keys():
-        expected_len: int = -len(f"counter_{node_index}")
-        if f"counter_{node_index}" not in node_name[expected_len:]:
-            remove_node_names.append(node_name)
-    for node_name in remove_node_names:
-        snn_counter_marks.pop(node_name)
+    and redundant nodes of a count node in the MDSA neuron.
 
-    add_redundant_counter_node_counts(
-        adapted_nx_snn_graph=adapted_snn,
-        node_index=node_index,
-        red_level=red_level,
-        simulator=simulator,
-        snn_counter_marks=snn_counter_marks,
-        t=t,
-    )
+    The counter_counts contain the counts of the original and redundant
+    counter neurons of all nodes, as read out by
+    get_nx_LIF_count_without_redundancy and
+    get_redundant_counter_node_counts.
+    """
+    votes: List = []
+    for prefix in [""] + [
+        f"r_{redundancy}_" for redundancy in range(1, red_level + 1)
+    ]:
+        node_name: str = f"{prefix}counter_{node_index}"
+        if node_name in counter_counts:
+            votes.append(counter_counts[node_name])
 
     if remove_negatives:
-        remove_node_names = []
-        for node_name, node_count in snn_counter_marks.items():
-            if node_count < 0:
-                remove_node_names.append(node_name)
-        for node_name in remove_node_names:
-            snn_counter_marks.pop(node_name)
-
-    if not snn_counter_marks:
+        votes = [vote for vote in votes if vote >= 0]
+
+    if not votes:
         return 0  # If no votes are found, return 0 as default count.
-    return find_majority(votes=list(snn_counter_marks.values()), position=1)[
+    return find_majority(votes=votes, position=1)[
         0
     ]  # Return value that occurred most.
 
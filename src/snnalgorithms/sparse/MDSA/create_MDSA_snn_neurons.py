@@ -27,9 +27,16 @@ def get_new_mdsa_graph(
     *,
     run_config: Run_config,
     input_graph: nx.Graph,
+    per_round_counters: bool = False,
 ) -> nx.DiGraph:
     """Creates the networkx snn for a run configuration for the MDSA
-    algorithm."""
+    algorithm.
+
+    If per_round_counters is True, a round_counter_<node>_<m> neuron is
+    added for every node and every round m, which stores the marks of
+    that round. This allows a single simulation at m_val=K to yield the
+    marks for every m_val<=K.
+    """
     if not isinstance(input_graph.graph["alg_props"], Dict):
         raise KeyError("Error, algorithm properties not set.")
     # exit()
@@ -39,7 +46,10 @@ def get_new_mdsa_graph(
     plot_config: Plot_config = get_default_plot_config()
 
     snn_graph = create_MDSA_neurons(
-        input_graph=input_graph, run_config=run_config, plot_config=plot_config
+        input_graph=input_graph,
+        run_config=run_config,
+        plot_config=plot_config,
+        per_round_counters=per_round_counters,
     )
 
     for node_name in snn_graph.nodes:
@@ -56,6 +66,7 @@ def get_new_mdsa_graph(
         input_graph=input_graph,
         mdsa_snn=snn_graph,
         run_config=run_config,
+        per_round_counters=per_round_counters,
     )
 
     return snn_graph
@@ -69,6 +80,7 @@ def create_MDSA_neurons(
     input_graph: nx.Graph,
     plot_config: Plot_config,
     run_config: Run_config,
+    per_round_counters: bool = False,
 ) -> nx.DiGraph:
     """Creates the neurons for the MDSA algorithm."""
     mdsa_snn = nx.DiGraph()
@@ -126,6 +138,15 @@ def create_MDSA_neurons(
         run_config=run_config,
     )
 
+    if per_round_counters:
+        create_round_counter_node(
+            degree_indices=degree_indices,
+            input_graph=input_graph,
+            mdsa_snn=mdsa_snn,
+            plot_config=plot_config,
+            run_config=run_config,
+        )
+
     create_next_round_node(
         mdsa_snn=mdsa_snn,
         nr_of_nodes=len(input_graph.nodes),
@@ -437,6 +458,57 @@ def create_counter_node(
         mdsa_snn.nodes[lif_neuron.full_name]["nx_lif"] = [lif_neuron]
 
 
+@typechecked
+def create_round_counter_node(
+    *,
+    degree_indices: Dict[int, int],
+    input_graph: nx.Graph,
+    mdsa_snn: nx.DiGraph,
+    plot_config: Plot_config,
+    run_config: Run_config,
+) -> None:
+    """Creates the neuron settings for the round_counter nodes in the MDSA
+    algorithm.
+
+    The round_counter_<node_index>_<m_val> neuron counts the marks that
+    the node receives in round m_val, like the counter node does for the
+    last round.
+    """
+    for node_index in input_graph.nodes:
+        for m_val in range(0, run_config.algorithm["MDSA"]["m_val"] + 1):
+            identifiers = [
+                Identifier(
+                    description="node_index",
+                    position=0,
+                    value=node_index,
+                ),
+                Identifier(description="m_val", position=1, value=m_val),
+            ]
+
+            round_counter_xy = tuple(
+                get_node_position(
+                    node_name="round_counter",
+                    identifiers=identifiers,
+                    plot_config=plot_config,
+                    run_config=run_config,
+                    m_val_max=run_config.algorithm["MDSA"]["m_val"],
+                    degree_indices=degree_indices,
+                )
+            )
+
+            lif_neuron = LIF_neuron(
+                name="round_counter",
+                bias=0.0,
+                du=0.0,
+                dv=1.0,
+                vth=0.0,
+                pos=round_counter_xy,
+                identifiers=identifiers,
+            )
+            mdsa_snn.add_node(lif_neuron.full_name)
+            mdsa_snn.nodes[lif_neuron.full_name]["nx_lif"] = [lif_neuron]
+
+
 @typechecked
 def create_next_round_node(
     *,
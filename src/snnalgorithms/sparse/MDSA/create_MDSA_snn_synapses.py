@@ -1,6 +1,7 @@
 """Creates the MDSA snn synapses."""
 
 import networkx as nx
+import numpy as np
 from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
 from snncompare.run_config.Run_config import Run_config
 from typeguard import typechecked
@@ -12,6 +13,7 @@ def create_MDSA_synapses(
     input_graph: nx.Graph,
     mdsa_snn: nx.DiGraph,
     run_config: Run_config,
+    per_round_counters: bool = False,
 ) -> nx.DiGraph:
     """Creates the synapses between the neurons for the MDSA algorithm."""
 
@@ -41,6 +43,13 @@ def create_MDSA_synapses(
         run_config=run_config,
     )
 
+    if per_round_counters:
+        create_degree_receiver_round_counter_synapses(
+            input_graph=input_graph,
+            mdsa_snn=mdsa_snn,
+            run_config=run_config,
+        )
+
     create_degree_receiver_next_round_synapses(
         input_graph=input_graph,
         mdsa_snn=mdsa_snn,
@@ -204,6 +213,38 @@ def create_degree_receiver_counter_synapses(
                 )
 
 
+def create_degree_receiver_round_counter_synapses(
+    *,
+    input_graph: nx.Graph,
+    mdsa_snn: nx.DiGraph,
+    run_config: Run_config,
+) -> None:
+    """Creates the outgoing synapses from the degree_receiver nodes of every
+    round, to the round_counter node of that round in the MDSA algorithm."""
+
+    # Create synapse to round_counter neuron.
+    for node_index in input_graph.nodes:
+        for neighbour_index in nx.all_neighbors(input_graph, node_index):
+            if node_index != neighbour_index:
+                for m_val in range(
+                    0, run_config.algorithm["MDSA"]["m_val"] + 1
+                ):
+                    mdsa_snn.add_edges_from(
+                        [
+                            (
+                                f"degree_receiver_{node_index}_"
+                                + f"{neighbour_index}_{m_val}",
+                                f"round_counter_{neighbour_index}_{m_val}",
+                            )
+                        ],
+                        synapse=Synapse(
+                            weight=1,
+                            delay=0,
+                            change_per_t=0,
+                        ),
+                    )
+
+
 def create_degree_receiver_next_round_synapses(
     *,
     input_graph: nx.Graph,
@@ -279,6 +320,11 @@ def create_outgoing_rand_synapses(
 ) -> None:
     """Creates the outgoing synapses for the selector node in the MDSA
     algorithm."""
+    # Convert the random edge weights into an array once, such that each
+    # synapse indexes the array.
+    rand_edge_weights: np.ndarray = np.asarray(
+        input_graph.graph["alg_props"]["rand_edge_weights"]
+    )
     # Add synapse between selectorom node and degree receiver nodes.
     for node_index in input_graph.nodes:
         for circuit_target in input_graph.nodes:
@@ -297,9 +343,7 @@ def create_outgoing_rand_synapses(
                                 )
                             ],
                             synapse=Synapse(
-                                weight=input_graph.graph["alg_props"][
-                                    "rand_edge_weights"
-                                ][node_index],
+                                weight=int(rand_edge_weights[node_index]),
                                 delay=0,
                                 change_per_t=0,
                             ),
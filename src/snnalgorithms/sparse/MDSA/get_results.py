@@ -1,8 +1,9 @@
 """Computes which nodes are selected by the MDSA algorithm presented by Alipour
 et al."""
-from typing import Dict
+from typing import Dict, List
 
 import networkx as nx
+import numpy as np
 from snncompare.results_helper import (
     compute_marks_for_m_larger_than_one,
     set_node_default_values,
@@ -56,3 +57,85 @@ def get_neumann_results(
             "countermarks"
         ]
     return counter_marks
+
+
+# pylint: disable=R0914
+@typechecked
+def get_neumann_results_for_all_m(
+    *,
+    input_graph: nx.Graph,
+    max_m_val: int,
+    rand_props: Dict,
+) -> np.ndarray:
+    """Returns the counter marks of every node, for every m_val in
+    0..max_m_val, computed in a single run of the Alipour algorithm.
+
+    The algorithm is iterative, so the marks for m=k are an intermediate
+    state of the computation for m=max_m_val>k. Row m of the returned
+    (max_m_val+1) x n array contains the countermarks that
+    get_neumann_results returns for m_val=m. The input graph is not
+    modified.
+
+    :param input_graph: The original graph on which the MDSA algorithm is
+        ran.
+    :param max_m_val: The largest amount of approximation iterations for
+        which the marks are returned.
+    :param rand_props: The random initialisation properties of the graph.
+    """
+    if max_m_val < 0:
+        raise ValueError(
+            f"Error, max_m_val should be 0 or larger, it is:{max_m_val}."
+        )
+    nr_of_nodes: int = len(input_graph)
+    mark_increment: int = rand_props["rand_ceil"] + 1
+
+    # Reverse list cause the random numbers are subtracted in the edge weights.
+    # (Same as in get_neumann_results.)
+    random_numbers = np.array(rand_props["rand_nrs"][::-1], dtype=np.int64)
+
+    # Store the neighbours of each node as a flat array, with the neighbours
+    # of node i in: neighbours[row_starts[i]:row_starts[i+1]].
+    neighbour_lists: List[List[int]] = [
+        list(nx.all_neighbors(input_graph, node_index))
+        for node_index in range(0, nr_of_nodes)
+    ]
+    degrees = np.array([len(x) for x in neighbour_lists], dtype=np.int64)
+    if nr_of_nodes == 0 or np.any(degrees == 0):
+        raise ValueError(
+            "Error, every node in the input graph needs at least 1 neighbour."
+        )
+    neighbours = np.concatenate(
+        [np.array(x, dtype=np.int64) for x in neighbour_lists]
+    )
+    row_starts = np.concatenate(([0], np.cumsum(degrees)[:-1]))
+
+    all_counter_marks = np.zeros((max_m_val + 1, nr_of_nodes), dtype=np.int64)
+    marks = degrees * mark_increment
+    for m_val in range(0, max_m_val + 1):
+        weights = marks + random_numbers
+        neighbour_weights = weights[neighbours]
+
+        # Each node gives a mark to its neighbour(s) with the highest weight.
+        max_weights = np.maximum.reduceat(neighbour_weights, row_starts)
+        is_marked = neighbour_weights == np.repeat(max_weights, degrees)
+        counter_marks = np.bincount(
+            neighbours[is_marked], minlength=nr_of_nodes
+        )
+
+        all_counter_marks[m_val, :] = counter_marks
+        marks = counter_marks * mark_increment
+    return all_counter_marks
+
+
+@typechecked
+def get_counter_marks_for_m_val(
+    *,
+    all_counter_marks: np.ndarray,
+    m_val: int,
+) -> Dict[str, int]:
+    """Returns the counter marks for a single m_val, from the output of
+    get_neumann_results_for_all_m, in the format of get_neumann_results."""
+    return {
+        f"counter_{node_index}": int(count)
+        for node_index, count in enumerate(all_counter_marks[m_val])
+    }
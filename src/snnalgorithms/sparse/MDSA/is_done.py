@@ -1,8 +1,16 @@
 """Determines whether the snn algorithm is done."""
+import weakref
+from typing import Dict, List, Optional
+
 import networkx as nx
 from snncompare.run_config.Run_config import Run_config
 from typeguard import typechecked
 
+# Caches the names of the neurons that contain an identifier, per snn graph,
+# such that the graph is only scanned once, instead of at every timestep.
+# Stores: {snn_graph: (nr_of_nodes, {identifier: neuron_names})}.
+neuron_names_per_graph: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 @typechecked
 def mdsa_is_done(
@@ -26,26 +34,15 @@ def mdsa_is_done(
             # Radiation may have killed any neuron. This may have arbitrarily
             # caused the neuron to not spike. This algorithm requires that
             # at least 1 selector neuron is firing within if t>1.
-            for node_name in snn_graph.nodes:
-                if a_nx_neuron_is_spiking(
-                    identifier="selector",
-                    snn_graph=snn_graph,
-                    t=t,
-                ) or a_nx_neuron_is_spiking(
-                    identifier="next_round",
-                    snn_graph=snn_graph,
-                    t=t,
-                ):
-                    return False
-                if "terminator" in node_name:
-                    if (
-                        snn_graph.nodes[node_name]["nx_lif"][t].spikes
-                        and t > 0
-                    ):
-                        return True
-            if t > 0:
-                return True
-            return False
+            if t == 0:
+                return False
+            # The network is done once no selector or next_round neuron
+            # spikes anymore. The check stops at the first spiking neuron.
+            return not a_nx_neuron_is_spiking(
+                identifier="selector", snn_graph=snn_graph, t=t
+            ) and not a_nx_neuron_is_spiking(
+                identifier="next_round", snn_graph=snn_graph, t=t
+            )
         return False
     raise KeyError("Algorithm termination mode not yet found.")
 
@@ -53,9 +50,39 @@ def mdsa_is_done(
 def a_nx_neuron_is_spiking(
     *, t: int, snn_graph: nx.DiGraph, identifier: str
 ) -> bool:
-    """Returns True if a nextround neuron is spiking at timestep t."""
-    for node_name in snn_graph.nodes:
-        if identifier in node_name:
-            if snn_graph.nodes[node_name]["nx_lif"][t].spikes and t > 0:
-                return True
-    return False
+    """Returns True if a neuron that contains the identifier is spiking at
+    timestep t. Stops at the first spiking neuron."""
+    if t == 0:
+        return False
+    return any(
+        snn_graph.nodes[node_name]["nx_lif"][t].spikes
+        for node_name in get_neuron_names_with_identifier(
+            identifier=identifier, snn_graph=snn_graph
+        )
+    )
+
+
+# Not typechecked, because it is called at every timestep.
+def get_neuron_names_with_identifier(
+    *, identifier: str, snn_graph: nx.DiGraph
+) -> List[str]:
+    """Returns the names of the neurons that contain the identifier.
+
+    The names are computed once per graph and identifier, and cached
+    until the number of neurons in the graph changes.
+    """
+    nr_of_nodes: Optional[int]
+    cached_names: Dict[str, List[str]]
+    nr_of_nodes, cached_names = neuron_names_per_graph.get(
+        snn_graph, (None, {})
+    )
+    if nr_of_nodes != len(snn_graph):
+        cached_names = {}
+        neuron_names_per_graph[snn_graph] = (len(snn_graph), cached_names)
+    if identifier not in cached_names:
+        cached_names[identifier] = [
+            node_name
+            for node_name in snn_graph.nodes
+            if identifier in node_name
+        ]
+    return cached_names[identifier]
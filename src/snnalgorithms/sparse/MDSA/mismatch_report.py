@@ -0,0 +1,199 @@
+"""Records the differences between the SNN and Neumann MDSA results, without
+raising an error, such that all mismatches of a (long) run are stored in a
+compact report file. The behaviour of the mismatching SNNs can be plotted
+later, on demand, in a separate step.
+
+A report file contains one json dict per line, with the keys: run_hash,
+graph_name, node, expected, actual.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.export_plots.create_dash_plot import create_svg_plot
+from snncompare.export_plots.temp_default_output_creation import (
+    create_default_output_config,
+)
+from snncompare.optional_config import Output_config
+from snncompare.run_config.Run_config import Run_config
+from typeguard import typechecked
+
+from snnalgorithms.helper import get_run_config_hash
+
+
+@typechecked
+def get_mismatch_records(
+    *,
+    actual_node_names: Dict,
+    expected_node_names: Dict[str, int],
+    graph_name: str,
+    run_config: Run_config,
+) -> List[Dict]:
+    """Returns a mismatch record for each node of which the SNN count is not
+    equal to the default/Neumann count.
+
+    Nodes that are missing in either of the results are recorded with
+    None as count. Raises an error if the passed boolean of the SNN
+    results does not agree with the mismatches.
+    """
+    run_hash: str = get_run_config_hash(run_config=run_config)
+    mismatching_node_names: List[str] = get_mismatching_node_names(
+        actual_node_names=actual_node_names,
+        expected_node_names=expected_node_names,
+    )
+    verify_passed_bool(
+        actual_node_names=actual_node_names,
+        has_mismatches=bool(mismatching_node_names),
+    )
+    mismatch_records: List[Dict] = []
+    for node_name in mismatching_node_names:
+        mismatch_records.append(
+            {
+                "run_hash": run_hash,
+                "graph_name": graph_name,
+                "node": node_name,
+                "expected": expected_node_names.get(node_name),
+                "actual": actual_node_names.get(node_name),
+            }
+        )
+    return mismatch_records
+
+
+@typechecked
+def get_mismatching_node_names(
+    *,
+    actual_node_names: Dict,
+    expected_node_names: Dict[str, int],
+) -> List[str]:
+    """Returns the sorted names of the nodes of which the SNN count is not
+    equal to the default/Neumann count, including nodes that are missing
+    in either of the results."""
+    node_names: List[str] = sorted(
+        set(expected_node_names.keys())
+        | (set(actual_node_names.keys()) - {"passed"})
+    )
+    return [
+        node_name
+        for node_name in node_names
+        if expected_node_names.get(node_name)
+        != actual_node_names.get(node_name)
+    ]
+
+
+@typechecked
+def verify_passed_bool(
+    *, actual_node_names: Dict, has_mismatches: bool
+) -> None:
+    """Raises an error if the passed boolean in the SNN results does not
+    agree with the (absence of) mismatching node counts."""
+    if actual_node_names["passed"] == has_mismatches:
+        raise ValueError(
+            "Error, the passed boolean in the SNN results is: "
+            + f"{actual_node_names['passed']}, yet the SNN and Neumann mark "
+            + f"counts contain mismatches: {has_mismatches}."
+        )
+
+
+@typechecked
+def export_mismatch_records(
+    *, mismatch_records: List[Dict], report_filepath: str
+) -> None:
+    """Appends the mismatch records to the report file, one json dict per
+    line."""
+    if not mismatch_records:
+        return
+    Path(report_filepath).parent.mkdir(parents=True, exist_ok=True)
+    with open(report_filepath, "a", encoding="utf-8") as report_file:
+        for mismatch_record in mismatch_records:
+            report_file.write(json.dumps(mismatch_record) + "\n")
+
+
+@typechecked
+def load_mismatch_records(
+    *, report_filepath: str, run_hash: Optional[str] = None
+) -> List[Dict]:
+    """Returns the mismatch records in a report file.
+
+    If a run_hash is given, only the records of that run are returned.
+    """
+    if not Path(report_filepath).is_file():
+        return []
+    mismatch_records: List[Dict] = []
+    with open(report_filepath, encoding="utf-8") as report_file:
+        for line in report_file:
+            if line.strip():
+                mismatch_record = json.loads(line)
+                if run_hash in (None, mismatch_record["run_hash"]):
+                    mismatch_records.append(mismatch_record)
+    return mismatch_records
+
+
+# @typechecked # TODO: restore.
+def plot_mismatching_snn_behaviour(
+    *,
+    exp_config: Exp_config,
+    graph_names: List[str],
+    graphs_dict: Dict,
+    output_config: Output_config,
+    run_config: Run_config,
+) -> None:
+    """Creates the svg plots of the snn behaviour of the graphs of which the
+    results did not match the default/Neumann results."""
+    if "hover_info" not in output_config.__dict__.keys():
+        output_config = create_default_output_config(
+            exp_config=exp_config,
+        )
+    # Override output config from exp_config.
+    output_config.extra_storing_config.show_images = True
+    output_config.hover_info.neuron_properties = [
+        "spikes",
+        "a_in_next",
+        "bias",
+        "du",
+        "u",
+        "dv",
+        "v",
+        "vth",
+    ]
+
+    create_svg_plot(
+        graph_names=graph_names,
+        graphs=graphs_dict,
+        output_config=output_config,
+        run_config=run_config,
+    )
+
+
+# @typechecked # TODO: restore.
+def plot_mismatch_records(
+    *,
+    exp_config: Exp_config,
+    graphs_dict: Dict,
+    output_config: Output_config,
+    report_filepath: str,
+    run_config: Run_config,
+) -> None:
+    """Plots the snn behaviour of each graph of the run configuration that
+    has at least one mismatch record in the report file.
+
+    The graphs_dict contains the (loaded) graphs of that run
+    configuration.
+    """
+    mismatch_records: List[Dict] = load_mismatch_records(
+        report_filepath=report_filepath,
+        run_hash=get_run_config_hash(run_config=run_config),
+    )
+    graph_names: List[str] = []
+    for mismatch_record in mismatch_records:
+        if mismatch_record["graph_name"] not in graph_names:
+            graph_names.append(mismatch_record["graph_name"])
+
+    if graph_names:
+        plot_mismatching_snn_behaviour(
+            exp_config=exp_config,
+            graph_names=graph_names,
+            graphs_dict=graphs_dict,
+            output_config=output_config,
+            run_config=run_config,
+        )
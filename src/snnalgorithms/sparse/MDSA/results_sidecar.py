@@ -0,0 +1,120 @@
+"""Stores the results dict of the MDSA snn graphs of a run in a small json
+sidecar file, such that the results of an already completed stage 4 can be
+read without loading the (large) simulated graphs.
+
+The sidecar file of a run is named after the hash of its run
+configuration, and contains a dict with the results per graph name. The
+sidecar files are only read and written if a results_sidecar_dir is
+given.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from snncompare.run_config.Run_config import Run_config
+from typeguard import typechecked
+
+from snnalgorithms.helper import get_run_config_hash
+
+
+@typechecked
+def get_results_sidecar_filepath(
+    *, results_sidecar_dir: str, run_config: Run_config
+) -> str:
+    """Returns the filepath of the results sidecar of a run configuration."""
+    run_hash: str = get_run_config_hash(run_config=run_config)
+    return os.path.join(results_sidecar_dir, f"{run_hash}.json")
+
+
+@typechecked
+def get_results_graph_name(
+    *, with_adaptation: bool, with_radiation: bool
+) -> str:
+    """Returns the name of the snn graph with(out) adaptation and/or
+    radiation."""
+    graph_name: str = (
+        "adapted_snn_graph" if with_adaptation else "snn_algo_graph"
+    )
+    if with_radiation:
+        return f"rad_{graph_name}"
+    return graph_name
+
+
+@typechecked
+def load_results_from_sidecar(
+    *,
+    results_sidecar_dir: Optional[str],
+    run_config: Run_config,
+    with_adaptation: bool,
+    with_radiation: bool,
+) -> Optional[Dict]:
+    """Returns the stored results of a graph of a run configuration, or None
+    if they are not stored, or if no results_sidecar_dir is given."""
+    if results_sidecar_dir is None:
+        return None
+    sidecar_filepath: str = get_results_sidecar_filepath(
+        results_sidecar_dir=results_sidecar_dir, run_config=run_config
+    )
+    if not Path(sidecar_filepath).is_file():
+        return None
+    with open(sidecar_filepath, encoding="utf-8") as sidecar_file:
+        results_per_graph: Dict[str, Dict] = json.load(sidecar_file)
+    return results_per_graph.get(
+        get_results_graph_name(
+            with_adaptation=with_adaptation, with_radiation=with_radiation
+        )
+    )
+
+
+@typechecked
+def store_results_in_sidecar(
+    *,
+    results: Dict,
+    results_sidecar_dir: Optional[str],
+    run_config: Run_config,
+    with_adaptation: bool,
+    with_radiation: bool,
+) -> None:
+    """Stores the results of a graph of a run configuration in its sidecar
+    file, next to the results of the other graphs of that run.
+
+    Does nothing if no results_sidecar_dir is given, or if the same
+    results are stored already.
+    """
+    if results_sidecar_dir is None:
+        return
+    sidecar_filepath: str = get_results_sidecar_filepath(
+        results_sidecar_dir=results_sidecar_dir, run_config=run_config
+    )
+    graph_name: str = get_results_graph_name(
+        with_adaptation=with_adaptation, with_radiation=with_radiation
+    )
+    results_per_graph: Dict[str, Dict] = {}
+    if Path(sidecar_filepath).is_file():
+        with open(sidecar_filepath, encoding="utf-8") as sidecar_file:
+            results_per_graph = json.load(sidecar_file)
+    if results_per_graph.get(graph_name) == results:
+        # The results were read from the sidecar, or are stored already.
+        return
+    results_per_graph[graph_name] = results
+
+    # Write to a temporary file first, such that an interrupted write
+    # does not leave a corrupt sidecar file.
+    Path(sidecar_filepath).parent.mkdir(parents=True, exist_ok=True)
+    temp_filepath: str = f"{sidecar_filepath}.tmp"
+    with open(temp_filepath, "w", encoding="utf-8") as temp_file:
+        json.dump(results_per_graph, temp_file, default=to_json_number)
+    os.replace(temp_filepath, sidecar_filepath)
+
+
+@typechecked
+def to_json_number(some_value: Any) -> Any:
+    """Converts numpy numbers, such as the simsnn multimeter currents, into
+    Python numbers that can be stored in json."""
+    if hasattr(some_value, "item"):
+        return some_value.item()
+    raise TypeError(
+        f"Error, type:{type(some_value)} of:{some_value} is not json "
+        + "serializable."
+    )
@@ -111,6 +111,24 @@ def counter_xy(
     return x, y
 
 
+@typechecked
+def round_counter_xy(
+    *,
+    dx_node: float,
+    dy_node: float,
+    m_val: int,
+    sum_height: float,
+) -> Tuple[float, float]:
+    """Returns the  x and y coordinates of a round_counter node.
+
+    Same x-coordinate as the selector node of that round, halfway below
+    it.
+    """
+    x = dx_node * (4 + 2 * m_val)
+    y = sum_height + 0.5 * dy_node
+    return x, y
+
+
 @typechecked
 def terminator_xy(
     *,
@@ -140,6 +158,7 @@ def next_round_xy(
 
 
 # pylint: disable=R0911
+# pylint: disable=R0912
 # pylint: disable=R0913
 @typechecked
 def get_node_position(
@@ -218,6 +237,14 @@ def get_node_position(
             sum_height=sum_height,
         )
 
+    if node_name == "round_counter":
+        return round_counter_xy(
+            dx_node=dx_node,
+            dy_node=dy_node,
+            m_val=identifiers[1].value,
+            sum_height=sum_height,
+        )
+
     if node_name == "next_round":
         return next_round_xy(
             dx_node=dx_node,
@@ -0,0 +1,61 @@
+"""Tests whether the dead (counter) neurons of an snn are detected."""
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.sparse.MDSA.apply_results_to_graphs import (
+    counter_neuron_died,
+    graph_has_dead_neurons,
+)
+
+
+class Test_dead_neurons(unittest.TestCase):
+    """Tests whether the dead (counter) neurons of an snn are detected."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.snn_graph = nx.DiGraph()
+        self.snn_graph.add_nodes_from(
+            ["counter_0", "counter_1", "r_2_counter_0", "r_2_counter_1"]
+        )
+
+    @typechecked
+    def test_snn_without_rad_death_has_no_dead_neurons(self) -> None:
+        """Verifies no neuron died if the rad_death key is not set."""
+        self.assertFalse(graph_has_dead_neurons(snn_graph=self.snn_graph))
+        self.assertFalse(
+            counter_neuron_died(
+                snn_graph=self.snn_graph, counter_neuron_name="counter_0"
+            )
+        )
+
+    @typechecked
+    def test_rad_death_is_read_per_neuron(self) -> None:
+        """Verifies the rad_death state of each counter neuron is returned."""
+        snn_graph = self.snn_graph.copy()
+        for node_name in snn_graph.nodes:
+            snn_graph.nodes[node_name]["rad_death"] = node_name == "counter_1"
+
+        self.assertTrue(graph_has_dead_neurons(snn_graph=snn_graph))
+        self.assertFalse(
+            counter_neuron_died(
+                snn_graph=snn_graph, counter_neuron_name="counter_0"
+            )
+        )
+        self.assertTrue(
+            counter_neuron_died(
+                snn_graph=snn_graph, counter_neuron_name="counter_1"
+            )
+        )
+
+    @typechecked
+    def test_partial_rad_death_raises_error(self) -> None:
+        """Verifies an error is raised if the rad_death key is set on some,
+        but not all neurons."""
+        snn_graph = self.snn_graph.copy()
+        snn_graph.nodes["counter_0"]["rad_death"] = True
+        with self.assertRaises(KeyError):
+            graph_has_dead_neurons(snn_graph=snn_graph)
@@ -0,0 +1,84 @@
+"""Tests whether the counter marks of all m_vals, computed in a single run,
+are equal to the counter marks computed per m_val."""
+import copy
+import unittest
+from typing import Dict, List
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.get_input_graphs import (
+    add_mdsa_initialisation_properties_to_input_graph,
+)
+from snnalgorithms.sparse.MDSA.get_results import (
+    get_counter_marks_for_m_val,
+    get_neumann_results,
+    get_neumann_results_for_all_m,
+)
+
+
+class Test_get_results(unittest.TestCase):
+    """Tests whether get_neumann_results_for_all_m returns the same counter
+    marks as get_neumann_results, for each m_val."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.max_m_val: int = 4
+        self.seed: int = 42
+        self.input_graphs: List[nx.Graph] = [
+            nx.path_graph(5),
+            nx.cycle_graph(6),
+            nx.petersen_graph(),
+            nx.connected_watts_strogatz_graph(10, 4, 0.3, seed=self.seed),
+        ]
+        for input_graph in self.input_graphs:
+            add_mdsa_initialisation_properties_to_input_graph(
+                input_graph=input_graph, seed=self.seed
+            )
+
+    @typechecked
+    def test_all_m_vals_equal_individual_m_vals(self) -> None:
+        """Verifies the counter marks of every m_val are identical to the
+        counter marks of get_neumann_results for that m_val."""
+        for input_graph in self.input_graphs:
+            rand_props: Dict = input_graph.graph["alg_props"]
+            all_counter_marks = get_neumann_results_for_all_m(
+                input_graph=input_graph,
+                max_m_val=self.max_m_val,
+                rand_props=rand_props,
+            )
+            self.assertEqual(
+                all_counter_marks.shape,
+                (self.max_m_val + 1, len(input_graph)),
+            )
+
+            for m_val in range(0, self.max_m_val + 1):
+                expected_counter_marks: Dict[str, int] = get_neumann_results(
+                    input_graph=copy.deepcopy(input_graph),
+                    m_val=m_val,
+                    rand_props=rand_props,
+                    seed=self.seed,
+                    size=len(input_graph),
+                )
+                self.assertEqual(
+                    get_counter_marks_for_m_val(
+                        all_counter_marks=all_counter_marks, m_val=m_val
+                    ),
+                    expected_counter_marks,
+                )
+
+    @typechecked
+    def test_input_graph_is_not_modified(self) -> None:
+        """Verifies get_neumann_results_for_all_m does not modify the input
+        graph."""
+        input_graph = self.input_graphs[0]
+        original = copy.deepcopy(input_graph)
+        get_neumann_results_for_all_m(
+            input_graph=input_graph,
+            max_m_val=self.max_m_val,
+            rand_props=input_graph.graph["alg_props"],
+        )
+        self.assertEqual(dict(input_graph.nodes), dict(original.nodes))
+        self.assertEqual(list(input_graph.edges), list(original.edges))
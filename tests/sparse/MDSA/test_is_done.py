@@ -0,0 +1,91 @@
+"""Tests whether the spiking selector and next_round neurons are detected in
+the MDSA termination check."""
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.sparse.MDSA.is_done import (
+    a_nx_neuron_is_spiking,
+    get_neuron_names_with_identifier,
+)
+
+
+# pylint: disable=R0903
+class Spiking_neuron:
+    """Contains whether a neuron spikes at a timestep."""
+
+    @typechecked
+    def __init__(self, spikes: bool) -> None:
+        self.spikes = spikes
+
+
+class Test_is_done(unittest.TestCase):
+    """Tests whether the spiking selector and next_round neurons are detected
+    in the MDSA termination check."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.snn_graph = nx.DiGraph()
+        # selector_1 spikes at t=1, next_round at t=2, nothing at t=3.
+        self.snn_graph.add_node(
+            "selector_0",
+            nx_lif=[Spiking_neuron(bool(spikes)) for spikes in [1, 0, 0, 0]],
+        )
+        self.snn_graph.add_node(
+            "selector_1",
+            nx_lif=[Spiking_neuron(bool(spikes)) for spikes in [1, 1, 0, 0]],
+        )
+        self.snn_graph.add_node(
+            "next_round",
+            nx_lif=[Spiking_neuron(bool(spikes)) for spikes in [0, 0, 1, 0]],
+        )
+        self.snn_graph.add_node(
+            "counter_0",
+            nx_lif=[Spiking_neuron(True) for _ in range(0, 4)],
+        )
+
+    @typechecked
+    def test_spiking_neuron_per_identifier(self) -> None:
+        """Verifies a spiking neuron is found per identifier and timestep,
+        and that t=0 is never spiking."""
+        for identifier, expected_spikes in [
+            ("selector", [False, True, False, False]),
+            ("next_round", [False, False, True, False]),
+        ]:
+            for t, expected_spike in enumerate(expected_spikes):
+                self.assertEqual(
+                    a_nx_neuron_is_spiking(
+                        t=t, snn_graph=self.snn_graph, identifier=identifier
+                    ),
+                    expected_spike,
+                )
+
+    @typechecked
+    def test_neuron_names_are_recomputed_on_new_nodes(self) -> None:
+        """Verifies the cached neuron names are updated if neurons are added
+        to the graph."""
+        snn_graph = self.snn_graph.copy()
+        self.assertEqual(
+            get_neuron_names_with_identifier(
+                identifier="selector", snn_graph=snn_graph
+            ),
+            ["selector_0", "selector_1"],
+        )
+        snn_graph.add_node(
+            "selector_2",
+            nx_lif=[Spiking_neuron(bool(spikes)) for spikes in [0, 0, 0, 1]],
+        )
+        self.assertEqual(
+            get_neuron_names_with_identifier(
+                identifier="selector", snn_graph=snn_graph
+            ),
+            ["selector_0", "selector_1", "selector_2"],
+        )
+        self.assertTrue(
+            a_nx_neuron_is_spiking(
+                t=3, snn_graph=snn_graph, identifier="selector"
+            )
+        )
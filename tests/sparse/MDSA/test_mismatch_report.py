@@ -0,0 +1,108 @@
+"""Tests whether the mismatches between the SNN and Neumann MDSA results are
+detected and stored in a report file."""
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+from typeguard import typechecked
+
+from snnalgorithms.sparse.MDSA.mismatch_report import (
+    export_mismatch_records,
+    get_mismatching_node_names,
+    load_mismatch_records,
+    verify_passed_bool,
+)
+
+
+class Test_mismatch_report(unittest.TestCase):
+    """Tests whether the mismatches between the SNN and Neumann MDSA results
+    are detected and stored in a report file."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.expected_node_names: Dict[str, int] = {
+            "counter_0": 2,
+            "counter_1": 0,
+            "counter_2": 1,
+        }
+
+    @typechecked
+    def test_mismatching_node_names(self) -> None:
+        """Verifies different and missing node counts are detected."""
+        actual_node_names: Dict = {
+            "counter_0": 2,
+            "counter_1": 1,
+            "counter_3": 1,
+            "passed": False,
+        }
+        self.assertEqual(
+            get_mismatching_node_names(
+                actual_node_names=actual_node_names,
+                expected_node_names=self.expected_node_names,
+            ),
+            ["counter_1", "counter_2", "counter_3"],
+        )
+
+        actual_node_names = dict(self.expected_node_names, passed=True)
+        self.assertEqual(
+            get_mismatching_node_names(
+                actual_node_names=actual_node_names,
+                expected_node_names=self.expected_node_names,
+            ),
+            [],
+        )
+
+    @typechecked
+    def test_inconsistent_passed_bool_raises_error(self) -> None:
+        """Verifies an error is raised if the passed boolean does not agree
+        with the mismatches."""
+        verify_passed_bool(
+            actual_node_names={"passed": True}, has_mismatches=False
+        )
+        verify_passed_bool(
+            actual_node_names={"passed": False}, has_mismatches=True
+        )
+        with self.assertRaises(ValueError):
+            verify_passed_bool(
+                actual_node_names={"passed": False}, has_mismatches=False
+            )
+        with self.assertRaises(ValueError):
+            verify_passed_bool(
+                actual_node_names={"passed": True}, has_mismatches=True
+            )
+
+    @typechecked
+    def test_report_file_round_trip(self) -> None:
+        """Verifies the exported mismatch records are loaded per run."""
+        mismatch_records: List[Dict] = [
+            {
+                "run_hash": run_hash,
+                "graph_name": "snn_algo_graph",
+                "node": "counter_1",
+                "expected": 0,
+                "actual": 1,
+            }
+            for run_hash in ["first_run", "second_run"]
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_filepath: str = os.path.join(tmp_dir, "report.jsonl")
+            export_mismatch_records(
+                mismatch_records=mismatch_records,
+                report_filepath=report_filepath,
+            )
+            self.assertEqual(
+                load_mismatch_records(report_filepath=report_filepath),
+                mismatch_records,
+            )
+            self.assertEqual(
+                load_mismatch_records(
+                    report_filepath=report_filepath, run_hash="second_run"
+                ),
+                mismatch_records[1:],
+            )
+        self.assertEqual(
+            load_mismatch_records(report_filepath=report_filepath), []
+        )
@@ -0,0 +1,76 @@
+"""Tests whether the counts of an adapted snn are read out with a majority
+vote over the original and redundant counter neurons."""
+import unittest
+from typing import Dict, List
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.sparse.MDSA.apply_results_to_graphs import (
+    get_nx_LIF_count_with_redundancy,
+)
+
+
+# pylint: disable=R0903
+class Current:
+    """Stores the current u of a neuron, like the nx LIF_neuron does."""
+
+    @typechecked
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    @typechecked
+    def get(self) -> float:
+        """Returns the current."""
+        return self.value
+
+
+# pylint: disable=R0903
+class Counter_neuron:
+    """Contains the current u of a counter neuron at a timestep."""
+
+    @typechecked
+    def __init__(self, u: float) -> None:
+        self.u = Current(u)
+
+
+class Test_redundant_readout(unittest.TestCase):
+    """Tests whether the counts of an adapted snn are read out with a
+    majority vote over the original and redundant counter neurons."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.input_graph: nx.Graph = nx.path_graph(3)
+        self.red_level: int = 2
+
+        # The counts of: counter_<node>, r_1_counter_<node>,
+        # r_2_counter_<node>, for node 0,1 and 2.
+        self.counts_per_node: Dict[int, List[float]] = {
+            0: [2.0, 2.0, 2.0],
+            1: [1.0, 3.0, 3.0],
+            2: [-1.0, -2.0, 0.0],
+        }
+        self.adapted_snn = nx.DiGraph()
+        for node_index, counts in self.counts_per_node.items():
+            for prefix, count in zip(["", "r_1_", "r_2_"], counts):
+                self.adapted_snn.add_node(
+                    f"{prefix}counter_{node_index}",
+                    nx_lif=[Counter_neuron(0.0), Counter_neuron(count)],
+                )
+
+    @typechecked
+    def test_majority_vote_per_node(self) -> None:
+        """Verifies the most occurring non-negative count is returned per
+        node."""
+        self.assertEqual(
+            get_nx_LIF_count_with_redundancy(
+                input_graph=self.input_graph,
+                adapted_nx_snn_graph=self.adapted_snn,
+                red_level=self.red_level,
+                simulator="nx",
+                t=1,
+            ),
+            {"counter_0": 2.0, "counter_1": 3.0, "counter_2": 0.0},
+        )
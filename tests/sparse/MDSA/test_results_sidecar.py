@@ -0,0 +1,178 @@
+"""Tests whether the results of the MDSA snn graphs are stored in, and read
+from, the results sidecar files."""
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.run_config.Run_config import Run_config
+from typeguard import typechecked
+
+from snnalgorithms.sparse.MDSA.apply_results_to_graphs import (
+    set_and_verify_snn_results,
+)
+from snnalgorithms.sparse.MDSA.results_sidecar import (
+    get_results_sidecar_filepath,
+    load_results_from_sidecar,
+    store_results_in_sidecar,
+)
+from tests.sparse.MDSA.adaptation.redundancy_helper import (
+    create_default_output_config,
+    long_exp_config_for_mdsa_testing_with_adaptation,
+)
+
+
+class Test_results_sidecar(unittest.TestCase):
+    """Tests whether the results of the MDSA snn graphs are stored in, and
+    read from, the results sidecar files."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        exp_config = long_exp_config_for_mdsa_testing_with_adaptation()
+        exp_config.export_types = None
+        full_exp_runner = Experiment_runner(
+            exp_config=exp_config,
+            output_config=create_default_output_config(exp_config=exp_config),
+            reverse=False,
+            perform_run=False,
+            specific_run_config=None,
+        )
+        self.run_config: Run_config = full_exp_runner.run_configs[0]
+
+    @typechecked
+    def test_results_are_stored_per_graph(self) -> None:
+        """Verifies the results of each graph of a run are stored in a
+        single sidecar file in the results_sidecar_dir."""
+        with tempfile.TemporaryDirectory() as results_sidecar_dir:
+            for with_radiation in [False, True]:
+                store_results_in_sidecar(
+                    results={"counter_0": 1, "passed": not with_radiation},
+                    results_sidecar_dir=results_sidecar_dir,
+                    run_config=self.run_config,
+                    with_adaptation=False,
+                    with_radiation=with_radiation,
+                )
+            self.assertEqual(
+                os.listdir(results_sidecar_dir),
+                [
+                    os.path.basename(
+                        get_results_sidecar_filepath(
+                            results_sidecar_dir=results_sidecar_dir,
+                            run_config=self.run_config,
+                        )
+                    )
+                ],
+            )
+            for with_radiation in [False, True]:
+                self.assertEqual(
+                    load_results_from_sidecar(
+                        results_sidecar_dir=results_sidecar_dir,
+                        run_config=self.run_config,
+                        with_adaptation=False,
+                        with_radiation=with_radiation,
+                    ),
+                    {"counter_0": 1, "passed": not with_radiation},
+                )
+            self.assertIsNone(
+                load_results_from_sidecar(
+                    results_sidecar_dir=results_sidecar_dir,
+                    run_config=self.run_config,
+                    with_adaptation=True,
+                    with_radiation=False,
+                )
+            )
+
+    @typechecked
+    def test_sidecar_is_not_used_without_dir(self) -> None:
+        """Verifies no sidecar file is written or read if no
+        results_sidecar_dir is given."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cwd: str = os.getcwd()
+            os.chdir(tmp_dir)
+            try:
+                store_results_in_sidecar(
+                    results={"counter_0": 1, "passed": True},
+                    results_sidecar_dir=None,
+                    run_config=self.run_config,
+                    with_adaptation=False,
+                    with_radiation=False,
+                )
+                self.assertEqual(os.listdir(tmp_dir), [])
+                self.assertIsNone(
+                    load_results_from_sidecar(
+                        results_sidecar_dir=None,
+                        run_config=self.run_config,
+                        with_adaptation=False,
+                        with_radiation=False,
+                    )
+                )
+            finally:
+                os.chdir(cwd)
+
+    @typechecked
+    def test_same_results_are_not_rewritten(self) -> None:
+        """Verifies the sidecar file is not rewritten if the results of the
+        graph are stored already."""
+        with tempfile.TemporaryDirectory() as results_sidecar_dir:
+            sidecar_filepath: str = get_results_sidecar_filepath(
+                results_sidecar_dir=results_sidecar_dir,
+                run_config=self.run_config,
+            )
+            inodes = []
+            for passed in [True, True, False]:
+                store_results_in_sidecar(
+                    results={"counter_0": 1, "passed": passed},
+                    results_sidecar_dir=results_sidecar_dir,
+                    run_config=self.run_config,
+                    with_adaptation=False,
+                    with_radiation=False,
+                )
+                # A rewrite replaces the sidecar file with a new file.
+                inodes.append(os.stat(sidecar_filepath).st_ino)
+            self.assertEqual(inodes[0], inodes[1])
+            self.assertNotEqual(inodes[1], inodes[2])
+
+    @typechecked
+    def test_results_are_set_in_graph_order(self) -> None:
+        """Verifies the results of each graph are stored in its graph
+        attributes and in the sidecar, in the order of the graph names."""
+        stage_2_graphs = {
+            "input_graph": nx.path_graph(2),
+            "rad_snn_algo_graph": nx.DiGraph(),
+            "rad_adapted_snn_graph": nx.DiGraph(),
+        }
+        graph_names = ["rad_snn_algo_graph", "rad_adapted_snn_graph"]
+        with tempfile.TemporaryDirectory() as results_sidecar_dir:
+            set_and_verify_snn_results(
+                alipour_counter_marks={"counter_0": 1, "counter_1": 0},
+                exp_config=None,
+                mismatch_report_filepath=None,
+                output_config=None,
+                results_per_graph=iter(
+                    [
+                        {"counter_0": index, "passed": False}
+                        for index, _ in enumerate(graph_names)
+                    ]
+                ),
+                results_sidecar_dir=results_sidecar_dir,
+                run_config=self.run_config,
+                snn_graph_names=graph_names,
+                stage_2_graphs=stage_2_graphs,
+            )
+            for index, graph_name in enumerate(graph_names):
+                self.assertEqual(
+                    stage_2_graphs[graph_name].graph["results"],
+                    {"counter_0": index, "passed": False},
+                )
+                self.assertEqual(
+                    load_results_from_sidecar(
+                        results_sidecar_dir=results_sidecar_dir,
+                        run_config=self.run_config,
+                        with_adaptation=graph_name == "rad_adapted_snn_graph",
+                        with_radiation=True,
+                    ),
+                    {"counter_0": index, "passed": False},
+                )
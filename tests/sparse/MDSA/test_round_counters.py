@@ -0,0 +1,150 @@
+"""Tests whether the round_counter neurons of an MDSA snn store the counter
+marks of every round."""
+# pylint: disable=R0801
+import copy
+import unittest
+from typing import Dict, List
+
+import networkx as nx
+from snnbackends.networkx.run_on_networkx import (
+    create_neuron_for_next_timestep,
+    run_simulation_with_networkx_for_1_timestep,
+)
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.run_config.Run_config import Run_config
+from typeguard import typechecked
+
+from snnalgorithms.get_input_graphs import (
+    add_mdsa_initialisation_properties_to_input_graph,
+)
+from snnalgorithms.sparse.MDSA.apply_results_to_graphs import (
+    get_nx_LIF_count_per_round,
+)
+from snnalgorithms.sparse.MDSA.create_MDSA_snn_neurons import (
+    get_new_mdsa_graph,
+)
+from snnalgorithms.sparse.MDSA.get_results import (
+    get_counter_marks_for_m_val,
+    get_neumann_results_for_all_m,
+)
+from tests.sparse.MDSA.adaptation.redundancy_helper import (
+    create_default_output_config,
+    long_exp_config_for_mdsa_testing_with_adaptation,
+)
+
+
+class Test_round_counters(unittest.TestCase):
+    """Tests whether the counts of the round_counter neurons are equal to the
+    Neumann counter marks of every round."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.m_vals: List[int] = [1, 3, 5]
+        self.max_timesteps: int = 1000
+
+        exp_config = long_exp_config_for_mdsa_testing_with_adaptation()
+        exp_config.export_types = None
+        full_exp_runner = Experiment_runner(
+            exp_config=exp_config,
+            output_config=create_default_output_config(exp_config=exp_config),
+            reverse=False,
+            perform_run=False,
+            specific_run_config=None,
+        )
+        # Get one nx run_config per tested m_val.
+        self.run_configs: Dict[int, Run_config] = {}
+        for run_config in full_exp_runner.run_configs:
+            m_val: int = run_config.algorithm["MDSA"]["m_val"]
+            if m_val in self.m_vals and run_config.simulator == "nx":
+                self.run_configs.setdefault(m_val, run_config)
+
+    @typechecked
+    def test_round_counts_equal_neumann_results(self) -> None:
+        """Verifies the round counts of a single simulation equal the counter
+        marks of get_neumann_results_for_all_m, for several m_vals."""
+        self.assertEqual(sorted(self.run_configs.keys()), self.m_vals)
+        for m_val, run_config in self.run_configs.items():
+            input_graph: nx.Graph = nx.cycle_graph(run_config.graph_size)
+            add_mdsa_initialisation_properties_to_input_graph(
+                input_graph=input_graph, seed=run_config.seed
+            )
+            snn_graph: nx.DiGraph = get_new_mdsa_graph(
+                run_config=run_config,
+                input_graph=input_graph,
+                per_round_counters=True,
+            )
+
+            t: int = simulate_until_terminator_spikes(
+                max_timesteps=self.max_timesteps, snn_graph=snn_graph
+            )
+            round_counts: Dict[
+                int, Dict[str, int]
+            ] = get_nx_LIF_count_per_round(
+                input_graph=input_graph,
+                m_val=m_val,
+                snn=snn_graph,
+                simulator="nx",
+                t=t,
+            )
+
+            all_counter_marks = get_neumann_results_for_all_m(
+                input_graph=input_graph,
+                max_m_val=m_val,
+                rand_props=input_graph.graph["alg_props"],
+            )
+            for round_index in range(0, m_val + 1):
+                self.assertEqual(
+                    round_counts[round_index],
+                    get_counter_marks_for_m_val(
+                        all_counter_marks=all_counter_marks,
+                        m_val=round_index,
+                    ),
+                )
+
+    @typechecked
+    def test_redundant_snn_raises_error(self) -> None:
+        """Verifies the per round counts of a redundant snn are not read
+        out."""
+        run_config: Run_config = self.run_configs[self.m_vals[0]]
+        input_graph: nx.Graph = nx.cycle_graph(run_config.graph_size)
+        add_mdsa_initialisation_properties_to_input_graph(
+            input_graph=input_graph, seed=run_config.seed
+        )
+        snn_graph: nx.DiGraph = get_new_mdsa_graph(
+            run_config=run_config,
+            input_graph=input_graph,
+            per_round_counters=True,
+        )
+        snn_graph.add_node(
+            "r_1_round_counter_0_0",
+            **copy.deepcopy(snn_graph.nodes["round_counter_0_0"]),
+        )
+        with self.assertRaises(NotImplementedError):
+            get_nx_LIF_count_per_round(
+                input_graph=input_graph,
+                m_val=self.m_vals[0],
+                snn=snn_graph,
+                simulator="nx",
+                t=0,
+            )
+
+
+@typechecked
+def simulate_until_terminator_spikes(
+    *, max_timesteps: int, snn_graph: nx.DiGraph
+) -> int:
+    """Simulates the snn on networkx until the terminator node spikes, and
+    returns that timestep."""
+    for t in range(0, max_timesteps):
+        create_neuron_for_next_timestep(snn_graph=snn_graph, t=t)
+        run_simulation_with_networkx_for_1_timestep(
+            snn_graph=snn_graph, t=t + 1
+        )
+        if snn_graph.nodes["terminator_node"]["nx_lif"][t + 1].spikes:
+            return t + 1
+    raise TimeoutError(
+        f"Error, the terminator did not spike within {max_timesteps} "
+        + "timesteps."
+    )
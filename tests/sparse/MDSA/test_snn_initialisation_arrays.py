@@ -0,0 +1,83 @@
+"""Tests whether the array-native MDSA initialisation properties equal the
+list based initialisation properties, and are stored in binary files."""
+import json
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+import numpy as np
+from typeguard import typechecked
+
+from snnalgorithms.get_input_graphs import (
+    add_mdsa_initialisation_properties_to_input_graph,
+)
+from snnalgorithms.sparse.MDSA.SNN_initialisation_arrays import (
+    SNN_initialisation_arrays,
+    load_alg_props_arrays,
+)
+from snnalgorithms.sparse.MDSA.SNN_initialisation_properties import (
+    SNN_initialisation_properties,
+)
+
+
+class Test_snn_initialisation_arrays(unittest.TestCase):
+    """Tests whether the array-native MDSA initialisation properties equal
+    the list based initialisation properties."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.seed: int = 42
+
+    @typechecked
+    def test_arrays_equal_lists(self) -> None:
+        """Verifies the arrays contain the values of the lists, also if the
+        edge weights do not fit in int32, for n>=46342."""
+        for input_graph in [
+            nx.path_graph(5),
+            nx.cycle_graph(12),
+            nx.empty_graph(50000),
+        ]:
+            properties = SNN_initialisation_properties(input_graph, self.seed)
+            arrays = SNN_initialisation_arrays(input_graph, self.seed)
+            self.assertEqual(arrays.rand_ceil, properties.rand_ceil)
+            for name in ["rand_nrs", "rand_edge_weights"]:
+                self.assertEqual(getattr(arrays, name).dtype, np.int64)
+                self.assertEqual(
+                    getattr(arrays, name).tolist(), getattr(properties, name)
+                )
+        self.assertLess(min(arrays.rand_edge_weights), np.iinfo(np.int32).min)
+
+    @typechecked
+    def test_write_to_binary_keeps_input_graph(self) -> None:
+        """Verifies the properties are written to a binary file, without
+        changing the input graph."""
+        input_graph = nx.cycle_graph(8)
+        arrays = SNN_initialisation_arrays(input_graph, self.seed)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath: str = os.path.join(tmp_dir, "graph.snng")
+            arrays.write_to_binary(filepath=filepath, input_graph=input_graph)
+            self.assertNotIn("alg_props", input_graph.graph)
+
+            alg_props = load_alg_props_arrays(filepath=filepath)
+            self.assertEqual(alg_props["rand_ceil"], arrays.rand_ceil)
+            for name in ["rand_nrs", "rand_edge_weights"]:
+                self.assertEqual(
+                    alg_props[name].tolist(), getattr(arrays, name).tolist()
+                )
+
+    @typechecked
+    def test_input_graph_alg_props_are_json(self) -> None:
+        """Verifies the alg_props that are added to an input graph are lists,
+        such that the input graph can be stored as json."""
+        input_graph = nx.cycle_graph(8)
+        add_mdsa_initialisation_properties_to_input_graph(
+            input_graph, self.seed
+        )
+        alg_props = input_graph.graph["alg_props"]
+        self.assertEqual(
+            json.loads(json.dumps(alg_props)),
+            SNN_initialisation_properties(input_graph, self.seed).__dict__,
+        )
@@ -0,0 +1,145 @@
+"""Tests whether the adaptive Discovery search reports boxes of which the
+corners are simulated as neurons of type I."""
+import itertools
+import unittest
+from typing import Dict, Tuple
+
+import numpy as np
+from typeguard import typechecked
+
+from snnalgorithms.sparse.Discovery.adaptive_discovery import (
+    CELL_CORNER_OFFSETS,
+    CONTINUOUS_PARAMETER_NAMES,
+    Lattice_cache,
+    classify_cells,
+    get_feasible_boxes,
+    get_lattice_values,
+)
+from snnalgorithms.sparse.Discovery.batched_discovery import (
+    is_expected_neuron_I_batch,
+)
+
+
+class Test_adaptive_discovery(unittest.TestCase):
+    """Tests whether the adaptive Discovery search reports boxes of which
+    the corners are simulated as neurons of type I."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.bounds: Dict[str, Tuple[float, float]] = {
+            "du": (-1.0, 1.0),
+            "dv": (-1.0, 1.0),
+            "bias": (0.0, 10.0),
+            "vth": (0.0, 10.0),
+        }
+
+    @typechecked
+    def test_box_corners(self) -> None:
+        """Verifies all corners of the feasible boxes are of type I, the
+        boundary boxes have corners of both types, and that fewer neurons
+        are simulated than in a uniform grid of the finest resolution."""
+        boxes_per_combination, nr_of_simulated_neurons = get_feasible_boxes(
+            a_in_time=4,
+            a_in_range=[4],
+            bounds=self.bounds,
+            max_depth=2,
+            max_time=200,
+            weight_range=[9],
+        )
+        self.assertEqual(1, len(boxes_per_combination))
+        boxes = boxes_per_combination[0]
+        self.assertTrue(boxes.is_boundary.any())
+        self.assertFalse(boxes.is_boundary.all())
+        self.assertLess(nr_of_simulated_neurons, (10 * 2**2 + 1) ** 4)
+
+        # The corners of all boxes, shape (len(boxes) * 16, 4).
+        corners: np.ndarray = (
+            boxes.lower[:, np.newaxis, :]
+            + CELL_CORNER_OFFSETS[np.newaxis, :, :]
+            * (boxes.upper - boxes.lower)[:, np.newaxis, :]
+        ).reshape(-1, len(CONTINUOUS_PARAMETER_NAMES))
+        is_expected: np.ndarray = is_expected_neuron_I_batch(
+            a_in=np.full(len(corners), 4.0),
+            a_in_time=4,
+            max_time=200,
+            weight=np.full(len(corners), 9.0),
+            **{
+                name: corners[:, dimension]
+                for dimension, name in enumerate(CONTINUOUS_PARAMETER_NAMES)
+            },
+        ).reshape(len(boxes), -1)
+        self.assertTrue(is_expected[~boxes.is_boundary].all())
+        self.assertTrue(is_expected[boxes.is_boundary].any(axis=1).all())
+        self.assertFalse(is_expected[boxes.is_boundary].all(axis=1).any())
+
+    @typechecked
+    def test_nr_of_evaluated_points(self) -> None:
+        """Verifies the grid without refinements simulates each point of the
+        uniform grid once, and the refined grid simulates fewer points than
+        the uniform grid of the finest resolution."""
+        for max_depth in [0, 1]:
+            _, nr_of_simulated_neurons = get_feasible_boxes(
+                a_in_time=4,
+                a_in_range=[4],
+                bounds=self.bounds,
+                max_depth=max_depth,
+                max_time=200,
+                nr_of_coarse_steps=4,
+                weight_range=[9],
+            )
+            nr_of_fine_grid_points: int = (4 * 2**max_depth + 1) ** 4
+            if max_depth == 0:
+                self.assertEqual(
+                    nr_of_simulated_neurons, nr_of_fine_grid_points
+                )
+            else:
+                self.assertLess(
+                    nr_of_simulated_neurons, nr_of_fine_grid_points
+                )
+
+    @typechecked
+    def test_boxes_cover_fine_grid_regions(self) -> None:
+        """Verifies each cell of the uniform grid of the finest resolution
+        that has a corner of type I lies within a reported box, also where
+        the coarse cells have no corners of type I."""
+        boxes = get_feasible_boxes(
+            a_in_time=4,
+            a_in_range=[4],
+            bounds=self.bounds,
+            max_depth=1,
+            max_time=200,
+            nr_of_coarse_steps=4,
+            weight_range=[9],
+        )[0][0]
+        fine_cells: np.ndarray = np.array(
+            list(itertools.product(range(8), repeat=4)), dtype=np.int64
+        )
+        is_feasible, is_boundary = classify_cells(
+            a_in=4,
+            a_in_time=4,
+            bounds=self.bounds,
+            cell_size=1,
+            cells=fine_cells,
+            chunk_size=100000,
+            lattice_cache=Lattice_cache(nr_of_lattice_steps=8),
+            max_time=200,
+            weight=9,
+        )
+        lower: np.ndarray = get_lattice_values(
+            bounds=self.bounds,
+            lattice_points=fine_cells,
+            nr_of_lattice_steps=8,
+        )
+        upper: np.ndarray = get_lattice_values(
+            bounds=self.bounds,
+            lattice_points=fine_cells + 1,
+            nr_of_lattice_steps=8,
+        )
+        # Whether each fine cell lies within each box.
+        is_within: np.ndarray = (
+            (lower[:, np.newaxis, :] >= boxes.lower[np.newaxis, :, :] - 1e-9)
+            & (upper[:, np.newaxis, :] <= boxes.upper[np.newaxis, :, :] + 1e-9)
+        ).all(axis=2)
+        self.assertTrue(is_within[is_feasible | is_boundary].any(axis=1).all())
@@ -0,0 +1,280 @@
+"""Tests whether the batched Discovery simulation finds the same neurons as a
+timestep by timestep simulation of a single LIF neuron."""
+import importlib.util
+import itertools
+import json
+import tempfile
+import unittest
+from typing import Dict, List, Union
+
+import numpy as np
+from typeguard import typechecked
+
+from snnalgorithms.sparse.Discovery.batched_discovery import (
+    DISCOVERY_PARAMETER_NAMES,
+    get_candidate_parameters,
+    get_matching_candidates,
+    get_matching_candidates_sharded,
+    get_nr_of_candidates,
+    is_expected_neuron_I_batch,
+    sweep_matching_candidates,
+    write_sweep_checkpoint,
+)
+
+
+# pylint: disable=R0913
+@typechecked
+def is_expected_neuron_I_scalar(
+    *,
+    a_in: Union[float, int],
+    a_in_time: int,
+    bias: Union[float, int],
+    du: Union[float, int],
+    dv: Union[float, int],
+    max_time: int,
+    vth: Union[float, int],
+    weight: Union[float, int],
+) -> bool:
+    """Simulates a single neuron of Discovery_algo.is_expected_neuron_I with
+    Python floats."""
+    u: float = 0.0
+    v: float = 0.0
+    spikes: bool = False
+    for t in range(0, max_time):
+        if spikes != (t >= 2 + a_in_time):
+            return False
+        if abs(u) > 100 or abs(v) > 100:
+            return False
+        a_in_next: float = weight if spikes else 0
+        if 0 < a_in_time == t:
+            a_in_next += a_in
+        u = u * (1 - du) + a_in_next
+        new_voltage: float = v * (1 - dv) + u + bias
+        spikes = new_voltage > vth
+        v = 0.0 if spikes else new_voltage
+    return True
+
+
+class Test_batched_discovery(unittest.TestCase):
+    """Tests whether the batched Discovery simulation finds the same neurons
+    as a timestep by timestep simulation of a single LIF neuron."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.ranges: Dict[str, List[Union[float, int]]] = {
+            "du": [-1, -0.5, 0, 0.1, 1],
+            "dv": [-1, -0.1, 0, 0.5, 1],
+            "bias": [0, 2.5, 5],
+            "vth": [0, 2.5, 5],
+            "weight": [-5, -1, 0, 1, 5],
+            "a_in": [1, 5],
+        }
+
+    @typechecked
+    def test_batched_matches_scalar_simulation(self) -> None:
+        """Verifies the batched simulation finds the same candidates as the
+        scalar simulation, in the order of the nested loops."""
+        for a_in_time in [0, 2, 4]:
+            expected_indices: List[int] = [
+                flat_index
+                for flat_index, parameters in enumerate(
+                    itertools.product(
+                        *[
+                            self.ranges[name]
+                            for name in DISCOVERY_PARAMETER_NAMES
+                        ]
+                    )
+                )
+                if is_expected_neuron_I_scalar(
+                    a_in_time=a_in_time,
+                    max_time=100,
+                    **dict(zip(DISCOVERY_PARAMETER_NAMES, parameters)),
+                )
+            ]
+            self.assertEqual(
+                expected_indices,
+                get_matching_candidates(
+                    a_in_time=a_in_time,
+                    chunk_size=97,
+                    max_time=100,
+                    ranges=self.ranges,
+                ).tolist(),
+            )
+
+    @unittest.skipIf(
+        importlib.util.find_spec("snnbackends") is None,
+        "The networkx Discovery simulation requires snnbackends.",
+    )
+    @typechecked
+    def test_batched_matches_networkx_simulation(self) -> None:
+        """Verifies the batched simulation accepts the same candidates as
+        Discovery_algo.is_expected_neuron_I."""
+        # pylint: disable=C0415
+        from snnbackends.networkx.LIF_neuron import LIF_neuron
+
+        from snnalgorithms.sparse.Discovery.Discovery import Discovery_algo
+
+        # Only use the networkx simulation, not the search of __init__.
+        discovery_algo = Discovery_algo.__new__(Discovery_algo)
+        ranges: Dict[str, List[Union[float, int]]] = {
+            "du": [-0.5, 0, 0.1],
+            "dv": [-1.0, 0, 0.5],
+            "bias": [0, 2.5],
+            "vth": [0, 5.0],
+            "weight": [-1, 1],
+            "a_in": [5],
+        }
+        flat_indices: np.ndarray = np.arange(
+            get_nr_of_candidates(ranges=ranges)
+        )
+        for a_in_time in [0, 2, 14]:
+            is_expected: List[bool] = is_expected_neuron_I_batch(
+                a_in_time=a_in_time,
+                max_time=100,
+                **get_candidate_parameters(
+                    flat_indices=flat_indices, ranges=ranges
+                ),
+            ).tolist()
+            for flat_index, parameters in enumerate(
+                itertools.product(
+                    *[ranges[name] for name in DISCOVERY_PARAMETER_NAMES]
+                )
+            ):
+                candidate = dict(zip(DISCOVERY_PARAMETER_NAMES, parameters))
+                self.assertEqual(
+                    is_expected[flat_index],
+                    discovery_algo.is_expected_neuron_I(
+                        lif_neuron=LIF_neuron(
+                            name="",
+                            bias=float(candidate["bias"]),
+                            du=float(candidate["du"]),
+                            dv=float(candidate["dv"]),
+                            vth=float(candidate["vth"]),
+                        ),
+                        max_time=100,
+                        weight=candidate["weight"],
+                        a_in=float(candidate["a_in"]),
+                        a_in_time=a_in_time,
+                        detect_cycles=True,
+                        fast=True,
+                    )[0],
+                    candidate,
+                )
+
+    @typechecked
+    def test_sharded_matches_unsharded_search(self) -> None:
+        """Verifies the process pool finds the same candidates, in the same
+        order, as the search in a single process, and reports the progress
+        of all candidates."""
+        total: int = get_nr_of_candidates(ranges=self.ranges)
+        progress: List[int] = []
+        for a_in_time in [0, 2, 4]:
+            self.assertEqual(
+                get_matching_candidates_sharded(
+                    a_in_time=a_in_time,
+                    chunk_size=97,
+                    max_time=100,
+                    nr_of_processes=2,
+                    progress_callback=lambda done, _: progress.append(done),
+                    ranges=self.ranges,
+                    shard_size=300,
+                ).tolist(),
+                get_matching_candidates(
+                    a_in_time=a_in_time, max_time=100, ranges=self.ranges
+                ).tolist(),
+            )
+            self.assertEqual(progress[-1], total)
+
+    @typechecked
+    def test_specific_range_is_found(self) -> None:
+        """Verifies the neuron of the Specific_range is of type I."""
+        self.assertEqual(
+            [0],
+            get_matching_candidates(
+                a_in_time=14,
+                max_time=10000,
+                ranges={
+                    "du": [0.1],
+                    "dv": [-1.0],
+                    "bias": [0.0],
+                    "vth": [5.0],
+                    "weight": [1],
+                    "a_in": [5],
+                },
+            ).tolist(),
+        )
+
+    @typechecked
+    def test_cycle_detection_keeps_matches(self) -> None:
+        """Verifies accepting the candidates of which the state repeats
+        yields the same candidates as simulating all timesteps."""
+        for a_in_time in [0, 2, 4]:
+            self.assertEqual(
+                get_matching_candidates(
+                    a_in_time=a_in_time,
+                    max_cycle_length=0,
+                    max_time=1000,
+                    ranges=self.ranges,
+                ).tolist(),
+                get_matching_candidates(
+                    a_in_time=a_in_time,
+                    max_cycle_length=8,
+                    max_time=1000,
+                    ranges=self.ranges,
+                ).tolist(),
+            )
+
+    @typechecked
+    def test_interrupted_sweep_resumes(self) -> None:
+        """Verifies a sweep writes all matches, and that a sweep that is
+        interrupted after a checkpoint yields the same matches file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            matches_filepath: str = f"{temp_dir}/matches.jsonl"
+            sweep_kwargs = {
+                "a_in_time": 2,
+                "checkpoint_interval": 0.0,
+                "chunk_size": 97,
+                "matches_filepath": matches_filepath,
+                "max_time": 100,
+                "progress_callback": lambda done, total: None,
+                "ranges": self.ranges,
+            }
+            nr_of_matches: int = sweep_matching_candidates(**sweep_kwargs)
+            with open(matches_filepath, encoding="utf-8") as matches_file:
+                matches: str = matches_file.read()
+            self.assertEqual(
+                get_matching_candidates(
+                    a_in_time=2, max_time=100, ranges=self.ranges
+                ).tolist(),
+                [
+                    json.loads(line)["flat_index"]
+                    for line in matches.splitlines()
+                ],
+            )
+            self.assertEqual(nr_of_matches, len(matches.splitlines()))
+
+            # Simulate a sweep that was killed while it wrote a match, after
+            # its checkpoint at the third chunk.
+            checkpoint_lines = [
+                line
+                for line in matches.splitlines(keepends=True)
+                if json.loads(line)["flat_index"] < 3 * 97
+            ]
+            write_sweep_checkpoint(
+                checkpoint_filepath=f"{matches_filepath}.checkpoint.json",
+                matches_offset=len("".join(checkpoint_lines).encode("utf-8")),
+                next_index=3 * 97,
+                sweep_settings={
+                    "a_in_time": 2,
+                    "max_time": 100,
+                    "ranges": self.ranges,
+                },
+            )
+            with open(matches_filepath, "a", encoding="utf-8") as matches_file:
+                matches_file.write('{"flat_index": ')
+
+            sweep_matching_candidates(**sweep_kwargs)
+            with open(matches_filepath, encoding="utf-8") as matches_file:
+                self.assertEqual(matches, matches_file.read())
@@ -0,0 +1,80 @@
+"""Tests whether the fast mode of the networkx Discovery simulation yields the
+same neurons as the simulation that stores all timesteps."""
+import importlib.util
+import unittest
+from typing import List, Tuple
+
+from typeguard import typechecked
+
+
+@unittest.skipIf(
+    importlib.util.find_spec("snnbackends") is None,
+    "The networkx Discovery simulation requires snnbackends.",
+)
+class Test_discovery(unittest.TestCase):
+    """Tests whether the fast mode of the networkx Discovery simulation
+    yields the same neurons as the simulation that stores all timesteps."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.max_time: int = 1000
+
+    @typechecked
+    def test_fast_mode_matches_normal_mode(self) -> None:
+        """Verifies the fast mode accepts the neuron of the Specific_range,
+        rejects it with a negative recurrent weight, and stores the same
+        neuron states as the normal mode, in its last timesteps."""
+        # pylint: disable=C0415
+        from snnbackends.networkx.LIF_neuron import LIF_neuron
+
+        from snnalgorithms.sparse.Discovery.Discovery import (
+            Discovery_algo,
+            Specific_range,
+        )
+
+        disco = Specific_range()
+        # Only use the networkx simulation, not the search of __init__.
+        discovery_algo = Discovery_algo.__new__(Discovery_algo)
+        for weight, expected in [(disco.weight_range[0], True), (-1, False)]:
+            results = {
+                fast: discovery_algo.is_expected_neuron_I(
+                    lif_neuron=LIF_neuron(
+                        name="",
+                        bias=float(disco.bias_range[0]),
+                        du=float(disco.du_range[0]),
+                        dv=float(disco.dv_range[0]),
+                        vth=float(disco.vth_range[0]),
+                    ),
+                    max_time=self.max_time,
+                    weight=weight,
+                    a_in=float(disco.a_in_range[0]),
+                    a_in_time=disco.a_in_time,
+                    detect_cycles=True,
+                    fast=fast,
+                )
+                for fast in [False, True]
+            }
+            self.assertEqual(results[False][0], expected)
+            self.assertEqual(results[True][0], expected)
+
+            normal_neurons = results[False][1].nodes["0"]["nx_lif"]
+            fast_states: List[Tuple[int, float, float, bool]] = [
+                (t, neuron.u.get(), neuron.v.get(), neuron.spikes)
+                for t, neuron in results[True][1].nodes["0"]["nx_lif_history"]
+            ]
+            self.assertEqual(
+                fast_states,
+                [
+                    (
+                        t,
+                        normal_neurons[t].u.get(),
+                        normal_neurons[t].v.get(),
+                        normal_neurons[t].spikes,
+                    )
+                    for t, _, _, _ in fast_states
+                ],
+            )
+            # The fast mode stores the states up to the last timestep.
+            self.assertEqual(fast_states[-1][0], len(normal_neurons) - 2)
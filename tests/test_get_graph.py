@@ -0,0 +1,379 @@
+"""Tests whether the random test graphs are generated as expected."""
+import math
+import os
+import random
+import tempfile
+import time
+import unittest
+from itertools import combinations, groupby
+from typing import List, Set, Tuple
+
+import networkx as nx
+import numpy as np
+from typeguard import typechecked
+
+from snnalgorithms import get_graph
+from snnalgorithms.get_graph import (
+    add_random_connected_edges,
+    get_list_with_rand_bools,
+    get_list_with_rand_floats_in_range,
+    get_list_with_rand_ints_in_range,
+    get_skip_sampled_edges,
+    gnp_random_connected_graph,
+    gnp_random_connected_snn,
+    submit_plot,
+    wait_for_plots,
+)
+from snnalgorithms.Random_snn import Random_snn
+
+
+# pylint: disable=R0902
+# pylint: disable=R0903
+class Test_scope:
+    """Contains the random graph settings of a test scope."""
+
+    @typechecked
+    def __init__(self, *, export: bool = False, seed: int) -> None:
+        self.export: bool = export
+        self.show: bool = False
+        self.seed: int = seed
+        self.min_edge_weight: int = -4
+        self.max_edge_weight: int = 5
+        self.min_bias: int = -3
+        self.max_bias: int = 3
+        self.min_vth: int = 0
+        self.max_vth: int = 4
+
+
+@typechecked
+def get_nr_of_random_connected_edges(
+    *, density: float, seed: int, size: int, skip_sampling: bool
+) -> int:
+    """Returns the number of unique edges that are added by
+    add_random_connected_edges."""
+    edges: Set[Tuple[int, int]] = set()
+    add_random_connected_edges(
+        add_edge=lambda u, v: edges.add((u, v)),
+        density=density,
+        rng=random.Random(seed),  # nosec - using a random seed.
+        size=size,
+        skip_sampling=skip_sampling,
+    )
+    return len(edges)
+
+
+@typechecked
+def get_global_random_connected_edges(
+    *, density: float, seed: int, size: int
+) -> List[Tuple[int, int]]:
+    """Returns the edges of a random connected graph, in networkx DiGraph
+    order, as they were generated with the global random seed."""
+    random.seed(seed)
+    G = nx.DiGraph()
+    G.add_nodes_from(range(size))
+    edges = combinations(range(size), 2)
+    for _, node_edges in groupby(edges, key=lambda x: x[0]):
+        listed_node_edges = list(node_edges)
+        G.add_edge(*random.choice(listed_node_edges))  # nosec
+        for e in listed_node_edges:
+            if random.random() < density:  # nosec
+                G.add_edge(*e)
+    return list(G.edges)
+
+
+class Test_get_graph(unittest.TestCase):
+    """Tests whether the random test graphs are generated as expected."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.seeds = range(1000)
+        self.size: int = 40
+
+    @typechecked
+    def test_skip_sampling_edge_count_distribution(self) -> None:
+        """Verifies the mean and variance of the number of edges of the skip
+        sampled graphs, and of the numpy skip sampled edges of the array
+        path, match those of the default sampling, and the expected values.
+
+        Each node u<size-1 gets an edge to a random node with a higher
+        index, and each of its other size-2-u node pairs gets an edge with
+        probability density.
+        """
+        for density in [0.05, 0.3, 0.8]:
+            nr_of_pairs: int = (self.size - 1) * (self.size - 2) // 2
+            expected_mean: float = self.size - 1 + density * nr_of_pairs
+            expected_variance: float = density * (1 - density) * nr_of_pairs
+            # Allow 4 standard errors of the mean.
+            tolerance: float = 4 * (expected_variance / len(self.seeds)) ** 0.5
+            for nrs_of_edges in [
+                [
+                    get_nr_of_random_connected_edges(
+                        density=density,
+                        seed=seed,
+                        size=self.size,
+                        skip_sampling=skip_sampling,
+                    )
+                    for seed in self.seeds
+                ]
+                for skip_sampling in [False, True]
+            ] + [
+                [
+                    len(
+                        np.unique(
+                            get_skip_sampled_edges(
+                                density=density,
+                                rng=np.random.default_rng(seed),
+                                size=self.size,
+                            ),
+                            axis=0,
+                        )
+                    )
+                    for seed in self.seeds
+                ]
+            ]:
+                mean: float = sum(nrs_of_edges) / len(nrs_of_edges)
+                variance: float = sum(
+                    (nr_of_edges - mean) ** 2 for nr_of_edges in nrs_of_edges
+                ) / (len(nrs_of_edges) - 1)
+                self.assertAlmostEqual(mean, expected_mean, delta=tolerance)
+                self.assertAlmostEqual(
+                    variance, expected_variance, delta=0.2 * expected_variance
+                )
+                self.assertGreaterEqual(min(nrs_of_edges), self.size - 1)
+
+    @typechecked
+    def test_fixed_seeds_reproduce_global_random_graphs(self) -> None:
+        """Verifies the local random number generators yield the same edges
+        and properties as the global random seeds that were used before."""
+        length: int = 25
+        for seed in self.seeds[:20]:
+            G = nx.DiGraph()
+            G.add_nodes_from(range(self.size))
+            add_random_connected_edges(
+                add_edge=G.add_edge,
+                density=0.2,
+                rng=random.Random(seed),  # nosec - using a random seed.
+                size=self.size,
+                skip_sampling=False,
+            )
+            self.assertEqual(
+                list(G.edges),
+                get_global_random_connected_edges(
+                    density=0.2, seed=seed, size=self.size
+                ),
+            )
+
+            random.seed(seed)
+            self.assertEqual(
+                get_list_with_rand_ints_in_range(
+                    min_val=-5, max_val=7, length=length, seed=seed
+                ),
+                random.choices(range(-5, 7), k=length),  # nosec
+            )
+
+            np.random.seed(seed)
+            self.assertEqual(
+                get_list_with_rand_floats_in_range(
+                    min_val=0, max_val=3, length=length, seed=seed
+                ).tolist(),
+                np.random.uniform(low=0, high=3, size=length).tolist(),
+            )
+
+            random.seed(seed)
+            rand_bools: List[bool] = [False] * (
+                length - math.ceil(0.3 * length)
+            ) + [True] * math.ceil(0.3 * length)
+            random.shuffle(rand_bools)  # nosec
+            self.assertEqual(
+                get_list_with_rand_bools(
+                    length=length, recurrent_edge_density=0.3, seed=seed
+                ),
+                rand_bools,
+            )
+
+    @typechecked
+    def test_snn_is_connected_with_properties_in_range(self) -> None:
+        """Verifies the array-backed random snn is connected, has a
+        recurrent synapse for the recurrent density, integer weights and
+        neuron properties in the ranges of the test scope, and is
+        reproduced by its seed."""
+        size: int = 12
+        for seed in self.seeds[:10]:
+            test_scope = Test_scope(seed=seed)
+            for density in [0.01, 0.2, 0.7, 1]:
+                for recurrent_density in [0, 0.5, 1]:
+                    random_snn: Random_snn = gnp_random_connected_snn(
+                        density=density,
+                        recurrent_density=recurrent_density,
+                        size=size,
+                        test_scope=test_scope,
+                    )
+                    is_recurrent = (
+                        random_snn.edges[:, 0] == random_snn.edges[:, 1]
+                    )
+                    self.assertEqual(
+                        len(np.unique(random_snn.edges, axis=0)),
+                        len(random_snn.edges),
+                    )
+                    self.assertEqual(
+                        int(is_recurrent.sum()),
+                        math.ceil(recurrent_density * size),
+                    )
+                    if density < 1:
+                        self.assertTrue(
+                            np.all(
+                                random_snn.edges[~is_recurrent, 0]
+                                < random_snn.edges[~is_recurrent, 1]
+                            )
+                        )
+                    else:
+                        self.assertEqual(
+                            int((~is_recurrent).sum()), size * (size - 1)
+                        )
+                    self.assertTrue(
+                        nx.is_connected(
+                            random_snn.to_networkx().to_undirected()
+                        )
+                    )
+                    self.assertTrue(
+                        np.array_equal(
+                            random_snn.weights, np.round(random_snn.weights)
+                        )
+                    )
+                    for values, (min_val, max_val) in [
+                        (random_snn.weights, (-4, 4)),
+                        (random_snn.bias, (-3, 3)),
+                        (random_snn.du, (0, 1)),
+                        (random_snn.dv, (0, 1)),
+                        (random_snn.vth, (0, 4)),
+                    ]:
+                        self.assertGreaterEqual(values.min(), min_val)
+                        self.assertLessEqual(values.max(), max_val)
+
+                    same_snn: Random_snn = gnp_random_connected_snn(
+                        density=density,
+                        recurrent_density=recurrent_density,
+                        size=size,
+                        test_scope=test_scope,
+                    )
+                    for name in [
+                        "bias",
+                        "du",
+                        "dv",
+                        "edges",
+                        "vth",
+                        "weights",
+                    ]:
+                        self.assertTrue(
+                            np.array_equal(
+                                getattr(random_snn, name),
+                                getattr(same_snn, name),
+                            )
+                        )
+
+    @typechecked
+    def test_snn_recurrent_synapses_without_density(self) -> None:
+        """Verifies an snn without (non-recurrent) synapses only gets the
+        recurrent synapses of the recurrent density."""
+        size: int = 12
+        for seed in self.seeds[:10]:
+            random_snn: Random_snn = gnp_random_connected_snn(
+                density=0,
+                recurrent_density=0.5,
+                size=size,
+                test_scope=Test_scope(seed=seed),
+            )
+            self.assertEqual(len(random_snn.edges), math.ceil(0.5 * size))
+            self.assertTrue(
+                np.array_equal(random_snn.edges[:, 0], random_snn.edges[:, 1])
+            )
+            self.assertEqual(len(random_snn.weights), len(random_snn.edges))
+
+    @typechecked
+    def test_large_snn_is_generated_in_time_of_its_edges(self) -> None:
+        """Verifies a sparse snn of 10^5 neurons, with about 6*10^5
+        synapses, is generated within 2 seconds, while its 5*10^9 node pairs
+        could not be visited in that time."""
+        size: int = 10**5
+        start: float = time.perf_counter()
+        random_snn: Random_snn = gnp_random_connected_snn(
+            density=1e-4,
+            recurrent_density=0.5,
+            size=size,
+            test_scope=Test_scope(seed=42),
+        )
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(random_snn.nr_of_neurons, size)
+        nr_of_pairs: int = size * (size - 1) // 2
+        # Allow 4 standard deviations of the random edges.
+        self.assertAlmostEqual(
+            len(random_snn.edges),
+            size - 1 + 1e-4 * nr_of_pairs + size // 2,
+            delta=4 * (1e-4 * nr_of_pairs) ** 0.5 + size * 1e-4,
+        )
+
+    @typechecked
+    def test_plots_are_exported_in_background(self) -> None:
+        """Verifies the plots of the graphs are exported to file, from a
+        snapshot of the graph, while at most MAX_PENDING_PLOTS plots are
+        pending."""
+        cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                for seed in self.seeds[:20]:
+                    G = gnp_random_connected_graph(
+                        density=0.3,
+                        recurrent_density=0.5,
+                        seed=seed,
+                        size=5,
+                        test_scope=Test_scope(export=True, seed=0),
+                    )
+                    # Changing the graph does not change the plotted graph.
+                    G.add_node("not_plotted")
+                    self.assertLessEqual(
+                        len(get_graph.plot_futures),
+                        get_graph.MAX_PENDING_PLOTS,
+                    )
+                wait_for_plots()
+                self.assertEqual(get_graph.plot_futures, [])
+                self.assertEqual(
+                    sorted(os.listdir("Images/graphs")),
+                    sorted(
+                        f"graph_{seed}_size5_p0.3_p_recur0.5.png"
+                        for seed in self.seeds[:20]
+                    ),
+                )
+            finally:
+                os.chdir(cwd)
+
+    @typechecked
+    def test_failed_plot_raises_error(self) -> None:
+        """Verifies the error of a failed plot is raised by wait_for_plots, or
+        by the next submitted plot."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # A file can not be used as directory of the plot.
+            not_a_dir: str = f"{tmp_dir}/not_a_dir"
+            with open(not_a_dir, "w", encoding="utf-8"):
+                pass
+            submit_plot(
+                filepath=f"{not_a_dir}/graph.png",
+                G=nx.path_graph(3, create_using=nx.DiGraph),
+            )
+            with self.assertRaises(OSError):
+                wait_for_plots()
+
+            submit_plot(
+                filepath=f"{not_a_dir}/graph.png",
+                G=nx.path_graph(3, create_using=nx.DiGraph),
+            )
+            get_graph.plot_futures[0].exception()
+            with self.assertRaises(OSError):
+                submit_plot(
+                    filepath=f"{tmp_dir}/graph.png",
+                    G=nx.path_graph(3, create_using=nx.DiGraph),
+                )
+            wait_for_plots()
+            self.assertTrue(os.path.isfile(f"{tmp_dir}/graph.png"))
@@ -0,0 +1,136 @@
+"""Tests whether input graphs are stored and loaded losslessly in the binary
+input graph format, and migrated from their json files."""
+import json
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.input_graph_binary import (
+    get_binary_filepath,
+    load_input_graph,
+    read_input_graph_arrays,
+    write_input_graph_binary,
+)
+
+
+class Test_input_graph_binary(unittest.TestCase):
+    """Tests whether input graphs are stored and loaded losslessly in the
+    binary input graph format."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.input_graph = nx.Graph()
+        self.input_graph.add_nodes_from(range(5))
+        self.input_graph.add_edges_from([(0, 1), (1, 2), (2, 3), (3, 4)])
+        self.input_graph.graph["alg_props"] = {
+            "rand_ceil": 4,
+            "rand_nrs": [3, 0, 4, 1, 2],
+            "rand_edge_weights": [-23, -20, -24, -21, -22],
+        }
+        self.input_graph.graph["seed"] = 7
+
+    @typechecked
+    def assert_equal_graphs(
+        self, *, expected: nx.Graph, actual: nx.Graph
+    ) -> None:
+        """Asserts the nodes, edges and graph attributes are equal."""
+        self.assertEqual(list(expected.nodes), list(actual.nodes))
+        self.assertEqual(list(expected.edges), list(actual.edges))
+        self.assertEqual(expected.graph, actual.graph)
+
+    @typechecked
+    def test_binary_round_trip(self) -> None:
+        """Verifies a (compressed) binary file yields the same graph."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for compress in [False, True]:
+                filepath: str = f"{temp_dir}/graph_{compress}.snng"
+                write_input_graph_binary(
+                    compress=compress,
+                    filepath=filepath,
+                    input_graph=self.input_graph,
+                )
+                with read_input_graph_arrays(filepath=filepath) as arrays:
+                    self.assert_equal_graphs(
+                        expected=self.input_graph,
+                        actual=arrays.to_networkx(),
+                    )
+
+    @typechecked
+    def test_json_file_is_migrated(self) -> None:
+        """Verifies a json input graph is loaded, and migrated to a binary
+        file that is used on the next load."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_filepath: str = f"{temp_dir}/graph.json"
+            with open(json_filepath, "w", encoding="utf-8") as json_file:
+                json.dump(nx.node_link_data(self.input_graph), json_file)
+
+            self.assert_equal_graphs(
+                expected=self.input_graph,
+                actual=load_input_graph(json_filepath=json_filepath),
+            )
+            binary_filepath: str = get_binary_filepath(
+                json_filepath=json_filepath
+            )
+            self.assertTrue(os.path.isfile(binary_filepath))
+
+            os.remove(json_filepath)
+            self.assert_equal_graphs(
+                expected=self.input_graph,
+                actual=load_input_graph(json_filepath=json_filepath),
+            )
+
+    @typechecked
+    def test_node_and_edge_order_is_kept(self) -> None:
+        """Verifies the nodes and edges of a graph that is not created in
+        sorted order, are loaded in their original order."""
+        input_graph = nx.Graph()
+        input_graph.add_nodes_from([3, 1, 4, 0, 2])
+        input_graph.add_edges_from([(4, 2), (1, 0), (3, 4), (0, 2), (1, 3)])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath: str = f"{temp_dir}/graph.snng"
+            write_input_graph_binary(
+                filepath=filepath, input_graph=input_graph
+            )
+            with read_input_graph_arrays(filepath=filepath) as arrays:
+                self.assert_equal_graphs(
+                    expected=input_graph, actual=arrays.to_networkx()
+                )
+
+    @typechecked
+    def test_large_edge_weights_are_stored(self) -> None:
+        """Verifies rand_edge_weights beyond the int32 range are stored
+        losslessly."""
+        input_graph = self.input_graph.copy()
+        input_graph.graph["alg_props"] = {
+            **self.input_graph.graph["alg_props"],
+            "rand_edge_weights": [-(50000**2), -(2**40), 0, 1, 2],
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath: str = f"{temp_dir}/graph.snng"
+            write_input_graph_binary(
+                filepath=filepath, input_graph=input_graph
+            )
+            with read_input_graph_arrays(filepath=filepath) as arrays:
+                self.assert_equal_graphs(
+                    expected=input_graph, actual=arrays.to_networkx()
+                )
+
+    @typechecked
+    def test_memory_map_is_closed(self) -> None:
+        """Verifies the memory map of the file is closed at the end of the
+        with statement."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath: str = f"{temp_dir}/graph.snng"
+            write_input_graph_binary(
+                filepath=filepath, input_graph=self.input_graph
+            )
+            with read_input_graph_arrays(filepath=filepath) as arrays:
+                buffer = arrays.buffer
+                self.assertFalse(buffer.closed)
+            self.assertTrue(buffer.closed)
+            self.assertIsNone(arrays.rand_nrs)
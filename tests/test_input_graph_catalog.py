@@ -0,0 +1,109 @@
+"""Tests whether the stored input graphs are found with the input graph
+catalog, also if the catalog is written by multiple processes, or if a
+stored input graph is deleted."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms import input_graph_catalog
+from snnalgorithms.input_graph_catalog import (
+    catalog_has_graph_size_and_nr,
+    get_catalogued_filepath,
+    get_input_graph_catalog,
+    register_input_graph,
+)
+
+
+@typechecked
+def register_dummy_input_graph(graph_nr: int) -> None:
+    """Registers a dummy input graph, in a (new) process."""
+    register_input_graph(
+        filepath=f"graph_{graph_nr}.json",
+        graph_nr=graph_nr,
+        graph_size=3,
+        isomorphic_hash=f"hash_{graph_nr}",
+    )
+
+
+class Test_input_graph_catalog(unittest.TestCase):
+    """Tests whether the stored input graphs are found with the input graph
+    catalog."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.cwd: str = os.getcwd()
+        self.tmp_dir: str = ""
+
+    def setUp(self) -> None:
+        """Runs each test in an empty directory, with an unloaded catalog."""
+        self.tmp_dir = tempfile.mkdtemp()
+        os.chdir(self.tmp_dir)
+        input_graph_catalog.input_graph_catalog = None
+
+    def tearDown(self) -> None:
+        """Restores the working directory and unloads the catalog."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp_dir)
+        input_graph_catalog.input_graph_catalog = None
+
+    @typechecked
+    def test_deleted_input_graph_is_not_found(self) -> None:
+        """Verifies a catalogued input graph of which the file is deleted, is
+        not returned, such that it is generated again."""
+        with open("graph_0.json", "w", encoding="utf-8") as json_file:
+            json.dump(nx.node_link_data(nx.path_graph(3)), json_file)
+        register_dummy_input_graph(0)
+        self.assertEqual(
+            get_catalogued_filepath(isomorphic_hash="hash_0"), "graph_0.json"
+        )
+        self.assertTrue(
+            catalog_has_graph_size_and_nr(graph_size=3, graph_nr=0)
+        )
+
+        os.remove("graph_0.json")
+        self.assertIsNone(get_catalogued_filepath(isomorphic_hash="hash_0"))
+        self.assertFalse(
+            catalog_has_graph_size_and_nr(graph_size=3, graph_nr=0)
+        )
+
+    @typechecked
+    def test_catalog_is_reloaded_from_file(self) -> None:
+        """Verifies the registered entries are loaded by a new process."""
+        register_dummy_input_graph(0)
+        register_dummy_input_graph(1)
+        expected_catalog = dict(get_input_graph_catalog())
+
+        input_graph_catalog.input_graph_catalog = None
+        self.assertEqual(get_input_graph_catalog(), expected_catalog)
+
+    @typechecked
+    def test_concurrent_processes_keep_all_entries(self) -> None:
+        """Verifies the entries that are registered by concurrent processes,
+        which each have their own catalog in memory, are all stored."""
+        graph_nrs: List[int] = list(range(8))
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(register_dummy_input_graph, graph_nrs))
+
+        self.assertEqual(
+            sorted(get_input_graph_catalog().keys()),
+            sorted(f"hash_{graph_nr}" for graph_nr in graph_nrs),
+        )
+        self.assertEqual(
+            [
+                filename
+                for filename in os.listdir(
+                    input_graph_catalog.INPUT_GRAPH_CATALOG_DIR
+                )
+                if not filename.endswith(".json")
+            ],
+            [],
+        )
@@ -0,0 +1,81 @@
+"""Tests whether the isomorphic hashes of the most recently hashed graphs are
+cached, up to the cache size."""
+import unittest
+from typing import List
+
+import networkx as nx
+from snncompare.import_results.helper import get_isomorphic_graph_hash
+from typeguard import typechecked
+
+from snnalgorithms import get_input_graphs
+from snnalgorithms.get_input_graphs import get_cached_isomorphic_graph_hash
+
+
+class Test_isomorphic_hash_cache(unittest.TestCase):
+    """Tests whether the isomorphic hashes of the most recently hashed graphs
+    are cached, up to the cache size."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.cache_size: int = get_input_graphs.ISOMORPHIC_HASH_CACHE_SIZE
+        self.input_graphs: List[nx.Graph] = [
+            nx.path_graph(4),
+            nx.star_graph(3),
+            nx.cycle_graph(4),
+            nx.path_graph(5),
+        ]
+
+    def setUp(self) -> None:
+        """Starts each test with an empty cache of size 2."""
+        get_input_graphs.isomorphic_hash_cache.clear()
+        get_input_graphs.ISOMORPHIC_HASH_CACHE_SIZE = 2
+
+    def tearDown(self) -> None:
+        """Restores the cache size, and empties the cache."""
+        get_input_graphs.isomorphic_hash_cache.clear()
+        get_input_graphs.ISOMORPHIC_HASH_CACHE_SIZE = self.cache_size
+
+    @typechecked
+    def test_cached_hash_equals_hash(self) -> None:
+        """Verifies the cached hash equals the isomorphic graph hash, also
+        if the edges are stored in reversed order."""
+        for input_graph in self.input_graphs:
+            reversed_graph = nx.Graph()
+            reversed_graph.add_edges_from(
+                (v, u) for u, v in reversed(list(input_graph.edges))
+            )
+            for some_graph in [input_graph, reversed_graph]:
+                self.assertEqual(
+                    get_cached_isomorphic_graph_hash(input_graph=some_graph),
+                    get_isomorphic_graph_hash(some_graph=input_graph),
+                )
+        self.assertEqual(len(get_input_graphs.isomorphic_hash_cache), 2)
+
+    @typechecked
+    def test_least_recently_used_hash_is_removed(self) -> None:
+        """Verifies the least recently used hash is removed once the cache
+        is full."""
+        for input_graph in self.input_graphs[:2]:
+            get_cached_isomorphic_graph_hash(input_graph=input_graph)
+        # Use the first graph again, such that the second graph is the least
+        # recently used one.
+        get_cached_isomorphic_graph_hash(input_graph=self.input_graphs[0])
+        get_cached_isomorphic_graph_hash(input_graph=self.input_graphs[2])
+
+        self.assertEqual(
+            list(get_input_graphs.isomorphic_hash_cache.keys()),
+            [
+                (
+                    len(input_graph),
+                    frozenset(
+                        (min(u, v), max(u, v)) for u, v in input_graph.edges
+                    ),
+                )
+                for input_graph in [
+                    self.input_graphs[0],
+                    self.input_graphs[2],
+                ]
+            ],
+        )
@@ -0,0 +1,139 @@
+"""Tests whether the unique input graphs are the same if the candidate seeds
+are evaluated serially or by a pool of processes."""
+import unittest
+from itertools import islice
+from typing import Dict, List, Tuple
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.get_input_graphs import (
+    generate_mdsa_input_graphs,
+    get_cached_isomorphic_graph_hash,
+    get_rand_planar_triangle_free_graph,
+    iter_mdsa_input_graphs,
+)
+
+
+class Test_rand_planar_triangle_free_graph(unittest.TestCase):
+    """Tests whether the unique input graphs are the same if the candidate
+    seeds are evaluated serially or by a pool of processes."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.seed: int = 42
+
+    @typechecked
+    def test_process_pool_matches_serial_graphs(self) -> None:
+        """Verifies the process pool returns the same graphs, with the same
+        hashes and in the same order, as the serial evaluation."""
+        for generator, size, max_nr_of_graphs in [
+            ("exact", 6, 3),
+            ("incremental", 12, 10),
+        ]:
+            serial_graphs: Dict[
+                str, nx.Graph
+            ] = get_rand_planar_triangle_free_graph(
+                density_cutoff=0.01,
+                max_nr_of_graphs=max_nr_of_graphs,
+                seed=self.seed,
+                size=size,
+                generator=generator,
+            )
+            self.assertEqual(len(serial_graphs), max_nr_of_graphs)
+            for nr_of_processes in [2, 3]:
+                parallel_graphs: Dict[
+                    str, nx.Graph
+                ] = get_rand_planar_triangle_free_graph(
+                    density_cutoff=0.01,
+                    max_nr_of_graphs=max_nr_of_graphs,
+                    seed=self.seed,
+                    size=size,
+                    nr_of_processes=nr_of_processes,
+                    generator=generator,
+                )
+                self.assertEqual(
+                    list(parallel_graphs.keys()), list(serial_graphs.keys())
+                )
+                for isomorphic_hash, input_graph in serial_graphs.items():
+                    self.assertEqual(
+                        list(parallel_graphs[isomorphic_hash].edges),
+                        list(input_graph.edges),
+                    )
+
+    @typechecked
+    def test_generated_graphs_of_last_seed(self) -> None:
+        """Verifies generate_mdsa_input_graphs returns the unique graphs of
+        the last evaluated seed, including one graph more than
+        max_nr_of_graphs, such that existing graph numbers are kept."""
+        input_graphs: Dict[str, nx.Graph] = generate_mdsa_input_graphs(
+            graph_size=6, max_nr_of_graphs=3, seeds=[self.seed]
+        )
+        found_graphs: Dict[
+            str, nx.Graph
+        ] = get_rand_planar_triangle_free_graph(
+            density_cutoff=0.01,
+            max_nr_of_graphs=4,
+            seed=self.seed,
+            size=6,
+        )
+        self.assertEqual(list(input_graphs.keys()), list(found_graphs.keys()))
+
+    @typechecked
+    def test_lazy_graphs_are_found_in_order(self) -> None:
+        """Verifies iter_mdsa_input_graphs yields unique graphs with their
+        hashes, in the order in which the hashes are first found by
+        get_rand_planar_triangle_free_graph."""
+        for graph_size, max_nr_of_graphs in [(6, 3), (7, 5)]:
+            for seeds in [[self.seed], [self.seed, self.seed + 1]]:
+                lazy_input_graphs: List[Tuple[str, nx.Graph]] = list(
+                    iter_mdsa_input_graphs(
+                        graph_size=graph_size,
+                        max_nr_of_graphs=max_nr_of_graphs,
+                        seeds=seeds,
+                    )
+                )
+                self.assertEqual(
+                    [
+                        isomorphic_hash
+                        for isomorphic_hash, _ in lazy_input_graphs
+                    ],
+                    list(
+                        get_rand_planar_triangle_free_graph(
+                            density_cutoff=0.01,
+                            max_nr_of_graphs=max_nr_of_graphs,
+                            seed=self.seed,
+                            size=graph_size,
+                        ).keys()
+                    ),
+                )
+                for isomorphic_hash, input_graph in lazy_input_graphs:
+                    self.assertEqual(
+                        get_cached_isomorphic_graph_hash(
+                            input_graph=input_graph
+                        ),
+                        isomorphic_hash,
+                    )
+
+    @typechecked
+    def test_lazy_graphs_are_yielded_when_found(self) -> None:
+        """Verifies the first graphs are yielded before the other candidates
+        are evaluated, which would take (almost) forever here."""
+        self.assertEqual(
+            len(
+                list(
+                    islice(
+                        iter_mdsa_input_graphs(
+                            graph_size=7,
+                            max_nr_of_graphs=10**6,
+                            seeds=[self.seed],
+                            max_iterations=10**9,
+                        ),
+                        2,
+                    )
+                )
+            ),
+            2,
+        )
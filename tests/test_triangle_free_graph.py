@@ -0,0 +1,141 @@
+"""Tests whether the generated input graphs are connected, planar and
+triangle free."""
+import random
+import unittest
+from itertools import combinations
+
+import networkx as nx
+from typeguard import typechecked
+
+from snnalgorithms.get_input_graphs import (
+    get_valid_candidate_graph,
+    incremental_triangle_free_graph,
+    quadrangulation_subgraph,
+    triangle_free_graph,
+)
+
+
+@typechecked
+def get_greedy_triangle_free_graph(*, seed: int, size: int) -> nx.Graph:
+    """Returns the triangle free graph that is found by testing the
+    planarity of each (triangle free) edge separately."""
+    g = nx.Graph()
+    g.add_nodes_from(range(size))
+    edge_candidates = list(combinations(range(size), 2))
+    random.Random(seed).shuffle(edge_candidates)  # nosec - using a seed.
+    for u, v in edge_candidates:
+        if set(g.neighbors(u)).isdisjoint(g.neighbors(v)):
+            g.add_edge(u, v)
+            if not nx.is_planar(g):
+                g.remove_edge(u, v)
+    return g
+
+
+class Test_triangle_free_graph(unittest.TestCase):
+    """Tests whether the generated input graphs are connected, planar and
+    triangle free."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.seeds = range(5)
+        self.sizes = [1, 2, 3, 4, 5, 10, 30, 80]
+
+    @typechecked
+    def assert_is_valid_input_graph(
+        self, *, input_graph: nx.Graph, size: int
+    ) -> None:
+        """Asserts a graph is connected, planar and triangle free."""
+        self.assertEqual(list(input_graph.nodes), list(range(size)))
+        if size > 0:
+            self.assertTrue(nx.is_connected(input_graph))
+        self.assertTrue(nx.is_planar(input_graph))
+        self.assertEqual(sum(nx.triangles(input_graph).values()), 0)
+
+    @typechecked
+    def test_exact_graph_equals_greedy_graph(self) -> None:
+        """Verifies the batched planarity tests yield the same graph as
+        testing each edge separately."""
+        for seed in self.seeds:
+            for size in [4, 10, 20]:
+                self.assertEqual(
+                    set(triangle_free_graph(seed=seed, size=size).edges),
+                    set(
+                        get_greedy_triangle_free_graph(
+                            seed=seed, size=size
+                        ).edges
+                    ),
+                )
+
+    @typechecked
+    def test_incremental_graph_is_valid(self) -> None:
+        """Verifies the incremental graphs are connected, planar, triangle
+        free and reproducible per seed."""
+        for seed in self.seeds:
+            for size in self.sizes:
+                input_graph: nx.Graph = incremental_triangle_free_graph(
+                    seed=seed, size=size
+                )
+                self.assert_is_valid_input_graph(
+                    input_graph=input_graph, size=size
+                )
+                self.assertEqual(
+                    list(input_graph.edges),
+                    list(
+                        incremental_triangle_free_graph(
+                            seed=seed, size=size
+                        ).edges
+                    ),
+                )
+                # A tree has size-1 edges, a planar triangle free graph at
+                # most 2*size-4.
+                self.assertGreaterEqual(
+                    input_graph.number_of_edges(), size - 1
+                )
+                self.assertLessEqual(
+                    input_graph.number_of_edges(), max(size - 1, 2 * size - 4)
+                )
+
+    @typechecked
+    def test_quadrangulation_subgraph_is_valid(self) -> None:
+        """Verifies the quadrangulation subgraphs are connected, planar,
+        triangle free, reproducible per seed, and have the number of edges
+        of the density, limited to a tree and a quadrangulation."""
+        for seed in self.seeds:
+            for size in self.sizes:
+                for density in [0.0, 0.05, 0.5, 1.0]:
+                    input_graph: nx.Graph = quadrangulation_subgraph(
+                        density=density, seed=seed, size=size
+                    )
+                    self.assert_is_valid_input_graph(
+                        input_graph=input_graph, size=size
+                    )
+                    self.assertEqual(
+                        list(input_graph.edges),
+                        list(
+                            quadrangulation_subgraph(
+                                density=density, seed=seed, size=size
+                            ).edges
+                        ),
+                    )
+                    self.assertEqual(
+                        input_graph.number_of_edges(),
+                        min(
+                            max(
+                                round(density * size * (size - 1) / 2),
+                                size - 1,
+                            ),
+                            max(size - 1, 2 * size - 4),
+                        ),
+                    )
+
+    @typechecked
+    def test_unknown_generator_raises_error(self) -> None:
+        """Verifies an error is raised for an unsupported generator."""
+        for generator in ["incremental", "quadrangulation"]:
+            self.assertIsNotNone(
+                get_valid_candidate_graph(0, 0.01, 10, generator=generator)
+            )
+        with self.assertRaises(NotImplementedError):
+            get_valid_candidate_graph(0, 0.01, 10, generator="unknown")